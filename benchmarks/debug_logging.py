@@ -0,0 +1,90 @@
+"""Benchmark the CPU cost of debug logging in a refresh of a 50 device fleet.
+
+A synthetic fleet of devices returning the recorded GetDevice test fixture is
+refreshed by the coordinator, and every control of every device is read once
+through an OptimisticStateManager, like the entities do after a refresh.
+
+The refresh runs with debug logging disabled and enabled, the latter with a
+handler rendering the messages and discarding them. Debug messages built with
+f-strings used to be rendered in both cases; the difference is the CPU time
+that lazy logging saves per refresh while debug logging is off.
+
+Usage: python benchmarks/debug_logging.py [runs] [devices]
+"""
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from custom_components.ixfield.coordinator import IxfieldCoordinator  # noqa: E402
+from custom_components.ixfield.optimistic_state import (  # noqa: E402
+    OptimisticStateManager,
+)
+from tests.custom_components.ixfield.test_data import SAMPLE_DEVICE_DATA  # noqa: E402
+
+
+class RenderingHandler(logging.Handler):
+    """Handler rendering the message of every record without output."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        record.getMessage()
+
+
+class FleetApi:
+    """API returning the recorded GetDevice response for every device."""
+
+    request_stats = {}
+
+    async def async_get_device(self, device_id, live_only=False):
+        return SAMPLE_DEVICE_DATA
+
+
+async def measure(device_count: int, runs: int, level: int) -> float:
+    """Measure the median CPU time of a refresh at the given log level, in seconds."""
+    logging.getLogger("custom_components.ixfield").setLevel(level)
+    device_dict = {
+        f"device_{index}": {"name": f"Pool {index}", "type": "POOL"}
+        for index in range(device_count)
+    }
+    coordinator = IxfieldCoordinator(Mock(), FleetApi(), device_dict)
+    managers = {
+        device_id: OptimisticStateManager(device_id, "Switch")
+        for device_id in device_dict
+    }
+
+    timings = []
+    for _ in range(runs):
+        start = time.process_time()
+        coordinator.data = await coordinator._async_update_data()
+        for device_id, manager in managers.items():
+            index = coordinator.get_device_index(device_id)
+            for control_name in index.controls:
+                manager.get_current_value(index.get_control_value(control_name))
+        timings.append(time.process_time() - start)
+    return statistics.median(timings)
+
+
+async def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    device_count = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    # No output, so only building the messages is measured
+    logger = logging.getLogger("custom_components.ixfield")
+    logger.addHandler(RenderingHandler())
+    logger.propagate = False
+
+    disabled = await measure(device_count, runs, logging.INFO) * 1000
+    enabled = await measure(device_count, runs, logging.DEBUG) * 1000
+    print(f"Refresh of {device_count} devices, debug logging off: {disabled:8.2f} ms")
+    print(f"Refresh of {device_count} devices, debug logging on:  {enabled:8.2f} ms")
+    print(f"Saved per refresh while debug logging is off:   {enabled - disabled:8.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
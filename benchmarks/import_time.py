@@ -0,0 +1,64 @@
+"""Benchmark the cold import time of the IXField integration.
+
+Each measurement runs in a fresh interpreter. The "eager auth" variant also
+imports boto3 and pycognito, which is what importing the integration used to
+cost before the auth stack was loaded lazily.
+
+Usage: python benchmarks/import_time.py [runs]
+"""
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+INTEGRATION_IMPORT = (
+    "import custom_components.ixfield, custom_components.ixfield.config_flow"
+)
+AUTH_IMPORT = "import boto3, pycognito.aws_srp"
+
+TIMER = """
+import sys, time
+start = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - start
+assert ("boto3" in sys.modules) == {expect_auth}, "unexpected auth stack state"
+print(elapsed)
+"""
+
+
+def measure(imports: str, expect_auth: bool, runs: int) -> list:
+    """Measure the import time of the given statements in fresh interpreters."""
+    code = TIMER.format(imports=imports, expect_auth=expect_auth)
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        timings.append(float(result.stdout.strip()))
+    return timings
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    # Warm the bytecode cache so that both variants compare fairly
+    measure(f"{INTEGRATION_IMPORT}\n{AUTH_IMPORT}", True, 1)
+
+    lazy = measure(INTEGRATION_IMPORT, False, runs)
+    eager = measure(f"{INTEGRATION_IMPORT}\n{AUTH_IMPORT}", True, runs)
+
+    lazy_ms = statistics.median(lazy) * 1000
+    eager_ms = statistics.median(eager) * 1000
+    print(f"Integration import (lazy auth):  {lazy_ms:8.1f} ms")
+    print(f"Integration import (eager auth): {eager_ms:8.1f} ms")
+    print(f"Saving:                          {eager_ms - lazy_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
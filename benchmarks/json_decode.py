@@ -0,0 +1,83 @@
+"""Benchmark decoding GetDevice responses with the available JSON decoders.
+
+The payloads are the recorded GetDevice response of the tests, and a batched
+GetDevices response built from it with one aliased device per batch member.
+For each decoder the median decode time and the peak memory allocated while
+decoding are reported.
+
+Usage: python benchmarks/json_decode.py [runs] [batch size]
+"""
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from custom_components.ixfield.response_decoder import (  # noqa: E402
+    JSON_DECODER_ORJSON,
+    JSON_DECODER_STDLIB,
+    get_json_decoder,
+)
+from tests.custom_components.ixfield.test_data import SAMPLE_DEVICE_DATA  # noqa: E402
+
+
+def build_payloads(batch_size: int) -> dict:
+    """Build the encoded responses to decode, by name."""
+    device = SAMPLE_DEVICE_DATA["data"]["device"]
+    batch = {"data": {f"device{index}": device for index in range(batch_size)}}
+    return {
+        "GetDevice": json.dumps(SAMPLE_DEVICE_DATA).encode(),
+        f"GetDevices ({batch_size} devices)": json.dumps(batch).encode(),
+    }
+
+
+def measure_time(decoder, body: bytes, runs: int) -> float:
+    """Measure the median time of decoding the body, in seconds."""
+    # Repeat small payloads so the timer resolution does not matter
+    repeat = max(1, 1_000_000 // len(body))
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            decoder(body)
+        timings.append((time.perf_counter() - start) / repeat)
+    return statistics.median(timings)
+
+
+def measure_peak_memory(decoder, body: bytes) -> int:
+    """Measure the peak memory allocated while decoding the body, in bytes."""
+    tracemalloc.start()
+    try:
+        result = decoder(body)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    decoders = {}
+    for name in (JSON_DECODER_STDLIB, JSON_DECODER_ORJSON):
+        try:
+            decoders[name] = get_json_decoder(name)
+        except ValueError as err:
+            print(f"Skipping {name}: {err}")
+
+    for payload_name, body in build_payloads(batch_size).items():
+        print(f"{payload_name}, {len(body) / 1024:.1f} KiB:")
+        for name, decoder in decoders.items():
+            elapsed_us = measure_time(decoder, body, runs) * 1_000_000
+            peak_kib = measure_peak_memory(decoder, body) / 1024
+            print(f"  {name:8} {elapsed_us:10.1f} us {peak_kib:10.1f} KiB peak")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,34 @@
 """The IXField Cloud integration."""
 import logging
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import Store
 
 from .const import (
+    CONF_CIRCUIT_BREAKER_THRESHOLD,
     CONF_DEVICE_DICT,
+    CONF_DEVICE_BATCH_SIZE,
     CONF_EXTRACT_DEVICE_INFO_SENSORS,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_CIRCUIT_BREAKER_THRESHOLD,
+    DEFAULT_DEVICE_BATCH_SIZE,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
     DOMAIN,
     IXFIELD_DEVICE_URL,
+    SNAPSHOT_STORAGE_KEY,
+    STORAGE_VERSION,
+    TOKEN_STORAGE_KEY,
 )
 from .coordinator import IxfieldCoordinator
+from .routing import (
+    async_register_device_coordinator,
+    async_unregister_device_coordinator,
+)
 from .services import async_setup_services, async_unload_services
+from .session import async_close_session, async_get_session
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,35 +52,76 @@ async def async_setup(hass: HomeAssistant, config) -> bool:
     return True
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up ixfield from a config entry."""
-    import aiohttp
+def _get_store(hass: HomeAssistant, entry: ConfigEntry, key: str) -> Store:
+    """Get a store of a config entry, key being one of the *_STORAGE_KEY."""
+    return Store(hass, STORAGE_VERSION, key.format(entry_id=entry.entry_id))
+
 
+async def async_create_api(hass: HomeAssistant, entry: ConfigEntry):
+    """Create an API client for a config entry.
+
+    Tokens are persisted so that restarts reuse a still valid access token or
+    renew it with the refresh token instead of doing a full SRP login. The
+    client authenticates on its first request.
+    """
     from .api import IxfieldApi
+    from .circuit_breaker import CircuitBreaker
+
+    store = _get_store(hass, entry, TOKEN_STORAGE_KEY)
+    tokens = await store.async_load()
+
+    return IxfieldApi(
+        entry.data["email"],
+        entry.data["password"],
+        async_get_session(hass),
+        tokens=tokens,
+        token_update_callback=store.async_save,
+        circuit_breaker=CircuitBreaker(
+            entry.data.get(
+                CONF_CIRCUIT_BREAKER_THRESHOLD, DEFAULT_CIRCUIT_BREAKER_THRESHOLD
+            ),
+            hass=hass,
+        ),
+    )
 
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up ixfield from a config entry."""
     try:
-        email = entry.data["email"]
-        password = entry.data["password"]
         device_dict = entry.data[CONF_DEVICE_DICT]
         extract_device_info_sensors = entry.data.get(
             CONF_EXTRACT_DEVICE_INFO_SENSORS, True
         )
+        max_concurrent_requests = entry.data.get(
+            CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+        )
+        device_batch_size = entry.data.get(
+            CONF_DEVICE_BATCH_SIZE, DEFAULT_DEVICE_BATCH_SIZE
+        )
 
-        session = aiohttp.ClientSession()
-        api = IxfieldApi(email, password, session)
-        await api.async_login()
+        api = await async_create_api(hass, entry)
 
         coordinator = IxfieldCoordinator(
             hass,
             api,
             device_dict,
             extract_device_info_sensors=extract_device_info_sensors,
+            max_concurrent_requests=max_concurrent_requests,
+            device_batch_size=device_batch_size,
+            snapshot_store=_get_store(hass, entry, SNAPSHOT_STORAGE_KEY),
         )
-        await coordinator.async_config_entry_first_refresh()
+        if await coordinator.async_restore_snapshot():
+            # Start from the stored data and refresh it without delaying startup
+            entry.async_create_background_task(
+                hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+            )
+        else:
+            await coordinator.async_config_entry_first_refresh()
 
         if DOMAIN not in hass.data:
             hass.data[DOMAIN] = {}
         hass.data[DOMAIN][entry.entry_id] = {"coordinator": coordinator}
+        async_register_device_coordinator(hass, coordinator)
 
         # Register devices in device registry
         await _register_devices(hass, coordinator, device_dict, entry)
@@ -77,6 +134,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
 
         return True
+    except ConfigEntryNotReady:
+        raise
     except Exception as ex:
         _LOGGER.error(f"Failed to set up IXField integration: {ex}")
         return False
@@ -153,14 +212,28 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     if unload_ok and DOMAIN in hass.data:
-        # Clean up coordinator and session
+        # Clean up coordinator
         if entry.entry_id in hass.data[DOMAIN]:
-            coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-            if hasattr(coordinator.api, "_session"):
-                await coordinator.api._session.close()
+            async_unregister_device_coordinator(
+                hass, hass.data[DOMAIN][entry.entry_id]["coordinator"]
+            )
             del hass.data[DOMAIN][entry.entry_id]
 
-        if not hass.data[DOMAIN]:
+        # The HTTP session is shared by all entries. hass.data[DOMAIN] also
+        # holds service caches, so count the entries still using the session.
+        if not any(
+            other.entry_id != entry.entry_id
+            and other.state
+            in (ConfigEntryState.LOADED, ConfigEntryState.SETUP_IN_PROGRESS)
+            for other in hass.config_entries.async_entries(DOMAIN)
+        ):
             del hass.data[DOMAIN]
+            await async_close_session(hass)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove stored data of a config entry."""
+    for key in (TOKEN_STORAGE_KEY, SNAPSHOT_STORAGE_KEY):
+        await _get_store(hass, entry, key).async_remove()
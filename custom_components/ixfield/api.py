@@ -1,9 +1,33 @@
 import aiohttp
 import asyncio
-import boto3
 import logging
-from typing import Any, Dict, Optional
-from pycognito.aws_srp import AWSSRP
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .command_queue import CommandQueue
+from .const import (
+    API_TIMEOUT,
+    DEFAULT_DEVICE_BATCH_SIZE,
+    MAX_RESPONSE_SIZE,
+    MAX_RETRIES,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+    TOKEN_REFRESH_MARGIN,
+)
+from .request_scheduler import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    RequestScheduler,
+    get_request_scheduler,
+)
+from .response_decoder import (
+    JsonDecoder,
+    ResponseTooLargeError,
+    async_read_body,
+    get_json_decoder,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -13,24 +37,269 @@ GRAPHQL_URL = "https://to2gjdst4h.execute-api.eu-central-1.amazonaws.com/prod/"
 USER_POOL_ID = "eu-central-1_jCOzBXuR0"
 AWS_REGION = "eu-central-1"
 
+# Building blocks of the GetDevice query, shared by the single and batched queries
+DEVICE_QUERY_VARIABLE_DEFINITIONS = "$lang: String!, $withFullCustomerData: Boolean!, $withRestrictedCustomerData: Boolean!, $withGrafanaLink: Boolean!, $directAccessView: Boolean! = false"
+DEVICE_QUERY_FIELDS = "id name type controller operatingMode inOperationSince controlsEnabled connectionStatus connectionStatusChangedTime grafanaLink @include(if: $withGrafanaLink) needPropagateDeviceData isConfigurationJobInProgress dataPropagationFailed isControlsOverrideEnabled controlOverrideStart thingType { name businessName thingTypeFamily { name __typename } __typename } address { id address @include(if: $withFullCustomerData) code @include(if: $withRestrictedCustomerData) city @include(if: $withRestrictedCustomerData) lat @include(if: $withFullCustomerData) lng @include(if: $withFullCustomerData) approximateLat @include(if: $withRestrictedCustomerData) approximateLng @include(if: $withRestrictedCustomerData) placeId @include(if: $withFullCustomerData) postalCode @include(if: $withFullCustomerData) __typename } contactInfo @include(if: $withFullCustomerData) { name phone email note __typename } company { id name usesNewEligibilitySystem __typename } newProduct { id __typename } liveDeviceData { runningServiceSequence { name requiredEligibility __typename } operatingValues(lang: $lang) { ...ControlFields validFor __typename } controls(lang: $lang) { ...ControlFields forbiddenByUser forbiddenByTechnology __typename } serviceSequences(lang: $lang) { ...ControlFields forbiddenByUser forbiddenByTechnology __typename } tabs(lang: $lang) { label type items { ... on Tab { label type items { ... on TabItem { name label type value unit options formattedValue canSetInTab __typename } __typename } __typename } ... on TabItem { name label type value unit options formattedValue canSetInTab __typename } __typename } __typename } __typename } eventDetectionPoints { eventCodes { severity description(lang: $lang) __typename } __typename } userAccess @include(if: $directAccessView) { id customDeviceName type __typename } eligibilities __typename"
+CONTROL_FIELDS_FRAGMENT = "fragment ControlFields on Control { type name label icon value desiredValue options showDesired settable buttonText buttonIcon setEligibility statusLabel statusIcon __typename }"
+GET_DEVICE_QUERY = f"query GetDevice($id: ID!, {DEVICE_QUERY_VARIABLE_DEFINITIONS}) {{ device(deviceId: $id) {{ {DEVICE_QUERY_FIELDS} }} __typename }} {CONTROL_FIELDS_FRAGMENT}"
+DEVICE_QUERY_VARIABLES = {
+    "directAccessView": True,
+    "lang": "en",
+    "withFullCustomerData": True,
+    "withRestrictedCustomerData": True,
+    "withGrafanaLink": True,
+}
+
+# Building blocks of the slim GetDeviceLiveData query used for polling. It only
+# selects what changes while a device runs, without the static metadata such as
+# address, contact, company, thing type and tabs
+DEVICE_LIVE_QUERY_VARIABLE_DEFINITIONS = "$lang: String!"
+DEVICE_LIVE_QUERY_FIELDS = "id operatingMode controlsEnabled connectionStatus connectionStatusChangedTime needPropagateDeviceData isConfigurationJobInProgress dataPropagationFailed isControlsOverrideEnabled controlOverrideStart liveDeviceData { runningServiceSequence { name requiredEligibility __typename } operatingValues(lang: $lang) { ...ControlFields validFor __typename } controls(lang: $lang) { ...ControlFields forbiddenByUser forbiddenByTechnology __typename } serviceSequences(lang: $lang) { ...ControlFields forbiddenByUser forbiddenByTechnology __typename } __typename } eventDetectionPoints { eventCodes { severity description(lang: $lang) __typename } __typename } eligibilities __typename"
+GET_DEVICE_LIVE_DATA_QUERY = f"query GetDeviceLiveData($id: ID!, {DEVICE_LIVE_QUERY_VARIABLE_DEFINITIONS}) {{ device(deviceId: $id) {{ {DEVICE_LIVE_QUERY_FIELDS} }} __typename }} {CONTROL_FIELDS_FRAGMENT}"
+DEVICE_LIVE_QUERY_VARIABLES = {"lang": "en"}
+
+
+def build_get_devices_query(device_count: int, live_only: bool = False) -> str:
+    """Build a GetDevices query with one aliased device selection per device.
+
+    Device N is selected as alias ``deviceN`` using the variable ``$idN``. With
+    live_only, the devices are selected like by GetDeviceLiveData.
+    """
+    if live_only:
+        operation_name = "GetDevicesLiveData"
+        variable_definitions = DEVICE_LIVE_QUERY_VARIABLE_DEFINITIONS
+        fields = DEVICE_LIVE_QUERY_FIELDS
+    else:
+        operation_name = "GetDevices"
+        variable_definitions = DEVICE_QUERY_VARIABLE_DEFINITIONS
+        fields = DEVICE_QUERY_FIELDS
+    id_definitions = ", ".join(f"$id{index}: ID!" for index in range(device_count))
+    selections = " ".join(
+        f"device{index}: device(deviceId: $id{index}) {{ {fields} }}"
+        for index in range(device_count)
+    )
+    return (
+        f"query {operation_name}({id_definitions}, {variable_definitions}) "
+        f"{{ {selections} __typename }} {CONTROL_FIELDS_FRAGMENT}"
+    )
+
+
+def split_get_devices_response(
+    device_ids: List[str], response_data: Optional[Dict[str, Any]]
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Split a batched GetDevices response into per-device GetDevice responses."""
+    data = (response_data or {}).get("data") or {}
+    errors = (response_data or {}).get("errors") or []
+
+    results: Dict[str, Optional[Dict[str, Any]]] = {}
+    for index, device_id in enumerate(device_ids):
+        alias = f"device{index}"
+        device = data.get(alias)
+        if not device:
+            device_errors = [
+                error.get("message")
+                for error in errors
+                if (error.get("path") or [None])[0] == alias
+            ]
+            _LOGGER.error(
+                f"No data for device {device_id} in batched response: {device_errors}"
+            )
+            results[device_id] = None
+            continue
+        results[device_id] = {"data": {"device": device}}
+    return results
+
+
+def build_set_controls_mutation(control_count: int) -> str:
+    """Build a SetControls mutation with one aliased deviceControl per control.
+
+    Control N is set as alias ``controlN`` using the variable ``$dataN``.
+    """
+    data_definitions = ", ".join(
+        f"$data{index}: ControlDeviceInput!" for index in range(control_count)
+    )
+    selections = " ".join(
+        f"control{index}: deviceControl(input: $data{index}) {{ success __typename }}"
+        for index in range(control_count)
+    )
+    return f"mutation SetControls({data_definitions}) {{ {selections} }}"
+
+
+# Reasons for retrying a request, also used as keys of the retry metrics
+RETRY_REASON_THROTTLED = "throttled"
+RETRY_REASON_SERVER_ERROR = "server_error"
+RETRY_REASON_NETWORK_ERROR = "network_error"
+
+
+def get_status_retry_reason(status: int, idempotent: bool) -> Optional[str]:
+    """Get the reason to retry a request that failed with an HTTP status.
+
+    A throttled (429) request was not processed and is always retried. Server
+    errors are only retried for idempotent requests, as a mutation may have
+    been applied before the error. Other client errors are never retried.
+    """
+    if status == 429:
+        return RETRY_REASON_THROTTLED
+    if status >= 500 and idempotent:
+        return RETRY_REASON_SERVER_ERROR
+    return None
+
+
+def get_error_retry_reason(error: Exception, idempotent: bool) -> Optional[str]:
+    """Get the reason to retry a request that raised an exception.
+
+    Failing to connect means the request never reached the server, so it is
+    retried for mutations too. Other errors, e.g. timeouts, are only retried
+    for idempotent requests.
+    """
+    if isinstance(error, aiohttp.ClientConnectorError):
+        return RETRY_REASON_NETWORK_ERROR
+    if idempotent and isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError)):
+        return RETRY_REASON_NETWORK_ERROR
+    return None
+
+
+def get_retry_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Get the delay before a retry, using exponential backoff with jitter.
+
+    Args:
+        attempt: Number of the retry, starting at 1
+        retry_after: Delay requested by the server, used instead of the backoff
+    """
+    if retry_after is not None:
+        return min(max(retry_after, 0.0), RETRY_BACKOFF_MAX)
+    delay = min(RETRY_BACKOFF_BASE * 2 ** (attempt - 1), RETRY_BACKOFF_MAX)
+    # Spread retries of concurrent requests over the second half of the delay
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds."""
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _create_cognito_client():
+    """Create a Cognito identity provider client.
+
+    boto3 is imported here instead of at module level because loading it and
+    the botocore data model is slow. This must only be called in the executor.
+    """
+    import boto3
+
+    return boto3.client("cognito-idp", region_name=AWS_REGION)
+
 
 class IxfieldApi:
     def __init__(
-        self, email: str, password: str, session: aiohttp.ClientSession
+        self,
+        email: str,
+        password: str,
+        session: aiohttp.ClientSession,
+        tokens: Optional[Dict[str, Any]] = None,
+        token_update_callback: Optional[
+            Callable[[Dict[str, Any]], Awaitable[None]]
+        ] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        json_decoder: Optional[JsonDecoder] = None,
+        max_response_size: int = MAX_RESPONSE_SIZE,
     ) -> None:
         self._email = email
         self._password = password
         self._session = session
+        self._timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
         self._token: Optional[str] = None
+        self._refresh_token: Optional[str] = None
+        self._token_expires_at: Optional[float] = None
+        self._token_update_callback = token_update_callback
+        self._auth_lock = asyncio.Lock()
+        # Shared by all clients unless given, to rate limit the whole process
+        self._scheduler = scheduler or get_request_scheduler()
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        # Responses are read once as bytes, up to max_response_size bytes
+        self._json_decoder = json_decoder or get_json_decoder()
+        self._max_response_size = max_response_size
+        # Device fetches in flight, shared by concurrent callers
+        self._device_fetches: Dict[Tuple[str, bool], asyncio.Future] = {}
+        self._command_queue = CommandQueue(
+            self._async_send_control, self._async_send_controls
+        )
+        self._request_stats: Dict[str, int] = {
+            "requests": 0,
+            "retries": 0,
+            "failures": 0,
+            "coalesced": 0,
+            RETRY_REASON_THROTTLED: 0,
+            RETRY_REASON_SERVER_ERROR: 0,
+            RETRY_REASON_NETWORK_ERROR: 0,
+        }
+        if tokens:
+            self.set_tokens(tokens)
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Get the circuit breaker guarding the requests."""
+        return self._circuit_breaker
+
+    @property
+    def request_stats(self) -> Dict[str, int]:
+        """Get request, retry (total and per reason), failure, coalesced and command counts."""
+        return {**self._request_stats, **self._command_queue.stats}
+
+    @property
+    def tokens(self) -> Dict[str, Any]:
+        """Get the current tokens, e.g. to persist them."""
+        return {
+            "email": self._email,
+            "access_token": self._token,
+            "refresh_token": self._refresh_token,
+            "expires_at": self._token_expires_at,
+        }
+
+    def set_tokens(self, tokens: Dict[str, Any]) -> None:
+        """Restore previously persisted tokens."""
+        if tokens.get("email") != self._email:
+            _LOGGER.debug("Ignoring stored tokens of a different user")
+            return
+        self._token = tokens.get("access_token")
+        self._refresh_token = tokens.get("refresh_token")
+        self._token_expires_at = tokens.get("expires_at")
+
+    def is_token_valid(self) -> bool:
+        """Check if the access token is usable and not about to expire."""
+        if not self._token:
+            return False
+        if self._token_expires_at is None:
+            return True
+        return time.time() < self._token_expires_at - TOKEN_REFRESH_MARGIN
+
+    async def _async_store_auth_result(self, auth_result: Dict[str, Any]) -> None:
+        """Store tokens from a Cognito AuthenticationResult."""
+        self._token = auth_result.get("AccessToken")
+        # The refresh token flow does not return a new refresh token
+        self._refresh_token = auth_result.get("RefreshToken", self._refresh_token)
+        expires_in = auth_result.get("ExpiresIn")
+        self._token_expires_at = time.time() + expires_in if expires_in else None
+
+        if self._token_update_callback:
+            try:
+                await self._token_update_callback(self.tokens)
+            except Exception as e:
+                _LOGGER.warning(f"Failed to persist tokens: {e}")
 
     async def async_login(self) -> None:
         """Authenticate using pycognito.aws_srp.AWSSRP for proper SRP handling"""
         loop = asyncio.get_event_loop()
 
-        def do_auth() -> str:
+        def do_auth() -> Dict[str, Any]:
             try:
+                from pycognito.aws_srp import AWSSRP
+
                 _LOGGER.info(f"Attempting SRP authentication for user: {self._email}")
-                client = boto3.client("cognito-idp", region_name=AWS_REGION)
+                client = _create_cognito_client()
                 aws = AWSSRP(
                     username=self._email,
                     password=self._password,
@@ -40,57 +309,332 @@ class IxfieldApi:
                 )
                 tokens = aws.authenticate_user()
                 _LOGGER.info("SRP authentication successful")
-                return tokens["AuthenticationResult"]["AccessToken"]
+                return tokens["AuthenticationResult"]
             except Exception as e:
                 _LOGGER.error(f"SRP authentication error: {e}")
                 raise e
 
-        self._token = await loop.run_in_executor(None, do_auth)
-        if not self._token:
+        auth_result = await loop.run_in_executor(None, do_auth)
+        if not auth_result or not auth_result.get("AccessToken"):
             _LOGGER.error("No access token in SRP authentication response")
             raise Exception("No access token in SRP authentication response")
+        await self._async_store_auth_result(auth_result)
+
+    async def async_refresh_token(self) -> bool:
+        """Renew the access token using the refresh token flow.
+
+        Returns:
+            bool: True if a new access token was obtained
+        """
+        if not self._refresh_token:
+            return False
+
+        loop = asyncio.get_event_loop()
+        refresh_token = self._refresh_token
+
+        def do_refresh() -> Dict[str, Any]:
+            client = _create_cognito_client()
+            response = client.initiate_auth(
+                ClientId=COGNITO_CLIENT_ID,
+                AuthFlow="REFRESH_TOKEN_AUTH",
+                AuthParameters={"REFRESH_TOKEN": refresh_token},
+            )
+            return response["AuthenticationResult"]
+
+        try:
+            auth_result = await loop.run_in_executor(None, do_refresh)
+        except Exception as e:
+            _LOGGER.warning(f"Token refresh failed, falling back to login: {e}")
+            return False
+        if not auth_result or not auth_result.get("AccessToken"):
+            return False
+
+        _LOGGER.debug("Access token refreshed")
+        await self._async_store_auth_result(auth_result)
+        return True
+
+    async def async_ensure_token(self) -> None:
+        """Make sure a valid access token is available.
+
+        Renews the token through the refresh token flow shortly before it
+        expires and only falls back to a full SRP login if that fails.
+        """
+        async with self._auth_lock:
+            if self.is_token_valid():
+                return
+            # Requests waiting for the lock fail fast once authentication failed
+            self._circuit_breaker.check_open()
+            if await self.async_refresh_token():
+                return
+            await self.async_login()
+
+    async def _async_reauthenticate(self, rejected_token: Optional[str]) -> None:
+        """Get a new access token after the API rejected the given one."""
+        async with self._auth_lock:
+            if self._token != rejected_token:
+                # Another request already renewed the token
+                return
+            self._circuit_breaker.check_open()
+            if await self.async_refresh_token():
+                return
+            await self.async_login()
+
+    async def _async_authenticate(
+        self, authenticate: Callable[..., Awaitable[None]], *args: Any
+    ) -> None:
+        """Authenticate for a request, failed authentication counts as a failed request."""
+        try:
+            await authenticate(*args)
+        except CircuitOpenError:
+            raise
+        except Exception:
+            self._request_stats["failures"] += 1
+            self._circuit_breaker.record_failure()
+            raise
 
-    async def async_get_device(self, device_id: str) -> Optional[Dict[str, Any]]:
+    def _get_headers(self) -> Dict[str, str]:
+        """Get the GraphQL request headers."""
         headers = {
             "Content-Type": "application/json",
         }
         if self._token:
             headers["Authorization"] = f"Bearer {self._token}"
+        return headers
+
+    async def _async_graphql_request(
+        self,
+        payload: Dict[str, Any],
+        description: str,
+        idempotent: bool = True,
+        priority: int = PRIORITY_POLL,
+    ) -> Optional[Dict[str, Any]]:
+        """Send a GraphQL request and return the response data.
+
+        An expired or revoked access token (HTTP 401) triggers one
+        re-authentication and retry. Throttling, server and network errors are
+        retried up to MAX_RETRIES times with exponential backoff, see
+        get_status_retry_reason and get_error_retry_reason. Every attempt is
+        rate limited by the request scheduler. While the cloud keeps failing,
+        the circuit breaker fails requests at once with CircuitOpenError.
+
+        Args:
+            payload: GraphQL request body
+            description: What is requested, for logging
+            idempotent: False for mutations, which are retried more carefully
+            priority: Scheduling priority, PRIORITY_COMMAND for user commands
+
+        Returns:
+            The decoded response, or None if the request failed
+        """
+        is_probe = self._circuit_breaker.before_request()
+        try:
+            return await self._async_send_graphql_request(
+                payload, description, idempotent, priority
+            )
+        finally:
+            if is_probe:
+                self._circuit_breaker.release_probe()
+
+    async def _async_send_graphql_request(
+        self,
+        payload: Dict[str, Any],
+        description: str,
+        idempotent: bool,
+        priority: int,
+    ) -> Optional[Dict[str, Any]]:
+        """Send a GraphQL request with retries, see _async_graphql_request."""
+        await self._async_authenticate(self.async_ensure_token)
+        self._request_stats["requests"] += 1
+
+        reauthenticated = False
+        attempt = 0
+        while True:
+            token = self._token
+            retry_reason = None
+            retry_after = None
+            await self._scheduler.async_acquire(priority)
+            try:
+                async with self._session.post(
+                    GRAPHQL_URL,
+                    json=payload,
+                    headers=self._get_headers(),
+                    timeout=self._timeout,
+                ) as resp:
+                    _LOGGER.debug(
+                        "API response status for %s: %s", description, resp.status
+                    )
+                    if resp.status == 200:
+                        # The request only succeeded once its body was read and decoded
+                        try:
+                            body = await async_read_body(
+                                resp, self._max_response_size
+                            )
+                            response_data = self._json_decoder(body)
+                        except (ResponseTooLargeError, ValueError) as e:
+                            _LOGGER.error(f"Invalid response for {description}: {e}")
+                            self._request_stats["failures"] += 1
+                            self._circuit_breaker.record_failure()
+                            return None
+                        self._circuit_breaker.record_success()
+                        _LOGGER.debug(
+                            "API response data for %s (%d bytes): %s",
+                            description,
+                            len(body),
+                            response_data,
+                        )
+                        return response_data
+
+                    if resp.status == 401 and not reauthenticated:
+                        _LOGGER.info(
+                            f"Access token rejected for {description}, re-authenticating"
+                        )
+                    else:
+                        retry_reason = get_status_retry_reason(resp.status, idempotent)
+                        if retry_reason is None or attempt >= MAX_RETRIES:
+                            _LOGGER.error(
+                                f"Failed to fetch {description}: {resp.status}"
+                            )
+                            try:
+                                response_text = (
+                                    await async_read_body(
+                                        resp, self._max_response_size
+                                    )
+                                ).decode(errors="replace")
+                            except ResponseTooLargeError as e:
+                                response_text = str(e)
+                            _LOGGER.error(f"Response body: {response_text}")
+                            self._request_stats["failures"] += 1
+                            if resp.status == 429 or resp.status >= 500:
+                                self._circuit_breaker.record_failure()
+                            else:
+                                self._circuit_breaker.record_success()
+                            return None
+                        retry_after = _parse_retry_after(
+                            resp.headers.get("Retry-After")
+                        )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                retry_reason = get_error_retry_reason(e, idempotent)
+                if retry_reason is None or attempt >= MAX_RETRIES:
+                    self._request_stats["failures"] += 1
+                    self._circuit_breaker.record_failure()
+                    raise
+
+            if retry_reason is None:
+                reauthenticated = True
+                await self._async_authenticate(self._async_reauthenticate, token)
+                continue
+
+            attempt += 1
+            self._request_stats["retries"] += 1
+            self._request_stats[retry_reason] += 1
+            delay = get_retry_delay(attempt, retry_after)
+            _LOGGER.warning(
+                f"Retrying request for {description} in {delay:.1f}s "
+                f"({retry_reason}, retry {attempt}/{MAX_RETRIES})"
+            )
+            await asyncio.sleep(delay)
+
+    async def async_get_device(
+        self, device_id: str, live_only: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Get a device using the GetDevice query.
+
+        With live_only, the slim GetDeviceLiveData query is used instead, its
+        response only has the fields changing while the device runs.
+        Concurrent calls for the same device share a single request.
+        """
+        key = (device_id, live_only)
+        fetch = self._device_fetches.get(key)
+        if fetch is not None:
+            _LOGGER.debug("Joining request in flight for device %s", device_id)
+            self._request_stats["coalesced"] += 1
+        else:
+            fetch = asyncio.ensure_future(self._async_fetch_device(device_id, live_only))
+            self._device_fetches[key] = fetch
+            fetch.add_done_callback(lambda _: self._device_fetches.pop(key, None))
+        # A cancelled caller must not cancel the request of the others
+        return await asyncio.shield(fetch)
+
+    async def _async_fetch_device(
+        self, device_id: str, live_only: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Send the GetDevice or GetDeviceLiveData query for a device."""
+        if live_only:
+            payload = {
+                "operationName": "GetDeviceLiveData",
+                "variables": {"id": device_id, **DEVICE_LIVE_QUERY_VARIABLES},
+                "query": GET_DEVICE_LIVE_DATA_QUERY,
+            }
+        else:
+            payload = {
+                "operationName": "GetDevice",
+                "variables": {"id": device_id, **DEVICE_QUERY_VARIABLES},
+                "query": GET_DEVICE_QUERY,
+            }
+        _LOGGER.debug("Making API request for device %s", device_id)
+        return await self._async_graphql_request(payload, f"device {device_id}")
+
+    async def async_get_devices(
+        self, device_ids: List[str], batch_size: int = DEFAULT_DEVICE_BATCH_SIZE
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get several devices using batched GetDevices queries.
+
+        Each request selects up to batch_size devices using GraphQL aliases. The
+        result maps every device ID to a response in the same shape as returned
+        by async_get_device, or None if the device could not be fetched.
+        """
+        batch_size = max(1, batch_size)
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        for index in range(0, len(device_ids), batch_size):
+            batch = device_ids[index : index + batch_size]
+            results.update(await self.async_get_devices_batch(batch))
+        return results
+
+    async def async_get_devices_batch(
+        self, device_ids: List[str], live_only: bool = False
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get several devices in a single GraphQL request.
+
+        With live_only, only the fields changing while the devices run are
+        requested, like by async_get_device.
+        """
+        if not device_ids:
+            return {}
+
+        variables = dict(
+            DEVICE_LIVE_QUERY_VARIABLES if live_only else DEVICE_QUERY_VARIABLES
+        )
+        for index, device_id in enumerate(device_ids):
+            variables[f"id{index}"] = device_id
         payload = {
-            "operationName": "GetDevice",
-            "variables": {
-                "directAccessView": True,
-                "id": device_id,
-                "lang": "en",
-                "withFullCustomerData": True,
-                "withRestrictedCustomerData": True,
-                "withGrafanaLink": True,
-            },
-            "query": "query GetDevice($id: ID!, $lang: String!, $withFullCustomerData: Boolean!, $withRestrictedCustomerData: Boolean!, $withGrafanaLink: Boolean!, $directAccessView: Boolean! = false) { device(deviceId: $id) { id name type controller operatingMode inOperationSince controlsEnabled connectionStatus connectionStatusChangedTime grafanaLink @include(if: $withGrafanaLink) needPropagateDeviceData isConfigurationJobInProgress dataPropagationFailed isControlsOverrideEnabled controlOverrideStart thingType { name businessName thingTypeFamily { name __typename } __typename } address { id address @include(if: $withFullCustomerData) code @include(if: $withRestrictedCustomerData) city @include(if: $withRestrictedCustomerData) lat @include(if: $withFullCustomerData) lng @include(if: $withFullCustomerData) approximateLat @include(if: $withRestrictedCustomerData) approximateLng @include(if: $withRestrictedCustomerData) placeId @include(if: $withFullCustomerData) postalCode @include(if: $withFullCustomerData) __typename } contactInfo @include(if: $withFullCustomerData) { name phone email note __typename } company { id name usesNewEligibilitySystem __typename } newProduct { id __typename } liveDeviceData { runningServiceSequence { name requiredEligibility __typename } operatingValues(lang: $lang) { ...ControlFields validFor __typename } controls(lang: $lang) { ...ControlFields forbiddenByUser forbiddenByTechnology __typename } serviceSequences(lang: $lang) { ...ControlFields forbiddenByUser forbiddenByTechnology __typename } tabs(lang: $lang) { label type items { ... on Tab { label type items { ... on TabItem { name label type value unit options formattedValue canSetInTab __typename } __typename } __typename } ... on TabItem { name label type value unit options formattedValue canSetInTab __typename } __typename } __typename } __typename } eventDetectionPoints { eventCodes { severity description(lang: $lang) __typename } __typename } userAccess @include(if: $directAccessView) { id customDeviceName type __typename } eligibilities __typename } __typename } fragment ControlFields on Control { type name label icon value desiredValue options showDesired settable buttonText buttonIcon setEligibility statusLabel statusIcon __typename }",
+            "operationName": "GetDevicesLiveData" if live_only else "GetDevices",
+            "variables": variables,
+            "query": build_get_devices_query(len(device_ids), live_only),
         }
-        _LOGGER.debug(f"Making API request for device {device_id}")
-        async with self._session.post(
-            GRAPHQL_URL, json=payload, headers=headers
-        ) as resp:
-            _LOGGER.debug(f"API response status for device {device_id}: {resp.status}")
-            if resp.status != 200:
-                _LOGGER.error(f"Failed to fetch device {device_id}: {resp.status}")
-                response_text = await resp.text()
-                _LOGGER.error(f"Response body: {response_text}")
-                return None
-            response_data = await resp.json()
-            _LOGGER.debug(f"API response data for device {device_id}: {response_data}")
-            return response_data
+        _LOGGER.debug("Making batched API request for devices %s", device_ids)
+        response_data = await self._async_graphql_request(
+            payload, f"devices {device_ids}"
+        )
+        if response_data is None:
+            return {device_id: None for device_id in device_ids}
+        return split_get_devices_response(device_ids, response_data)
 
     async def async_set_control(
         self, device_id: str, control_name: str, value: Any, set_desired: bool = False
     ) -> bool:
-        headers = {
-            "Content-Type": "application/json",
-        }
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
+        """Set a control, merging quick successive writes to it.
+
+        Only the latest value is sent when newer values are set while a
+        command for the control is being sent, see CommandQueue.
+        """
+        return await self._command_queue.async_set_control(
+            device_id, control_name, value
+        )
 
+    async def _async_send_control(
+        self, device_id: str, control_name: str, value: Any
+    ) -> bool:
+        """Send a deviceControl mutation."""
         # Use the correct mutation format as provided in the example
         payload = {
             "variables": {
@@ -100,41 +644,94 @@ class IxfieldApi:
         }
 
         _LOGGER.debug(
-            f"Setting control {control_name} to {value} on device {device_id}"
+            "Setting control %s to %s on device %s", control_name, value, device_id
         )
-        async with self._session.post(
-            GRAPHQL_URL, json=payload, headers=headers
-        ) as resp:
-            if resp.status != 200:
-                _LOGGER.error(
-                    f"Failed to set control {control_name} on {device_id}: {resp.status}"
-                )
-                response_text = await resp.text()
-                _LOGGER.error(f"Response body: {response_text}")
-                return False
-            result = await resp.json()
-            _LOGGER.debug(f"Control set response: {result}")
-            success = (
-                result.get("data", {}).get("deviceControl", {}).get("success", False)
+        result = await self._async_graphql_request(
+            payload,
+            f"control {control_name} on {device_id}",
+            idempotent=False,
+            priority=PRIORITY_COMMAND,
+        )
+        if result is None:
+            return False
+        success = (
+            result.get("data", {}).get("deviceControl", {}).get("success", False)
+        )
+        if success:
+            _LOGGER.info(
+                f"Successfully set control {control_name} to {value} on device {device_id}"
             )
-            if success:
-                _LOGGER.info(
-                    f"Successfully set control {control_name} to {value} on device {device_id}"
-                )
-            else:
-                _LOGGER.error(
-                    f"API returned failure for setting control {control_name} to {value} on device {device_id}"
+        else:
+            _LOGGER.error(
+                f"API returned failure for setting control {control_name} to {value} on device {device_id}"
+            )
+        return success
+
+    async def async_set_controls(
+        self, device_id: str, controls: Dict[str, Any]
+    ) -> Dict[str, bool]:
+        """Set several controls of a device with one request.
+
+        The request is sent after the commands already sent for the controls
+        and replaces the values still waiting for them, see CommandQueue.
+
+        Args:
+            device_id: The device to control
+            controls: Values by control name
+
+        Returns:
+            Success by control name
+        """
+        if len(controls) == 1:
+            ((control_name, value),) = controls.items()
+            return {
+                control_name: await self.async_set_control(
+                    device_id, control_name, value
                 )
-            return success
+            }
+        return await self._command_queue.async_set_controls(device_id, controls)
 
-    async def async_get_user_devices(self) -> Optional[Dict[str, Any]]:
-        """Get all user devices using the GetUserDevices query."""
-        headers = {
-            "Content-Type": "application/json",
+    async def _async_send_controls(
+        self, device_id: str, controls: Dict[str, Any]
+    ) -> Dict[str, bool]:
+        """Send a SetControls mutation with one aliased deviceControl per control."""
+        control_names = list(controls)
+        payload = {
+            "operationName": "SetControls",
+            "variables": {
+                f"data{index}": {
+                    "deviceId": device_id,
+                    "name": control_name,
+                    "value": controls[control_name],
+                }
+                for index, control_name in enumerate(control_names)
+            },
+            "query": build_set_controls_mutation(len(control_names)),
         }
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
 
+        _LOGGER.debug("Setting controls %s on device %s", controls, device_id)
+        result = await self._async_graphql_request(
+            payload,
+            f"controls {', '.join(control_names)} on {device_id}",
+            idempotent=False,
+            priority=PRIORITY_COMMAND,
+        )
+        data = (result or {}).get("data") or {}
+        results = {
+            control_name: bool((data.get(f"control{index}") or {}).get("success"))
+            for index, control_name in enumerate(control_names)
+        }
+        failed = [name for name, success in results.items() if not success]
+        if failed:
+            _LOGGER.error(
+                f"API returned failure for setting controls {failed} on device {device_id}"
+            )
+        else:
+            _LOGGER.info(f"Successfully set controls {controls} on device {device_id}")
+        return results
+
+    async def async_get_user_devices(self) -> Optional[Dict[str, Any]]:
+        """Get all user devices using the GetUserDevices query."""
         payload = {
             "operationName": "GetUserDevices",
             "variables": {
@@ -153,15 +750,4 @@ class IxfieldApi:
         }
 
         _LOGGER.debug("Making API request to get user devices")
-        async with self._session.post(
-            GRAPHQL_URL, json=payload, headers=headers
-        ) as resp:
-            _LOGGER.debug(f"GetUserDevices API response status: {resp.status}")
-            if resp.status != 200:
-                _LOGGER.error(f"Failed to fetch user devices: {resp.status}")
-                response_text = await resp.text()
-                _LOGGER.error(f"Response body: {response_text}")
-                return None
-            response_data = await resp.json()
-            _LOGGER.debug(f"GetUserDevices API response data: {response_data}")
-            return response_data
+        return await self._async_graphql_request(payload, "user devices")
@@ -0,0 +1,166 @@
+"""Circuit breaker for requests to the IXField cloud."""
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import CIRCUIT_BREAKER_RECOVERY_TIMEOUT, DEFAULT_CIRCUIT_BREAKER_THRESHOLD
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+CIRCUIT_BREAKER_STATES = [STATE_CLOSED, STATE_OPEN, STATE_HALF_OPEN]
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the cloud is unreachable."""
+
+
+class CircuitBreaker:
+    """Stop sending requests to the cloud while it keeps failing.
+
+    The circuit opens after failure_threshold failed requests in a row and
+    then fails requests at once. After recovery_timeout seconds it becomes
+    half-open and lets a single probe request through, which closes the
+    circuit on success or opens it again on failure.
+
+    With hass given, the circuit becomes half-open on a timer, so listeners
+    see the change without a request. Otherwise the next request moves it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_CIRCUIT_BREAKER_THRESHOLD,
+        recovery_timeout: float = CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+        hass: Optional[HomeAssistant] = None,
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self._hass = hass
+        self._state = STATE_CLOSED
+        self._failure_count = 0
+        self._opened_at: Optional[float] = None
+        self._cancel_half_open: Optional[Callable[[], None]] = None
+        self._probe_in_flight = False
+        self._rejected_requests = 0
+        self._listeners: List[Callable[[], None]] = []
+
+    @property
+    def state(self) -> str:
+        """Get the state."""
+        return self._state
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the state as a dictionary, e.g. for diagnostics."""
+        return {
+            "state": self.state,
+            "failure_count": self._failure_count,
+            "failure_threshold": self.failure_threshold,
+            "rejected_requests": self._rejected_requests,
+        }
+
+    def add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Listen for state changes, returns a function removing the listener."""
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+    def _set_state(self, state: str) -> None:
+        """Change the state and notify the listeners."""
+        if state == self._state:
+            return
+        _LOGGER.info(f"IXField cloud circuit breaker {self._state} -> {state}")
+        self._state = state
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    def _open(self) -> None:
+        """Open the circuit, and plan moving to half-open."""
+        self._opened_at = time.monotonic()
+        self._set_state(STATE_OPEN)
+        self._cancel_recovery()
+        if self._hass is not None:
+            self._cancel_half_open = async_call_later(
+                self._hass, self.recovery_timeout, self._async_half_open
+            )
+
+    def _cancel_recovery(self) -> None:
+        """Cancel the planned move to half-open."""
+        if self._cancel_half_open is not None:
+            self._cancel_half_open()
+            self._cancel_half_open = None
+
+    @callback
+    def _async_half_open(self, _now: Optional[datetime] = None) -> None:
+        """Let a probe request through after the recovery timeout."""
+        self._cancel_half_open = None
+        if self._state == STATE_OPEN:
+            self._set_state(STATE_HALF_OPEN)
+
+    def _check_recovery(self) -> None:
+        """Move to half-open if the recovery timeout passed without the timer."""
+        if (
+            self._state == STATE_OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._cancel_recovery()
+            self._async_half_open()
+
+    def before_request(self) -> bool:
+        """Check if a request may be sent.
+
+        Returns:
+            bool: True if the request is the probe of a half-open circuit
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with the
+                probe request already in flight
+        """
+        self._check_recovery()
+        if self._state == STATE_CLOSED:
+            return False
+        if self._state == STATE_HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self._rejected_requests += 1
+        raise CircuitOpenError(
+            f"IXField cloud unavailable after {self._failure_count} failed requests"
+        )
+
+    def check_open(self) -> None:
+        """Fail fast while the circuit is open, without taking the probe.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        self._check_recovery()
+        if self._state == STATE_OPEN:
+            self._rejected_requests += 1
+            raise CircuitOpenError(
+                f"IXField cloud unavailable after {self._failure_count} failed requests"
+            )
+
+    def record_success(self) -> None:
+        """Record a request the cloud answered."""
+        self._failure_count = 0
+        self._probe_in_flight = False
+        self._cancel_recovery()
+        self._set_state(STATE_CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a request that failed because of the cloud or the network."""
+        self._failure_count += 1
+        self._probe_in_flight = False
+        if self._state == STATE_HALF_OPEN or (
+            self._failure_count >= self.failure_threshold
+        ):
+            self._open()
+
+    def release_probe(self) -> None:
+        """Allow a new probe if the probe ended without an outcome."""
+        self._probe_in_flight = False
@@ -7,8 +7,10 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN, IXFIELD_DEVICE_URL
 from .entity_helper import (
     EntityCommonAttrsMixin,
+    EntityDeviceStateMixin,
     EntityNamingMixin,
     EntityValueMixin,
+    create_coordinator_context,
     create_unique_id,
     get_operating_values,
     create_device_info,
@@ -141,6 +143,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
 
 class IxfieldClimate(
+    EntityDeviceStateMixin,
     CoordinatorEntity,
     ClimateEntity,
     EntityNamingMixin,
@@ -156,7 +159,12 @@ class IxfieldClimate(
     ):
         self.setup_entity_naming(device_name, sensor_name, "climate", config["name"])
         self.set_common_attrs(config, "climate")
-        super().__init__(coordinator)
+        context_names = [sensor_name, CLIMATE_STATUS_SENSOR]
+        if mode_sensor:
+            context_names.append(mode_sensor.get("name"))
+        super().__init__(
+            coordinator, create_coordinator_context(device_id, *context_names)
+        )
 
         self._device_id = device_id
         self._device_name = device_name
@@ -217,15 +225,9 @@ class IxfieldClimate(
     def hvac_action(self):
         """Return the current HVAC action (heating, cooling, idle, etc.)."""
         # First check if we have a specific heaterMode sensor
-        operating_values = get_operating_values(self.coordinator, self._device_id)
-        
-        # Look for heaterMode sensor in operating values
-        for sensor in operating_values:
-            if sensor.get("name") == "heaterMode":
-                heater_mode_value = sensor.get("value")
-                if heater_mode_value == "HEATING":
-                    return "heating"
-                break
+        heater_mode_value = self.get_sensor_value(CLIMATE_STATUS_SENSOR, "value")
+        if heater_mode_value == "HEATING":
+            return "heating"
 
         # Fallback to checking the mode sensor if available
         if self._mode_sensor:
@@ -263,7 +265,7 @@ class IxfieldClimate(
                 ),
                 verification_call=self._get_actual_target_temperature,
                 value_comparison=float_comparison_with_tolerance,
-                coordinator_refresh=self.coordinator.async_request_refresh,
+                **self.get_device_refresh_callbacks(),
             )
 
     async def async_set_hvac_mode(self, hvac_mode):
@@ -282,36 +284,21 @@ class IxfieldClimate(
             ),
             verification_call=self._get_actual_hvac_mode,
             value_comparison=string_comparison_ignore_case,
-            coordinator_refresh=self.coordinator.async_request_refresh,
+            **self.get_device_refresh_callbacks(),
         )
 
     def _get_actual_target_temperature(self):
-        device_data = self.coordinator.data.get(self._device_id, {})
-        if not device_data or "data" not in device_data:
-            return None
-        device = device_data.get("data", {}).get("device", {})
-        for v in device.get("liveDeviceData", {}).get("operatingValues", []):
-            if v.get("name") == self._sensor_name:
-                try:
-                    return float(v.get("desiredValue"))
-                except Exception:
-                    return None
-        return None
+        value = self.get_sensor_value(self._sensor_name, "desiredValue")
+        # Non-numeric desired values are not a valid temperature
+        return value if isinstance(value, float) else None
 
     def _get_actual_hvac_mode(self):
         if not self._mode_sensor:
             return HVACMode.AUTO
-        device_data = self.coordinator.data.get(self._device_id, {})
-        if not device_data or "data" not in device_data:
+        value = self.get_sensor_value(self._mode_sensor.get("name"), "value")
+        if value == "HEATING":
+            return HVACMode.HEAT
+        elif value == "DISABLED":
+            return HVACMode.OFF
+        else:
             return HVACMode.AUTO
-        device = device_data.get("data", {}).get("device", {})
-        for v in device.get("liveDeviceData", {}).get("operatingValues", []):
-            if v.get("name") == self._mode_sensor.get("name"):
-                value = v.get("value")
-                if value == "HEATING":
-                    return HVACMode.HEAT
-                elif value == "DISABLED":
-                    return HVACMode.OFF
-                else:
-                    return HVACMode.AUTO
-        return HVACMode.AUTO
@@ -0,0 +1,147 @@
+"""Queueing of control commands sent to IXField devices."""
+import asyncio
+import contextlib
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CommandQueue:
+    """Per device queue of control commands with last-write-wins merging.
+
+    Commands for different controls are sent concurrently, commands for the
+    same control one after another. While a command for a control is being
+    sent, newer values for it wait in the queue and only the latest one is
+    sent next. Callers whose value was replaced get the result of the command
+    that replaced it.
+
+    Commands setting several controls of a device at once are ordered with
+    the commands for each of their controls and replace the values of those
+    controls still waiting in the queue.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, str, Any], Awaitable[bool]],
+        send_batch: Callable[[str, Dict[str, Any]], Awaitable[Dict[str, bool]]],
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            send: Async function sending a control command, returns success bool
+            send_batch: Async function sending a command setting several
+                controls of a device, returns success by control name
+        """
+        self._send = send
+        self._send_batch = send_batch
+        # Latest value waiting to be sent per (device_id, control_name)
+        self._queued: Dict[Tuple[str, str], Tuple[Any, asyncio.Future]] = {}
+        self._senders: Dict[Tuple[str, str], asyncio.Task] = {}
+        # Held while a command for the control is being sent
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._superseded_commands = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Get the number of queued and of superseded commands."""
+        return {
+            "queued_commands": len(self._queued),
+            "superseded_commands": self._superseded_commands,
+        }
+
+    async def async_set_control(
+        self, device_id: str, control_name: str, value: Any
+    ) -> bool:
+        """Queue setting a control, returns if its latest value was set."""
+        key = (device_id, control_name)
+        if key in self._queued:
+            old_value, result = self._queued[key]
+            self._superseded_commands += 1
+            _LOGGER.debug(
+                "Replacing queued value %s of control %s on device %s with %s",
+                old_value,
+                control_name,
+                device_id,
+                value,
+            )
+        else:
+            result = asyncio.get_running_loop().create_future()
+        self._queued[key] = (value, result)
+
+        if key not in self._senders:
+            self._senders[key] = asyncio.ensure_future(self._async_send_queued(key))
+        # Cancelling one caller must not cancel the command of the others
+        return await asyncio.shield(result)
+
+    async def async_set_controls(
+        self, device_id: str, controls: Dict[str, Any]
+    ) -> Dict[str, bool]:
+        """Queue setting several controls at once, returns success by control name."""
+        keys = sorted((device_id, control_name) for control_name in controls)
+        # Values waiting to be sent are older, they get the result of this command
+        superseded = []
+        for key in keys:
+            if key in self._queued:
+                _, result = self._queued.pop(key)
+                self._superseded_commands += 1
+                superseded.append((key[1], result))
+        sender = asyncio.ensure_future(
+            self._async_send_batch(device_id, controls, keys, superseded)
+        )
+        # Cancelling the caller must not cancel the command of the replaced ones
+        return await asyncio.shield(sender)
+
+    def _get_lock(self, key: Tuple[str, str]) -> asyncio.Lock:
+        """Get the lock held while a command for a control is being sent."""
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        return lock
+
+    async def _async_send_queued(self, key: Tuple[str, str]) -> None:
+        """Send the queued values of a control until none is left."""
+        try:
+            while key in self._queued:
+                async with self._get_lock(key):
+                    # A command setting several controls may have replaced it
+                    if key not in self._queued:
+                        break
+                    value, result = self._queued.pop(key)
+                    try:
+                        success = await self._send(*key, value)
+                    except asyncio.CancelledError:
+                        result.cancel()
+                        raise
+                    except Exception as err:
+                        result.set_exception(err)
+                    else:
+                        result.set_result(success)
+        finally:
+            del self._senders[key]
+
+    async def _async_send_batch(
+        self,
+        device_id: str,
+        controls: Dict[str, Any],
+        keys: List[Tuple[str, str]],
+        superseded: List[Tuple[str, asyncio.Future]],
+    ) -> Dict[str, bool]:
+        """Send a command setting several controls once no other is sent for them."""
+        try:
+            async with contextlib.AsyncExitStack() as stack:
+                # Locks are always taken in sorted order, so batches cannot deadlock
+                for key in keys:
+                    await stack.enter_async_context(self._get_lock(key))
+                results = await self._send_batch(device_id, controls)
+        except asyncio.CancelledError:
+            for _, result in superseded:
+                result.cancel()
+            raise
+        except Exception as err:
+            for _, result in superseded:
+                result.set_exception(err)
+            raise
+        for control_name, result in superseded:
+            result.set_result(results.get(control_name, False))
+        return results
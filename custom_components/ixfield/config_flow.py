@@ -1,4 +1,3 @@
-import aiohttp
 import logging
 import voluptuous as vol
 from homeassistant import config_entries
@@ -6,8 +5,20 @@ from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
+from . import async_create_api
 from .api import IxfieldApi
-from .const import CONF_DEVICE_DICT, CONF_EXTRACT_DEVICE_INFO_SENSORS, DOMAIN
+from .session import async_get_session
+from .const import (
+    CONF_CIRCUIT_BREAKER_THRESHOLD,
+    CONF_DEVICE_BATCH_SIZE,
+    CONF_DEVICE_DICT,
+    CONF_EXTRACT_DEVICE_INFO_SENSORS,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_CIRCUIT_BREAKER_THRESHOLD,
+    DEFAULT_DEVICE_BATCH_SIZE,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,10 +50,10 @@ class IxfieldConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._abort_if_unique_id_configured()
 
             # Validate credentials and get available devices
-            session = None
             try:
-                session = aiohttp.ClientSession()
-                api = IxfieldApi(self._email, self._password, session)
+                api = IxfieldApi(
+                    self._email, self._password, async_get_session(self.hass)
+                )
                 await api.async_login()
 
                 # Get available devices
@@ -67,8 +78,6 @@ class IxfieldConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         errors=errors,
                     )
 
-                await session.close()
-
                 # Create device dictionary with all discovered devices
                 device_dict = {}
                 for device in devices_data:
@@ -106,8 +115,6 @@ class IxfieldConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except Exception as ex:
                 _LOGGER.error(f"Authentication failed: {ex}")
                 errors["base"] = "invalid_auth"
-                if session:
-                    await session.close()
 
         return self.async_show_form(
             step_id="user",
@@ -142,6 +149,15 @@ class IxfieldOptionsFlow(config_entries.OptionsFlow):
         """Initialize options flow."""
         self._reload_result = None
 
+    async def _async_get_user_devices(self):
+        """Fetch the user's devices, reusing the running integration's API."""
+        entry_data = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        if entry_data:
+            return await entry_data["coordinator"].api.async_get_user_devices()
+
+        api = await async_create_api(self.hass, self.config_entry)
+        return await api.async_get_user_devices()
+
     async def async_step_init(self, user_input=None):
         """Manage the IXField options."""
         if user_input is not None:
@@ -264,15 +280,7 @@ class IxfieldOptionsFlow(config_entries.OptionsFlow):
             if user_input.get("confirm"):
                 try:
                     # Get fresh device data from API
-                    email = self.config_entry.data["email"]
-                    password = self.config_entry.data["password"]
-
-                    session = aiohttp.ClientSession()
-                    api = IxfieldApi(email, password, session)
-                    await api.async_login()
-
-                    devices_response = await api.async_get_user_devices()
-                    await session.close()
+                    devices_response = await self._async_get_user_devices()
 
                     if devices_response is None:
                         return self.async_abort(reason="failed_to_fetch_devices")
@@ -317,6 +325,17 @@ class IxfieldOptionsFlow(config_entries.OptionsFlow):
                             CONF_EXTRACT_DEVICE_INFO_SENSORS: self.config_entry.data.get(
                                 CONF_EXTRACT_DEVICE_INFO_SENSORS, True
                             ),
+                            CONF_MAX_CONCURRENT_REQUESTS: self.config_entry.data.get(
+                                CONF_MAX_CONCURRENT_REQUESTS,
+                                DEFAULT_MAX_CONCURRENT_REQUESTS,
+                            ),
+                            CONF_DEVICE_BATCH_SIZE: self.config_entry.data.get(
+                                CONF_DEVICE_BATCH_SIZE, DEFAULT_DEVICE_BATCH_SIZE
+                            ),
+                            CONF_CIRCUIT_BREAKER_THRESHOLD: self.config_entry.data.get(
+                                CONF_CIRCUIT_BREAKER_THRESHOLD,
+                                DEFAULT_CIRCUIT_BREAKER_THRESHOLD,
+                            ),
                         },
                     )
 
@@ -335,6 +354,17 @@ class IxfieldOptionsFlow(config_entries.OptionsFlow):
                             CONF_EXTRACT_DEVICE_INFO_SENSORS: self.config_entry.data.get(
                                 CONF_EXTRACT_DEVICE_INFO_SENSORS, True
                             ),
+                            CONF_MAX_CONCURRENT_REQUESTS: self.config_entry.data.get(
+                                CONF_MAX_CONCURRENT_REQUESTS,
+                                DEFAULT_MAX_CONCURRENT_REQUESTS,
+                            ),
+                            CONF_DEVICE_BATCH_SIZE: self.config_entry.data.get(
+                                CONF_DEVICE_BATCH_SIZE, DEFAULT_DEVICE_BATCH_SIZE
+                            ),
+                            CONF_CIRCUIT_BREAKER_THRESHOLD: self.config_entry.data.get(
+                                CONF_CIRCUIT_BREAKER_THRESHOLD,
+                                DEFAULT_CIRCUIT_BREAKER_THRESHOLD,
+                            ),
                         },
                     )
 
@@ -359,18 +389,19 @@ class IxfieldOptionsFlow(config_entries.OptionsFlow):
             extract_device_info_sensors = user_input.get(
                 CONF_EXTRACT_DEVICE_INFO_SENSORS, True
             )
+            max_concurrent_requests = user_input.get(
+                CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+            )
+            device_batch_size = user_input.get(
+                CONF_DEVICE_BATCH_SIZE, DEFAULT_DEVICE_BATCH_SIZE
+            )
+            circuit_breaker_threshold = user_input.get(
+                CONF_CIRCUIT_BREAKER_THRESHOLD, DEFAULT_CIRCUIT_BREAKER_THRESHOLD
+            )
 
             # Get available devices
             try:
-                email = self.config_entry.data[CONF_EMAIL]
-                password = self.config_entry.data[CONF_PASSWORD]
-
-                session = aiohttp.ClientSession()
-                api = IxfieldApi(email, password, session)
-                await api.async_login()
-
-                devices_response = await api.async_get_user_devices()
-                await session.close()
+                devices_response = await self._async_get_user_devices()
 
                 if devices_response is None:
                     return self.async_abort(reason="failed_to_fetch_devices")
@@ -411,6 +442,9 @@ class IxfieldOptionsFlow(config_entries.OptionsFlow):
                         CONF_PASSWORD: self.config_entry.data[CONF_PASSWORD],
                         CONF_DEVICE_DICT: device_dict,
                         CONF_EXTRACT_DEVICE_INFO_SENSORS: extract_device_info_sensors,
+                        CONF_MAX_CONCURRENT_REQUESTS: max_concurrent_requests,
+                        CONF_DEVICE_BATCH_SIZE: device_batch_size,
+                        CONF_CIRCUIT_BREAKER_THRESHOLD: circuit_breaker_threshold,
                     },
                 )
 
@@ -425,6 +459,9 @@ class IxfieldOptionsFlow(config_entries.OptionsFlow):
                         CONF_PASSWORD: self.config_entry.data[CONF_PASSWORD],
                         CONF_DEVICE_DICT: device_dict,
                         CONF_EXTRACT_DEVICE_INFO_SENSORS: extract_device_info_sensors,
+                        CONF_MAX_CONCURRENT_REQUESTS: max_concurrent_requests,
+                        CONF_DEVICE_BATCH_SIZE: device_batch_size,
+                        CONF_CIRCUIT_BREAKER_THRESHOLD: circuit_breaker_threshold,
                     },
                 )
 
@@ -442,6 +479,26 @@ class IxfieldOptionsFlow(config_entries.OptionsFlow):
                             CONF_EXTRACT_DEVICE_INFO_SENSORS, True
                         ),
                     ): bool,
+                    vol.Optional(
+                        CONF_MAX_CONCURRENT_REQUESTS,
+                        default=self.config_entry.data.get(
+                            CONF_MAX_CONCURRENT_REQUESTS,
+                            DEFAULT_MAX_CONCURRENT_REQUESTS,
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+                    vol.Optional(
+                        CONF_DEVICE_BATCH_SIZE,
+                        default=self.config_entry.data.get(
+                            CONF_DEVICE_BATCH_SIZE, DEFAULT_DEVICE_BATCH_SIZE
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=25)),
+                    vol.Optional(
+                        CONF_CIRCUIT_BREAKER_THRESHOLD,
+                        default=self.config_entry.data.get(
+                            CONF_CIRCUIT_BREAKER_THRESHOLD,
+                            DEFAULT_CIRCUIT_BREAKER_THRESHOLD,
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=50)),
                 }
             ),
             description_placeholders={
@@ -3,6 +3,9 @@ CONF_EMAIL = "email"
 CONF_PASSWORD = "password"
 CONF_DEVICE_DICT = "device_dict"
 CONF_EXTRACT_DEVICE_INFO_SENSORS = "extract_device_info_sensors"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_DEVICE_BATCH_SIZE = "device_batch_size"
+CONF_CIRCUIT_BREAKER_THRESHOLD = "circuit_breaker_threshold"
 
 # IXField URLs
 IXFIELD_DEVICE_URL = "https://www.ixfield.com/app/device"
@@ -10,10 +13,66 @@ IXFIELD_DEVICE_URL = "https://www.ixfield.com/app/device"
 # Default values
 DEFAULT_UPDATE_INTERVAL_MINUTES = 2
 DEFAULT_EXTRACT_DEVICE_INFO_SENSORS = False
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+# Devices fetched per GraphQL request, 1 disables batching
+DEFAULT_DEVICE_BATCH_SIZE = 1
+# Failed requests in a row after which requests fail fast
+DEFAULT_CIRCUIT_BREAKER_THRESHOLD = 5
 
 # API Configuration
 API_TIMEOUT = 30
 MAX_RETRIES = 3
+# Exponential backoff between retries, in seconds
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_MAX = 30.0
+# Client-side rate limit shared by all config entries (token bucket)
+RATE_LIMIT_REQUESTS_PER_SECOND = 5.0
+RATE_LIMIT_BURST = 10
+# Seconds the circuit breaker stays open before probing the cloud again
+CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 60
+# Largest accepted API response, in bytes
+MAX_RESPONSE_SIZE = 8 * 1024 * 1024
+# Seconds before expiry at which the access token is renewed
+TOKEN_REFRESH_MARGIN = 300
+
+# HTTP session shared by all config entries
+SESSION_CONNECTION_LIMIT = 20
+SESSION_KEEPALIVE_TIMEOUT = 60
+SESSION_DNS_CACHE_TTL = 300
+
+# Storage
+STORAGE_VERSION = 1
+TOKEN_STORAGE_KEY = "ixfield.{entry_id}.tokens"
+SNAPSHOT_STORAGE_KEY = "ixfield.{entry_id}.snapshot"
+# Seconds to wait before saving a new device snapshot, coalescing refreshes
+SNAPSHOT_SAVE_DELAY = 60
+# Seconds to merge refresh requests of commands, giving the cloud time to apply them
+COMMAND_REFRESH_WINDOW = 2.0
+# Seconds between refreshes confirming a command, doubling up to the maximum
+COMMAND_VERIFY_POLL_INITIAL = 1.0
+COMMAND_VERIFY_POLL_MAX = 8.0
+# Seconds to wait for the cloud to confirm a command before showing its value again
+COMMAND_VERIFY_TIMEOUT = 30.0
+# Seconds between fetches of the full device data, polls only fetch live data
+METADATA_REFRESH_INTERVAL = 3600
+# Seconds between polls of devices with a command, a running service sequence
+# or changed controls within the last POLL_ACTIVE_WINDOW seconds
+POLL_INTERVAL_ACTIVE = 30
+POLL_ACTIVE_WINDOW = 300
+# Polls without any change after which a device is polled POLL_IDLE_FACTOR times slower
+POLL_IDLE_AFTER_UNCHANGED = 5
+POLL_IDLE_FACTOR = 3
+# Offline devices are polled exponentially less often, up to this many seconds
+POLL_OFFLINE_MAX_INTERVAL = 1800
+# Seconds within which devices due soon are polled together with the due ones,
+# also the minimum time between scheduled refreshes
+POLL_DUE_TOLERANCE = 1
+# Fraction of its slot by which the first poll of a device is randomly moved earlier
+POLL_SLOT_JITTER = 0.5
+# Devices controlled at once by the bulk_control service
+BULK_CONTROL_MAX_CONCURRENT = 8
+# Failed refreshes in a row before a device's entities become unavailable
+DEVICE_MAX_CONSECUTIVE_ERRORS = 3
 
 # Device types
 DEVICE_TYPE_POOL = "POOL"
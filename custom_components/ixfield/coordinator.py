@@ -1,13 +1,240 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 
+import asyncio
 import logging
-from homeassistant.core import HomeAssistant
+import random
+import time
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import event
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from typing import Any, Dict, List, Optional
+from homeassistant.util import dt as dt_util
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .const import (
+    COMMAND_REFRESH_WINDOW,
+    CONNECTION_STATUS_OFFLINE,
+    DEFAULT_DEVICE_BATCH_SIZE,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEVICE_MAX_CONSECUTIVE_ERRORS,
+    METADATA_REFRESH_INTERVAL,
+    POLL_ACTIVE_WINDOW,
+    POLL_DUE_TOLERANCE,
+    POLL_IDLE_AFTER_UNCHANGED,
+    POLL_IDLE_FACTOR,
+    POLL_INTERVAL_ACTIVE,
+    POLL_OFFLINE_MAX_INTERVAL,
+    POLL_SLOT_JITTER,
+    SNAPSHOT_SAVE_DELAY,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def merge_live_device_data(
+    snapshot: Dict[str, Any], live_data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Merge a GetDeviceLiveData response into the last full device snapshot.
+
+    The merged snapshot is a new object, fields missing from the live data,
+    e.g. the address or tabs, are kept from the snapshot.
+    """
+    device = snapshot.get("data", {}).get("device") or {}
+    live_device = live_data.get("data", {}).get("device") or {}
+    merged_device = {**device, **live_device}
+    if "liveDeviceData" in live_device:
+        merged_device["liveDeviceData"] = {
+            **(device.get("liveDeviceData") or {}),
+            **(live_device.get("liveDeviceData") or {}),
+        }
+    return {**snapshot, "data": {**snapshot.get("data", {}), "device": merged_device}}
+
+
+class DeviceUpdateState:
+    """Outcome of the refreshes of a single device."""
+
+    def __init__(self) -> None:
+        """Initialize the device update state."""
+        self.last_success: Optional[datetime] = None
+        self.last_failure: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self.error_count = 0
+        self.restored = False
+
+    def record_restored(self, last_success: Optional[datetime]) -> None:
+        """Record that the device data was restored from a previous run."""
+        self.last_success = last_success
+        self.restored = True
+
+    def record_success(self) -> None:
+        """Record a successful fetch of the device."""
+        self.last_success = dt_util.utcnow()
+        self.last_error = None
+        self.error_count = 0
+        self.restored = False
+
+    def record_failure(self, error: str) -> None:
+        """Record a failed fetch of the device."""
+        self.last_failure = dt_util.utcnow()
+        self.last_error = error
+        self.error_count += 1
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True if the device data comes from an older refresh."""
+        return self.restored or self.error_count > 0
+
+    @property
+    def stale_since(self) -> Optional[datetime]:
+        """Return the time of the last good snapshot if the data is stale."""
+        return self.last_success if self.is_stale else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the state as a dictionary, e.g. for diagnostics."""
+        return {
+            "last_success": self.last_success,
+            "last_failure": self.last_failure,
+            "last_error": self.last_error,
+            "error_count": self.error_count,
+            "restored": self.restored,
+            "stale": self.is_stale,
+        }
+
+
+class DevicePollSchedule:
+    """Adaptive poll interval and next due time of a single device."""
+
+    def __init__(self) -> None:
+        """Initialize the schedule, due right away."""
+        self.interval: Optional[float] = None
+        self.reason: Optional[str] = None
+        # Monotonic times
+        self.next_due = 0.0
+        self.last_poll: Optional[float] = None
+        self.last_activity: Optional[float] = None
+        self.unchanged_polls = 0
+        self.offline_polls = 0
+
+    def record_command(self) -> None:
+        """Record that a command was sent to the device."""
+        self.last_activity = time.monotonic()
+
+    def is_active(self, now: float) -> bool:
+        """Return True if a command or control change happened recently."""
+        return (
+            self.last_activity is not None
+            and now - self.last_activity < POLL_ACTIVE_WINDOW
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the schedule as a dictionary, e.g. for diagnostics."""
+        return {
+            "poll_interval": self.interval,
+            "poll_reason": self.reason,
+            "next_poll_in": max(0.0, self.next_due - time.monotonic()),
+            "unchanged_polls": self.unchanged_polls,
+            "offline_polls": self.offline_polls,
+        }
+
+
+def _convert_value(value: Any) -> Any:
+    """Convert a numeric API value to float, leaving other values unchanged."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+class DeviceSnapshotIndex:
+    """Name-indexed view of a single device snapshot from coordinator.data.
+
+    Built once per snapshot, so entities can look up sensors and controls by
+    name instead of scanning the operatingValues and controls lists.
+    """
+
+    # Sensor keys converted to float once, when the index is built
+    CONVERTED_SENSOR_KEYS = ("value", "desiredValue")
+
+    def __init__(self, snapshot: Optional[Dict[str, Any]]) -> None:
+        """Initialize the index from a GetDevice response."""
+        self.snapshot = snapshot
+        self.sensors: Dict[str, Dict[str, Any]] = {}
+        self.controls: Dict[str, Dict[str, Any]] = {}
+        self._sensor_values: Dict[str, Dict[str, Any]] = {}
+        self._device_fields: Dict[str, Any] = {}
+
+        if not snapshot or "data" not in snapshot:
+            return
+
+        device = snapshot.get("data", {}).get("device") or {}
+        live_data = device.get("liveDeviceData") or {}
+        self._device_fields = {
+            key: value for key, value in device.items() if key != "liveDeviceData"
+        }
+
+        # Keep the first entry of a name, as the former linear scans did
+        for sensor in live_data.get("operatingValues") or []:
+            name = sensor.get("name")
+            if name is not None and name not in self.sensors:
+                self.sensors[name] = sensor
+                self._sensor_values[name] = {
+                    key: _convert_value(sensor.get(key))
+                    for key in self.CONVERTED_SENSOR_KEYS
+                }
+        for control in live_data.get("controls") or []:
+            name = control.get("name")
+            if name is not None and name not in self.controls:
+                self.controls[name] = control
+
+    def get_sensor_value(
+        self, sensor_name: str, value_key: str = "value", fallback_value: Any = None
+    ) -> Any:
+        """Get a sensor value, converted to float if numeric."""
+        values = self._sensor_values.get(sensor_name)
+        if values is None:
+            return fallback_value
+        if value_key in values:
+            return values[value_key]
+        return _convert_value(self.sensors[sensor_name].get(value_key))
+
+    def get_control_value(
+        self, control_name: str, value_key: str = "value", fallback_value: Any = None
+    ) -> Any:
+        """Get a raw control value."""
+        control = self.controls.get(control_name)
+        if control is None:
+            return fallback_value
+        return control.get(value_key)
+
+    def diff(self, previous: Optional["DeviceSnapshotIndex"]) -> Optional[Set[str]]:
+        """Get the names of sensors and controls changed since a previous snapshot.
+
+        Returns None if the device itself changed (or there is nothing to compare
+        with), meaning every entity of the device needs to be updated.
+        """
+        if previous is None or not previous.snapshot or not self.snapshot:
+            return None
+        if previous.snapshot is self.snapshot:
+            return set()
+        if previous._device_fields != self._device_fields:
+            return None
+
+        changed = {
+            name
+            for name in self.sensors.keys() | previous.sensors.keys()
+            if self.sensors.get(name) != previous.sensors.get(name)
+        }
+        changed.update(
+            name
+            for name in self.controls.keys() | previous.controls.keys()
+            if self.controls.get(name) != previous.controls.get(name)
+        )
+        return changed
+
+
 class IxfieldCoordinator(DataUpdateCoordinator):
     def __init__(
         self,
@@ -16,6 +243,9 @@ class IxfieldCoordinator(DataUpdateCoordinator):
         device_dict: Dict[str, Any],
         update_interval: timedelta = timedelta(minutes=2),
         extract_device_info_sensors: bool = True,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        device_batch_size: int = DEFAULT_DEVICE_BATCH_SIZE,
+        snapshot_store: Optional[Store] = None,
     ) -> None:
         super().__init__(
             hass,
@@ -29,6 +259,34 @@ class IxfieldCoordinator(DataUpdateCoordinator):
         self._device_info: Dict[str, Any] = {}
         self._device_names: Dict[str, str] = {}
         self._extract_device_info_sensors = extract_device_info_sensors
+        # A limit of 1 polls the devices one after another
+        self._max_concurrent_requests = max(1, max_concurrent_requests)
+        # A batch size of 1 fetches every device with its own GetDevice query
+        self._device_batch_size = max(1, device_batch_size)
+        self._device_fetch_times: Dict[str, float] = {}
+        self._last_refresh_time: Optional[float] = None
+        self._device_states: Dict[str, DeviceUpdateState] = {
+            device_id: DeviceUpdateState() for device_id in self.device_ids
+        }
+        self._device_indexes: Dict[str, DeviceSnapshotIndex] = {}
+        # Changed names (None for all) per device, with the snapshot they apply to
+        self._device_changes: Dict[str, Tuple[Any, Optional[Set[str]]]] = {}
+        # Availability and stale time per device the listeners were last updated with
+        self._notified_states: Dict[str, Tuple[bool, Optional[datetime]]] = {}
+        self._skipped_state_writes = 0
+        # Monotonic time of the last full fetch per device, polls in between
+        # only fetch the live data
+        self._metadata_fetch_times: Dict[str, float] = {}
+        # Callbacks for every new snapshot of a device, see async_add_snapshot_listener
+        self._snapshot_listeners: Dict[str, List[CALLBACK_TYPE]] = {}
+        # Persists the last good data for a warm start after a restart
+        self._snapshot_store = snapshot_store
+        # Devices to refresh after commands, and the scheduled refresh
+        self._command_refresh_device_ids: Set[str] = set()
+        self._command_refresh: Optional[asyncio.Future] = None
+        # Adaptive per device polling, scheduled refreshes only fetch due devices
+        self._poll_schedules: Dict[str, DevicePollSchedule] = {}
+        self._scheduled_refresh = False
         self._construct_device_names()
 
     def _construct_device_names(self) -> None:
@@ -44,7 +302,7 @@ class IxfieldCoordinator(DataUpdateCoordinator):
                     self._device_names[device_id] = custom_name
                 else:
                     self._device_names[device_id] = device_name
-            _LOGGER.debug(f"Constructed device names (fallback): {self._device_names}")
+            _LOGGER.debug("Constructed device names (fallback): %s", self._device_names)
             return
 
         # Group devices by type for numbering
@@ -86,7 +344,7 @@ class IxfieldCoordinator(DataUpdateCoordinator):
             else:
                 self._device_names[device_id] = base_name
 
-        _LOGGER.debug(f"Constructed device names: {self._device_names}")
+        _LOGGER.debug("Constructed device names: %s", self._device_names)
 
     @property
     def device_info(self) -> Dict[str, Any]:
@@ -139,6 +397,9 @@ class IxfieldCoordinator(DataUpdateCoordinator):
             "in_operation_since": device_info.get("in_operation_since"),
             "address": device_info.get("address", {}).get("address", "Unknown"),
             "city": device_info.get("address", {}).get("city", "Unknown"),
+            "stale": self.get_device_state(device_id).is_stale,
+            "poll_interval": self.get_poll_schedule(device_id).interval,
+            "poll_reason": self.get_poll_schedule(device_id).reason,
         }
 
     def get_all_devices_status(self) -> Dict[str, Dict[str, Any]]:
@@ -165,6 +426,342 @@ class IxfieldCoordinator(DataUpdateCoordinator):
         """Check if device info sensors should be extracted."""
         return self._extract_device_info_sensors
 
+    def get_device_state(self, device_id: str) -> DeviceUpdateState:
+        """Get the update state of a device."""
+        if device_id not in self._device_states:
+            self._device_states[device_id] = DeviceUpdateState()
+        return self._device_states[device_id]
+
+    def get_poll_schedule(self, device_id: str) -> DevicePollSchedule:
+        """Get the adaptive poll schedule of a device."""
+        if device_id not in self._poll_schedules:
+            self._poll_schedules[device_id] = DevicePollSchedule()
+        return self._poll_schedules[device_id]
+
+    def get_device_index(self, device_id: str) -> DeviceSnapshotIndex:
+        """Get the name-indexed view of the current snapshot of a device."""
+        snapshot = (self.data or {}).get(device_id)
+        index = self._device_indexes.get(device_id)
+        # Rebuild only if the snapshot was replaced outside of a refresh
+        if index is None or index.snapshot is not snapshot:
+            index = DeviceSnapshotIndex(snapshot)
+            self._device_indexes[device_id] = index
+        return index
+
+    def is_device_available(self, device_id: str) -> bool:
+        """Check if a device has usable data.
+
+        A device stays available with its last good snapshot until it fails
+        DEVICE_MAX_CONSECUTIVE_ERRORS refreshes in a row.
+        """
+        if not self.data or device_id not in self.data:
+            return False
+        return self.get_device_state(device_id).error_count < DEVICE_MAX_CONSECUTIVE_ERRORS
+
+    def _get_entity_state(self, device_id: str) -> Tuple[bool, Optional[datetime]]:
+        """Get the availability and stale time shown by the entities of a device."""
+        return (
+            self.is_device_available(device_id),
+            self.get_device_state(device_id).stale_since,
+        )
+
+    @property
+    def skipped_state_writes(self) -> int:
+        """Get the number of entity state writes skipped as unchanged."""
+        return self._skipped_state_writes
+
+    def _is_listener_update_needed(self, context: Any) -> bool:
+        """Check if a listener needs an update for the latest data.
+
+        Listeners of IXField entities use a (device_id, names) context, see
+        entity_helper.create_coordinator_context. Other listeners always update.
+        """
+        if not context:
+            return True
+        device_id, names = context
+
+        if self._get_entity_state(device_id) != self._notified_states.get(device_id):
+            return True
+
+        snapshot = (self.data or {}).get(device_id)
+        if device_id not in self._device_changes:
+            return True
+        changes_snapshot, changes = self._device_changes[device_id]
+        if changes_snapshot is not snapshot or changes is None:
+            return True
+        return not changes.isdisjoint(names)
+
+    @callback
+    def async_update_listeners(self, device_ids: Optional[Set[str]] = None) -> None:
+        """Update the listeners whose device data changed.
+
+        Args:
+            device_ids: Only update the listeners of these devices, and listeners
+                not bound to a device, e.g. after a refresh of these devices
+        """
+        skipped = 0
+        for update_callback, context in list(self._listeners.values()):
+            if device_ids is not None and context and context[0] not in device_ids:
+                continue
+            if self._is_listener_update_needed(context):
+                update_callback()
+            else:
+                skipped += 1
+        self._skipped_state_writes += skipped
+        if skipped:
+            _LOGGER.debug("Skipped %d unchanged entity state writes", skipped)
+
+        # Everything up to now has been notified
+        data = self.data or {}
+        if device_ids is None:
+            device_ids = set(self.device_ids)
+        for device_id in device_ids:
+            if device_id in data:
+                self._device_changes[device_id] = (data[device_id], set())
+            self._notified_states[device_id] = self._get_entity_state(device_id)
+
+        for device_id in device_ids:
+            for snapshot_callback in list(self._snapshot_listeners.get(device_id, ())):
+                snapshot_callback()
+
+    @callback
+    def async_add_snapshot_listener(
+        self, device_id: str, snapshot_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for every refresh of a device, even when nothing changed.
+
+        Used to confirm commands as soon as the cloud reports them.
+
+        Returns:
+            Function removing the listener
+        """
+        listeners = self._snapshot_listeners.setdefault(device_id, [])
+        listeners.append(snapshot_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(snapshot_callback)
+            if not listeners:
+                self._snapshot_listeners.pop(device_id, None)
+
+        return remove_listener
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        """Get the maximum number of device requests running at once."""
+        return self._max_concurrent_requests
+
+    def get_fetch_stats(self) -> Dict[str, Any]:
+        """Get fetch timings (in seconds) of the last refresh and request counts."""
+        return {
+            "max_concurrent_requests": self._max_concurrent_requests,
+            "device_batch_size": self._device_batch_size,
+            "refresh_time": self._last_refresh_time,
+            "device_fetch_times": dict(self._device_fetch_times),
+            "poll_schedules": {
+                device_id: schedule.as_dict()
+                for device_id, schedule in self._poll_schedules.items()
+            },
+            "api_requests": self.api.request_stats,
+        }
+
+    def _get_poll_interval(
+        self, schedule: DevicePollSchedule, snapshot: Optional[Dict[str, Any]], now: float
+    ) -> Tuple[float, str]:
+        """Get the seconds until the next poll of a device, and why."""
+        base = self.update_interval.total_seconds()
+        if schedule.offline_polls:
+            # Capping the exponent keeps the float multiplication finite
+            backoff = base * 2 ** min(schedule.offline_polls, 16)
+            return min(backoff, max(base, POLL_OFFLINE_MAX_INTERVAL)), "offline"
+
+        device = ((snapshot or {}).get("data") or {}).get("device") or {}
+        live_data = device.get("liveDeviceData") or {}
+        if live_data.get("runningServiceSequence") or schedule.is_active(now):
+            return min(base, POLL_INTERVAL_ACTIVE), "active"
+        if schedule.unchanged_polls >= POLL_IDLE_AFTER_UNCHANGED:
+            return base * POLL_IDLE_FACTOR, "idle"
+        return base, "normal"
+
+    def _update_poll_schedules(
+        self, device_ids: List[str], data: Dict[str, Any], errors: Dict[str, str]
+    ) -> None:
+        """Plan the next polls of just refreshed devices.
+
+        Changed controls or device fields make a device active, a poll without
+        any change counts towards idling. Failed polls keep the counters.
+
+        Devices refreshed together outside of the schedule, e.g. on setup, get
+        their own slot within their interval, with some jitter, so the next
+        polls trickle in instead of all firing at once. A device is never due
+        later than its interval, scheduled polls keep the slot of a device.
+        """
+        if self.update_interval is None:
+            return
+        now = time.monotonic()
+        slots = 1 if self._scheduled_refresh else len(device_ids)
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        for slot, device_id in enumerate(device_ids):
+            schedule = self.get_poll_schedule(device_id)
+            if device_id not in errors:
+                # The first poll has nothing to compare with
+                _, changes = self._device_changes.get(device_id, (None, None))
+                if schedule.last_poll is not None:
+                    if changes == set():
+                        schedule.unchanged_polls += 1
+                    else:
+                        schedule.unchanged_polls = 0
+                        index = self._device_indexes.get(device_id)
+                        controls = index.controls if index else {}
+                        if changes is None or not changes.isdisjoint(controls):
+                            schedule.last_activity = now
+                schedule.last_poll = now
+                connection_status = self.get_device_info(device_id).get(
+                    "connection_status"
+                )
+                if connection_status == CONNECTION_STATUS_OFFLINE:
+                    schedule.offline_polls += 1
+                else:
+                    schedule.offline_polls = 0
+
+            schedule.interval, schedule.reason = self._get_poll_interval(
+                schedule, data.get(device_id), now
+            )
+            delay = schedule.interval
+            if slots > 1:
+                delay *= (slot + 1 - POLL_SLOT_JITTER * random.random()) / slots
+            schedule.next_due = now + delay
+            if debug:
+                _LOGGER.debug(
+                    "Next poll of device %s in %.0fs (every %.0fs, %s)",
+                    device_id,
+                    delay,
+                    schedule.interval,
+                    schedule.reason,
+                )
+
+    def _get_due_device_ids(self) -> List[str]:
+        """Get the devices due for a poll, including those due shortly."""
+        due = time.monotonic() + POLL_DUE_TOLERANCE
+        return [
+            device_id
+            for device_id in self.device_ids
+            if self.get_poll_schedule(device_id).next_due <= due
+        ]
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh for when the first device is due."""
+        if self.update_interval is None or not self._poll_schedules:
+            super()._schedule_refresh()
+            return
+        if self.config_entry and self.config_entry.pref_disable_polling:
+            return
+
+        self._async_unsub_refresh()
+        next_due = min(
+            self.get_poll_schedule(device_id).next_due for device_id in self.device_ids
+        )
+        delay = max(next_due - time.monotonic(), POLL_DUE_TOLERANCE)
+        self._unsub_refresh = event.async_call_at(
+            self.hass, self._job, self.hass.loop.time() + delay
+        )
+
+    async def _handle_refresh_interval(self, _now: datetime) -> None:
+        """Handle a scheduled refresh, which only polls the due devices."""
+        self._scheduled_refresh = True
+        try:
+            await super()._handle_refresh_interval(_now)
+        finally:
+            self._scheduled_refresh = False
+
+    async def async_config_entry_first_refresh(self) -> None:
+        """Refresh data for the first time when a config entry is set up.
+
+        Raises ConfigEntryNotReady unless every device was fetched, so setup is
+        retried. Devices without data would get no entities until a reload.
+        """
+        await super().async_config_entry_first_refresh()
+        missing = [
+            device_id for device_id in self.device_ids if device_id not in self.data
+        ]
+        if missing:
+            raise ConfigEntryNotReady(f"No data for devices {', '.join(missing)}")
+
+    async def async_restore_snapshot(self) -> bool:
+        """Restore the last good data saved by a previous run.
+
+        Restored devices are marked stale until a live refresh succeeds.
+
+        Returns:
+            bool: True if data of every device was restored. Devices missing
+                from the snapshot, e.g. added since it was saved, need the
+                first refresh before their entities can be set up.
+        """
+        if self._snapshot_store is None:
+            return False
+
+        try:
+            stored = await self._snapshot_store.async_load()
+        except Exception as e:
+            _LOGGER.warning(f"Failed to load stored device snapshot: {e}")
+            return False
+        if not stored:
+            return False
+
+        stored_data = stored.get("data") or {}
+        stored_device_info = stored.get("device_info") or {}
+        last_success = stored.get("last_success") or {}
+        data = {
+            device_id: stored_data[device_id]
+            for device_id in self.device_ids
+            if stored_data.get(device_id)
+        }
+        if not data:
+            return False
+
+        for device_id in data:
+            self.get_device_state(device_id).record_restored(
+                dt_util.parse_datetime(last_success.get(device_id) or "")
+            )
+        self._device_info = {
+            device_id: stored_device_info.get(device_id, {}) for device_id in data
+        }
+        self._device_indexes = {
+            device_id: DeviceSnapshotIndex(snapshot)
+            for device_id, snapshot in data.items()
+        }
+        self._device_changes = {}
+        self.data = data
+        self._construct_device_names()
+
+        _LOGGER.info(
+            f"Restored stored data of {len(data)}/{len(self.device_ids)} devices"
+        )
+        return len(data) == len(self.device_ids)
+
+    @callback
+    def _async_schedule_snapshot_save(self) -> None:
+        """Schedule saving the current data for the next warm start."""
+        if self._snapshot_store is not None:
+            self._snapshot_store.async_delay_save(
+                self._snapshot_to_store, SNAPSHOT_SAVE_DELAY
+            )
+
+    @callback
+    def _snapshot_to_store(self) -> Dict[str, Any]:
+        """Get the data to persist for the next warm start."""
+        last_success = {}
+        for device_id in self.data or {}:
+            success = self.get_device_state(device_id).last_success
+            if success is not None:
+                last_success[device_id] = success.isoformat()
+        return {
+            "data": self.data or {},
+            "device_info": self._device_info,
+            "last_success": last_success,
+        }
+
     def _extract_device_info(
         self, device_data: Dict[str, Any], device_id: str
     ) -> Dict[str, Any]:
@@ -182,16 +779,8 @@ class IxfieldCoordinator(DataUpdateCoordinator):
             "name": device.get("name"),
             "type": device.get("type"),
             "controller": device.get("controller"),
-            "operating_mode": device.get("operatingMode"),
             "in_operation_since": device.get("inOperationSince"),
-            "connection_status": device.get("connectionStatus"),
-            "connection_status_changed": device.get("connectionStatusChangedTime"),
-            "controls_enabled": device.get("controlsEnabled"),
-            "controls_override_enabled": device.get("isControlsOverrideEnabled"),
-            "control_override_start": device.get("controlOverrideStart"),
-            "configuration_in_progress": device.get("isConfigurationJobInProgress"),
-            "data_propagation_failed": device.get("dataPropagationFailed"),
-            "need_propagate_device_data": device.get("needPropagateDeviceData"),
+            **self._extract_live_device_info(device),
             "grafana_link": device.get("grafanaLink"),
         }
 
@@ -243,35 +832,309 @@ class IxfieldCoordinator(DataUpdateCoordinator):
 
         return device_info
 
-    async def _async_update_data(self) -> Dict[str, Any]:
+    @staticmethod
+    def _extract_live_device_info(device: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the device information included in live data."""
+        return {
+            "operating_mode": device.get("operatingMode"),
+            "connection_status": device.get("connectionStatus"),
+            "connection_status_changed": device.get("connectionStatusChangedTime"),
+            "controls_enabled": device.get("controlsEnabled"),
+            "controls_override_enabled": device.get("isControlsOverrideEnabled"),
+            "control_override_start": device.get("controlOverrideStart"),
+            "configuration_in_progress": device.get("isConfigurationJobInProgress"),
+            "data_propagation_failed": device.get("dataPropagationFailed"),
+            "need_propagate_device_data": device.get("needPropagateDeviceData"),
+        }
+
+    def _get_live_device_ids(self, device_ids: List[str]) -> Set[str]:
+        """Get the devices whose full data is recent enough to only fetch live data."""
+        now = time.monotonic()
+        return {
+            device_id
+            for device_id in device_ids
+            if device_id in (self.data or {})
+            and device_id in self._metadata_fetch_times
+            and now - self._metadata_fetch_times[device_id] < METADATA_REFRESH_INTERVAL
+        }
+
+    async def _async_fetch_device(
+        self, device_id: str, live_only: bool, semaphore: asyncio.Semaphore
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch data for a single device, limited by the shared semaphore."""
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                return await self.api.async_get_device(device_id, live_only=live_only)
+            finally:
+                self._device_fetch_times[device_id] = time.monotonic() - start
+                _LOGGER.debug(
+                    "Fetched device %s in %.3fs",
+                    device_id,
+                    self._device_fetch_times[device_id],
+                )
+
+    async def _async_fetch_batch(
+        self, device_ids: List[str], live_only: bool, semaphore: asyncio.Semaphore
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Fetch data for a batch of devices in a single request."""
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                return await self.api.async_get_devices_batch(
+                    device_ids, live_only=live_only
+                )
+            finally:
+                elapsed = time.monotonic() - start
+                for device_id in device_ids:
+                    self._device_fetch_times[device_id] = elapsed
+                _LOGGER.debug("Fetched devices %s in %.3fs", device_ids, elapsed)
+
+    async def _async_fetch_devices(
+        self, device_ids: List[str], live_device_ids: Set[str]
+    ) -> List[Any]:
+        """Fetch devices, returning the data or exception of each.
+
+        Only the live data is fetched for the devices in live_device_ids.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+
+        if self._device_batch_size == 1:
+            return await asyncio.gather(
+                *(
+                    self._async_fetch_device(
+                        device_id, device_id in live_device_ids, semaphore
+                    )
+                    for device_id in device_ids
+                ),
+                return_exceptions=True,
+            )
+
+        # Batches can only share a query if they fetch the same fields
+        batches = []
+        for live_only in (False, True):
+            group = [
+                device_id
+                for device_id in device_ids
+                if (device_id in live_device_ids) == live_only
+            ]
+            batches.extend(
+                (group[index : index + self._device_batch_size], live_only)
+                for index in range(0, len(group), self._device_batch_size)
+            )
+        batch_results = await asyncio.gather(
+            *(
+                self._async_fetch_batch(batch, live_only, semaphore)
+                for batch, live_only in batches
+            ),
+            return_exceptions=True,
+        )
+
+        results: Dict[str, Any] = {}
+        for (batch, _), batch_result in zip(batches, batch_results):
+            for device_id in batch:
+                if isinstance(batch_result, Exception):
+                    results[device_id] = batch_result
+                else:
+                    results[device_id] = batch_result.get(device_id)
+        return [results[device_id] for device_id in device_ids]
+
+    def _process_results(
+        self, device_ids: List[str], results: List[Any], live_device_ids: Set[str]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, str]]:
+        """Record the fetch results of devices.
+
+        Live data of the devices in live_device_ids is merged into their
+        last snapshot.
+
+        Returns:
+            The data and device info of the devices, with the last good snapshot
+            of failed devices, and the errors of the failed devices
+        """
+        previous_data = self.data or {}
         data = {}
         device_info = {}
+        errors: Dict[str, str] = {}
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
-        for device_id in self.device_ids:
-            try:
-                device_data = await self.api.async_get_device(device_id)
-                _LOGGER.debug(f"Received device data for {device_id}: {device_data}")
-                if device_data is None:
-                    _LOGGER.error(f"API returned None for device {device_id}")
+        for device_id, device_data in zip(device_ids, results):
+            device_state = self.get_device_state(device_id)
+            if isinstance(device_data, Exception):
+                _LOGGER.error(f"Error updating device {device_id}: {device_data}")
+                errors[device_id] = str(device_data)
+            elif device_data is None:
+                _LOGGER.error(f"API returned None for device {device_id}")
+                errors[device_id] = "API returned no data"
+            else:
+                if debug:
+                    _LOGGER.debug(
+                        "Received device data for %s: %s", device_id, device_data
+                    )
+                device_state.record_success()
+                if device_id in live_device_ids:
+                    data[device_id] = merge_live_device_data(
+                        previous_data[device_id], device_data
+                    )
+                    # Only the live part of the device info can have changed
+                    live_device = device_data.get("data", {}).get("device") or {}
+                    device_info[device_id] = {
+                        **self._device_info.get(device_id, {}),
+                        **self._extract_live_device_info(live_device),
+                    }
                     continue
-
                 data[device_id] = device_data
+                self._metadata_fetch_times[device_id] = time.monotonic()
                 # Extract and store device info
                 device_info[device_id] = self._extract_device_info(
                     device_data, device_id
                 )
+                continue
+
+            device_state.record_failure(errors[device_id])
+            # Keep the last good snapshot of a failed device
+            if device_id in previous_data:
+                data[device_id] = previous_data[device_id]
+                device_info[device_id] = self._device_info.get(device_id, {})
+                _LOGGER.warning(
+                    f"Using stale data for device {device_id} from "
+                    f"{device_state.last_success} ({device_state.error_count} failed refreshes)"
+                )
+
+        return data, device_info, errors
+
+    def _index_snapshots(self, data: Dict[str, Any]) -> Tuple[
+        Dict[str, DeviceSnapshotIndex], Dict[str, Tuple[Any, Optional[Set[str]]]]
+    ]:
+        """Index new device snapshots and find what changed.
 
-            except Exception as err:
-                _LOGGER.error(f"Error updating device {device_id}: {err}")
-                raise UpdateFailed(f"Error updating device {device_id}: {err}")
+        Snapshots kept from an earlier refresh keep their index.
+        """
+        indexes = {}
+        changes = {}
+        for device_id, device_data in data.items():
+            previous_index = self._device_indexes.get(device_id)
+            if previous_index is not None and previous_index.snapshot is device_data:
+                index = previous_index
+            else:
+                index = DeviceSnapshotIndex(device_data)
+            indexes[device_id] = index
+            changes[device_id] = (device_data, index.diff(previous_index))
+        return indexes, changes
+
+    async def async_refresh_devices(self, device_ids: List[str]) -> Dict[str, str]:
+        """Refresh only the given devices and merge them into the data.
+
+        Only the listeners of these devices are updated. Unlike a full
+        refresh, this does not fail if the devices cannot be fetched, they
+        keep their last good snapshot.
+
+        Returns:
+            The errors of the devices that could not be fetched
+        """
+        device_ids = [
+            device_id for device_id in self.device_ids if device_id in device_ids
+        ]
+        if not device_ids:
+            return {}
+
+        live_device_ids = self._get_live_device_ids(device_ids)
+        results = await self._async_fetch_devices(device_ids, live_device_ids)
+        data, device_info, errors = self._process_results(
+            device_ids, results, live_device_ids
+        )
+        if errors:
+            _LOGGER.warning(f"Failed to refresh devices {list(errors)}")
+
+        indexes, changes = self._index_snapshots(data)
+        self._device_info = {**self._device_info, **device_info}
+        self._device_indexes = {**self._device_indexes, **indexes}
+        self._device_changes = {**self._device_changes, **changes}
+        self._construct_device_names()
+        self.data = {**(self.data or {}), **data}
+        self._update_poll_schedules(device_ids, self.data, errors)
+        # The devices may now be due sooner than the scheduled refresh
+        if self._unsub_refresh is not None:
+            self._schedule_refresh()
+
+        if any(device_changes != set() for _, device_changes in changes.values()):
+            self._async_schedule_snapshot_save()
+        self.async_update_listeners(set(device_ids))
+        return errors
+
+    async def async_request_device_refresh(self, device_id: str) -> None:
+        """Request a refresh of a device after a command was sent to it.
+
+        Requests arriving within COMMAND_REFRESH_WINDOW seconds are merged into
+        one refresh of all requested devices, giving the cloud time to apply
+        the commands. Returns once the refresh serving the request is done.
+        """
+        self.get_poll_schedule(device_id).record_command()
+        self._command_refresh_device_ids.add(device_id)
+        if self._command_refresh is None:
+            self._command_refresh = asyncio.ensure_future(
+                self._async_command_refresh()
+            )
+        # A cancelled caller must not cancel the refresh of the others
+        await asyncio.shield(self._command_refresh)
 
-        # Update the device info cache
-        self._device_info = device_info
+    async def _async_command_refresh(self) -> None:
+        """Run a refresh requested by async_request_device_refresh."""
+        await asyncio.sleep(COMMAND_REFRESH_WINDOW)
+        device_ids = list(self._command_refresh_device_ids)
+        # Requests from now on need data fetched after their command
+        self._command_refresh_device_ids = set()
+        self._command_refresh = None
+        _LOGGER.debug("Refreshing devices %s after commands", device_ids)
+        await self.async_refresh_devices(device_ids)
+
+    async def _async_update_data(self) -> Dict[str, Any]:
+        # Scheduled refreshes poll the due devices, all others every device
+        if self._scheduled_refresh:
+            device_ids = self._get_due_device_ids()
+            if not device_ids:
+                return self.data
+        else:
+            device_ids = self.device_ids
+
+        start = time.monotonic()
+        live_device_ids = self._get_live_device_ids(device_ids)
+        results = await self._async_fetch_devices(device_ids, live_device_ids)
+        self._last_refresh_time = time.monotonic() - start
+        _LOGGER.debug(
+            "Fetched %d devices in %.3fs (max %d concurrent requests, batch size %d)",
+            len(device_ids),
+            self._last_refresh_time,
+            self._max_concurrent_requests,
+            self._device_batch_size,
+        )
+
+        data, device_info, errors = self._process_results(
+            device_ids, results, live_device_ids
+        )
+
+        # Fail the whole refresh only if no device could be fetched
+        if errors and all(
+            self.get_device_state(device_id).error_count
+            for device_id in self.device_ids
+        ):
+            self._update_poll_schedules(device_ids, self.data or {}, errors)
+            device_id, error = next(iter(errors.items()))
+            raise UpdateFailed(f"Error updating device {device_id}: {error}")
+
+        # Devices not polled keep their snapshot
+        data = {**(self.data or {}), **data}
+        self._device_info = {**self._device_info, **device_info}
+        self._device_indexes, self._device_changes = self._index_snapshots(data)
+        self._update_poll_schedules(device_ids, data, errors)
 
         # Reconstruct device names based on updated device info
         self._construct_device_names()
 
-        _LOGGER.debug(f"Final coordinator data: {data}")
-        _LOGGER.debug(f"Final device info: {device_info}")
-        _LOGGER.debug(f"Final device names: {self._device_names}")
+        if any(changes != set() for _, changes in self._device_changes.values()):
+            self._async_schedule_snapshot_save()
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Final coordinator data: %s", data)
+            _LOGGER.debug("Final device info: %s", device_info)
+            _LOGGER.debug("Final device names: %s", self._device_names)
         return data
@@ -4,7 +4,12 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, IXFIELD_DEVICE_URL
-from .entity_helper import EntityNamingMixin, create_unique_id, create_device_info
+from .entity_helper import (
+    EntityNamingMixin,
+    create_coordinator_context,
+    create_unique_id,
+    create_device_info,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -194,7 +199,8 @@ class DeviceInfoSensor(CoordinatorEntity, SensorEntity, EntityNamingMixin):
     ):
         # Setup entity naming before super().__init__()
         self.setup_entity_naming(device_name, sensor_id, "sensor", sensor_name)
-        super().__init__(coordinator)
+        # Device info only changes with the device itself, not with its sensors
+        super().__init__(coordinator, create_coordinator_context(device_id))
 
         self._device_id = device_id
         self._device_name = device_name
@@ -259,10 +265,9 @@ class DeviceInfoSensor(CoordinatorEntity, SensorEntity, EntityNamingMixin):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        super()._handle_coordinator_update()
-        # Update the value and force a state update
+        # Update the value, super() writes the state
         self._update_value_from_device_info()
-        self.async_write_ha_state()
+        super()._handle_coordinator_update()
 
     @property
     def device_info(self):
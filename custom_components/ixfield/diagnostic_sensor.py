@@ -0,0 +1,47 @@
+"""Diagnostic sensors of the IXField cloud connection."""
+import logging
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.helpers.entity import EntityCategory
+
+from .circuit_breaker import CIRCUIT_BREAKER_STATES
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CloudApiStatusSensor(SensorEntity):
+    """Sensor showing the circuit breaker state of the IXField cloud API."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:cloud-check-outline"
+    _attr_options = CIRCUIT_BREAKER_STATES
+    _attr_should_poll = False
+
+    def __init__(self, coordinator, entry_id):
+        self._coordinator = coordinator
+        self._api = coordinator.api
+        self._attr_name = "IXField Cloud API"
+        self._attr_unique_id = f"{entry_id}_cloud_api_status"
+
+    async def async_added_to_hass(self) -> None:
+        """Update the state on circuit breaker changes and coordinator refreshes.
+
+        Refreshes update the request counters of the attributes.
+        """
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._api.circuit_breaker.add_listener(self.async_write_ha_state)
+        )
+        self.async_on_remove(
+            self._coordinator.async_add_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self):
+        """Return the circuit breaker state."""
+        return self._api.circuit_breaker.state
+
+    @property
+    def extra_state_attributes(self):
+        """Return circuit breaker and request counters."""
+        return {**self._api.circuit_breaker.as_dict(), **self._api.request_stats}
@@ -0,0 +1,34 @@
+"""Diagnostics support for IXField."""
+from typing import Any, Dict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_EMAIL, CONF_PASSWORD, DOMAIN
+
+REDACTED = "**REDACTED**"
+TO_REDACT = {CONF_EMAIL, CONF_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return the polling, fetch and update state of a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    return {
+        "entry": {
+            "data": {
+                key: REDACTED if key in TO_REDACT else value
+                for key, value in entry.data.items()
+            },
+            "options": dict(entry.options),
+        },
+        "last_update_success": coordinator.last_update_success,
+        "skipped_state_writes": coordinator.skipped_state_writes,
+        "circuit_breaker": coordinator.api.circuit_breaker.as_dict(),
+        "fetch_stats": coordinator.get_fetch_stats(),
+        "devices": {
+            device_id: coordinator.get_device_state(device_id).as_dict()
+            for device_id in coordinator.device_ids
+        },
+    }
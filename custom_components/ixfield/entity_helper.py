@@ -29,6 +29,24 @@ def create_unique_id(
     return unique_id
 
 
+def create_coordinator_context(device_id: str, *names: str) -> tuple:
+    """
+    Create the coordinator listener context of an entity.
+
+    The coordinator only notifies the entity when its device became
+    (un)available, the device itself changed, or one of the named
+    sensors/controls changed.
+
+    Args:
+        device_id: The device ID
+        names: The sensor/control names the entity state depends on
+
+    Returns:
+        Listener context tuple
+    """
+    return (device_id, frozenset(names))
+
+
 def get_operating_values(coordinator, device_id: str) -> list:
     """
     Get operating values (sensors) for a device from coordinator data.
@@ -230,6 +248,49 @@ class EntityCommonAttrsMixin:
             self._attr_mode = config["mode"]
 
 
+class EntityDeviceStateMixin:
+    """Mixin to show the update state of their device on IXField entities.
+
+    Entities are available while their device has usable data, and marked
+    stale while that data comes from a failed refresh or a previous run.
+    Must come before CoordinatorEntity in the bases to override its available.
+    """
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return self.coordinator.is_device_available(self._device_id)
+
+    def get_device_refresh_callbacks(self) -> dict:
+        """
+        Get the callbacks verifying commands with refreshes of the device.
+
+        Returns:
+            The coordinator_refresh and snapshot_listener arguments of
+            OptimisticStateManager.execute_with_optimistic_update
+        """
+        return {
+            "coordinator_refresh": lambda: self.coordinator.async_request_device_refresh(
+                self._device_id
+            ),
+            "snapshot_listener": lambda check: self.coordinator.async_add_snapshot_listener(
+                self._device_id, check
+            ),
+        }
+
+    @property
+    def extra_state_attributes(self):
+        """Return since when the device data is stale, if it is."""
+        device_state = self.coordinator.get_device_state(self._device_id)
+        if not device_state.is_stale:
+            return None
+        stale_since = device_state.stale_since
+        return {
+            "stale": True,
+            "stale_since": stale_since.isoformat() if stale_since else None,
+        }
+
+
 class EntityValueMixin:
     """Mixin to handle common value property logic for IXField entities."""
 
@@ -247,25 +308,8 @@ class EntityValueMixin:
         Returns:
             The sensor value or fallback_value
         """
-        device_data = self.coordinator.data.get(self._device_id, {})
-        if not device_data or "data" not in device_data:
-            return fallback_value
-
-        device = device_data.get("data", {}).get("device", {})
-        operating_values = device.get("liveDeviceData", {}).get("operatingValues", [])
-
-        for sensor in operating_values:
-            if sensor.get("name") == sensor_name:
-                value = sensor.get(value_key)
-                # Try to convert to float if numeric
-                if value is not None:
-                    try:
-                        return float(value)
-                    except (TypeError, ValueError):
-                        return value
-                return value
-
-        return fallback_value
+        index = self.coordinator.get_device_index(self._device_id)
+        return index.get_sensor_value(sensor_name, value_key, fallback_value)
 
     def get_control_value(
         self, control_name: str, value_key: str = "value", fallback_value=None
@@ -281,19 +325,8 @@ class EntityValueMixin:
         Returns:
             The control value or fallback_value
         """
-        device_data = self.coordinator.data.get(self._device_id, {})
-        if not device_data or "data" not in device_data:
-            return fallback_value
-
-        device = device_data.get("data", {}).get("device", {})
-        controls = device.get("liveDeviceData", {}).get("controls", [])
-
-        for control in controls:
-            if control.get("name") == control_name:
-                value = control.get(value_key)
-                return value
-
-        return fallback_value
+        index = self.coordinator.get_device_index(self._device_id)
+        return index.get_control_value(control_name, value_key, fallback_value)
 
 
 class BaseIxfieldEntity:
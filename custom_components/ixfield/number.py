@@ -7,8 +7,10 @@ from homeassistant.const import UnitOfTemperature
 from .const import DOMAIN, IXFIELD_DEVICE_URL
 from .entity_helper import (
     EntityCommonAttrsMixin,
+    EntityDeviceStateMixin,
     EntityNamingMixin,
     EntityValueMixin,
+    create_coordinator_context,
     create_unique_id,
     get_operating_values,
     create_device_info,
@@ -103,6 +105,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
 
 class IxfieldNumber(
+    EntityDeviceStateMixin,
     CoordinatorEntity,
     NumberEntity,
     EntityNamingMixin,
@@ -116,7 +119,9 @@ class IxfieldNumber(
 
     def __init__(self, coordinator, device_id, device_name, sensor_name, config):
         """Initialize the number entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, create_coordinator_context(device_id, sensor_name)
+        )
         self._device_id = device_id
         self._device_name = device_name
         self._sensor_name = sensor_name
@@ -219,7 +224,7 @@ class IxfieldNumber(
             ),
             verification_call=lambda: self.get_sensor_value(self._sensor_name, "desiredValue"),
             value_comparison=float_comparison_with_tolerance,
-            coordinator_refresh=self.coordinator.async_request_refresh,
+            **self.get_device_refresh_callbacks(),
             entity_state_update=self.async_write_ha_state,
         )
 
@@ -3,6 +3,12 @@ import asyncio
 import logging
 from typing import Any, Awaitable, Callable, Optional
 
+from .const import (
+    COMMAND_VERIFY_POLL_INITIAL,
+    COMMAND_VERIFY_POLL_MAX,
+    COMMAND_VERIFY_TIMEOUT,
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -15,6 +21,8 @@ class OptimisticStateManager:
         self.entity_type = entity_type
         self._optimistic_value: Optional[Any] = None
         self._pending_operation = False
+        # Set when the pending operation is verified or replaced by a newer one
+        self._operation_done: Optional[asyncio.Event] = None
         self._entity_ref = None  # Reference to the entity for state updates
 
     def set_entity_ref(self, entity_ref):
@@ -23,15 +31,25 @@ class OptimisticStateManager:
 
     def get_current_value(self, coordinator_value: Any) -> Any:
         """Get the current value, using optimistic value if available."""
+        # Called on every state read, so skip the logging calls when not debugging
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
         if self._pending_operation and self._optimistic_value is not None:
-            _LOGGER.debug(
-                f"{self.entity_type} {self.entity_name} using optimistic value: {self._optimistic_value}"
-            )
+            if debug:
+                _LOGGER.debug(
+                    "%s %s using optimistic value: %s",
+                    self.entity_type,
+                    self.entity_name,
+                    self._optimistic_value,
+                )
             return self._optimistic_value
 
-        _LOGGER.debug(
-            f"{self.entity_type} {self.entity_name} using coordinator value: {coordinator_value}"
-        )
+        if debug:
+            _LOGGER.debug(
+                "%s %s using coordinator value: %s",
+                self.entity_type,
+                self.entity_name,
+                coordinator_value,
+            )
         return coordinator_value
 
     def is_operation_pending(self) -> bool:
@@ -44,32 +62,47 @@ class OptimisticStateManager:
         api_call: Callable[[], Awaitable[bool]],
         verification_call: Callable[[], Any],
         value_comparison: Callable[[Any, Any], bool] = None,
-        delay_before_refresh: float = 2.0,
-        delay_before_verification: float = 1.0,
         coordinator_refresh: Callable[[], Awaitable[None]] = None,
         entity_state_update: Callable[[], None] = None,
+        snapshot_listener: Callable[[Callable[[], None]], Callable[[], None]] = None,
+        verification_timeout: Optional[float] = None,
     ) -> bool:
         """
         Execute an operation with optimistic state updates.
 
+        A new operation replaces a pending one: the new target value is shown
+        and verified, and the replaced operation stops waiting for its own.
+
         Args:
             target_value: The target value to set
             api_call: Async function that makes the API call, returns success bool
             verification_call: Function that gets the actual value for verification
             value_comparison: Function to compare expected vs actual values (default: equality)
-            delay_before_refresh: Seconds to wait before refreshing coordinator data
-            delay_before_verification: Seconds to wait before verifying the state
-            coordinator_refresh: Async function to refresh coordinator data
+            coordinator_refresh: Async function to refresh coordinator data, e.g.
+                IxfieldCoordinator.async_request_device_refresh which already
+                waits for the cloud to apply the command and merges the
+                refreshes of concurrent operations
             entity_state_update: Function to force entity state update
+            snapshot_listener: Function registering a callback for new device
+                snapshots and returning its remover, e.g.
+                IxfieldCoordinator.async_add_snapshot_listener, so the state is
+                verified as soon as any refresh reports it
+            verification_timeout: Seconds to keep refreshing until the state is
+                verified (default: COMMAND_VERIFY_TIMEOUT)
 
         Returns:
             bool: True if operation was successful, False otherwise
         """
-        if self._pending_operation:
-            _LOGGER.warning(
-                f"{self.entity_type} {self.entity_name} operation already in progress, ignoring new request"
+        if self._operation_done is not None:
+            _LOGGER.debug(
+                "%s %s replacing pending operation", self.entity_type, self.entity_name
             )
-            return False
+            self._operation_done.set()
+        operation_done = asyncio.Event()
+        self._operation_done = operation_done
+
+        def is_replaced() -> bool:
+            return self._operation_done is not operation_done
 
         _LOGGER.info(f"Setting {self.entity_type} {self.entity_name} to {target_value}")
 
@@ -88,43 +121,48 @@ class OptimisticStateManager:
             # Send the API request
             success = await api_call()
 
-            if success:
+            if is_replaced():
+                _LOGGER.debug(
+                    "%s %s %s replaced by a newer value",
+                    self.entity_type,
+                    self.entity_name,
+                    target_value,
+                )
+            elif success:
                 _LOGGER.info(
                     f"Successfully sent {target_value} command to {self.entity_name}"
                 )
 
-                # Wait for cloud state to update
-                if delay_before_refresh > 0:
-                    await asyncio.sleep(delay_before_refresh)
-
-                # Refresh coordinator data
-                if coordinator_refresh:
-                    await coordinator_refresh()
-
-                # Wait a bit more and verify the state
-                if delay_before_verification > 0:
-                    await asyncio.sleep(delay_before_verification)
-
-                # Verify the state change was successful
-                actual_value = verification_call()
-
-                # Use custom comparison function or default equality
-                if value_comparison:
-                    is_verified = value_comparison(target_value, actual_value)
-                else:
-                    is_verified = target_value == actual_value
-
-                if is_verified:
+                def is_verified() -> bool:
+                    actual_value = verification_call()
+                    # Use custom comparison function or default equality
+                    if value_comparison:
+                        return value_comparison(target_value, actual_value)
+                    return target_value == actual_value
+
+                if await self._async_wait_for_verification(
+                    is_verified,
+                    coordinator_refresh,
+                    snapshot_listener,
+                    COMMAND_VERIFY_TIMEOUT
+                    if verification_timeout is None
+                    else verification_timeout,
+                    operation_done,
+                ):
                     _LOGGER.info(
                         f"{self.entity_type} {self.entity_name} state change verified successfully"
                     )
+                elif is_replaced():
+                    _LOGGER.debug(
+                        "%s %s %s replaced by a newer value",
+                        self.entity_type,
+                        self.entity_name,
+                        target_value,
+                    )
                 else:
                     _LOGGER.warning(
-                        f"{self.entity_type} {self.entity_name} state verification failed. Expected: {target_value}, Actual: {actual_value}"
+                        f"{self.entity_type} {self.entity_name} state verification failed. Expected: {target_value}, Actual: {verification_call()}"
                     )
-                    # Force another refresh to get the correct state
-                    if coordinator_refresh:
-                        await coordinator_refresh()
             else:
                 _LOGGER.error(
                     f"Failed to send {target_value} command to {self.entity_name}"
@@ -136,20 +174,112 @@ class OptimisticStateManager:
             _LOGGER.error(
                 f"Exception while setting {self.entity_name} to {target_value}: {e}"
             )
-            # Revert optimistic value on exception
-            self._revert_optimistic_state(entity_state_update)
+            # Revert optimistic value on exception, unless a newer value is shown
+            if not is_replaced():
+                self._revert_optimistic_state(entity_state_update)
         finally:
-            # Clear pending operation flag
-            self._pending_operation = False
-            self._optimistic_value = None
+            # The newer operation owns the optimistic state
+            if not is_replaced():
+                # Clear pending operation flag
+                self._operation_done = None
+                self._pending_operation = False
+                self._optimistic_value = None
+                # Show the coordinator value again, the coordinator only notifies
+                # the entity when the value changes
+                self._write_entity_state(entity_state_update)
 
         return success
 
+    async def _async_wait_for_verification(
+        self,
+        is_verified: Callable[[], bool],
+        coordinator_refresh: Optional[Callable[[], Awaitable[None]]],
+        snapshot_listener: Optional[
+            Callable[[Callable[[], None]], Callable[[], None]]
+        ],
+        timeout: float,
+        operation_done: asyncio.Event,
+    ) -> bool:
+        """Wait until the state is verified, the operation is replaced or the timeout expired.
+
+        Refreshes the device with exponentially growing pauses in between,
+        while any new snapshot, e.g. of a regular poll, is checked right away.
+
+        Returns:
+            bool: True if the state was verified
+        """
+        if is_verified():
+            return True
+        if not coordinator_refresh and not snapshot_listener:
+            return False
+
+        verified = False
+
+        def check_snapshot() -> None:
+            nonlocal verified
+            if not operation_done.is_set() and is_verified():
+                verified = True
+                operation_done.set()
+
+        remove_listener = snapshot_listener(check_snapshot) if snapshot_listener else None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        pause = COMMAND_VERIFY_POLL_INITIAL
+        try:
+            while not operation_done.is_set():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                if coordinator_refresh:
+                    await self._async_wait_for_event(
+                        operation_done, remaining, coordinator_refresh()
+                    )
+                    check_snapshot()
+                    remaining = deadline - loop.time()
+                    if operation_done.is_set() or remaining <= 0:
+                        break
+                await self._async_wait_for_event(
+                    operation_done, min(pause, remaining)
+                )
+                pause = min(pause * 2, COMMAND_VERIFY_POLL_MAX)
+        finally:
+            if remove_listener:
+                remove_listener()
+        return verified
+
+    async def _async_wait_for_event(
+        self,
+        event: asyncio.Event,
+        timeout: float,
+        refresh: Optional[Awaitable[None]] = None,
+    ) -> None:
+        """Wait for the event, up to the timeout or until the refresh is done."""
+        tasks = {asyncio.ensure_future(event.wait())}
+        refresh_task = asyncio.ensure_future(refresh) if refresh else None
+        if refresh_task:
+            tasks.add(refresh_task)
+        try:
+            await asyncio.wait(
+                tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for task in tasks:
+                task.cancel()
+        if refresh_task and refresh_task.done() and not refresh_task.cancelled():
+            if error := refresh_task.exception():
+                _LOGGER.warning(
+                    f"{self.entity_type} {self.entity_name} refresh failed: {error}"
+                )
+
     def _revert_optimistic_state(self, entity_state_update: Callable[[], None] = None):
         """Revert the optimistic state and update UI."""
         self._optimistic_value = None
 
         # Force UI update to revert the optimistic state
+        self._write_entity_state(entity_state_update)
+
+    def _write_entity_state(self, entity_state_update: Callable[[], None] = None):
+        """Write the entity state to update the UI."""
         if entity_state_update:
             entity_state_update()
         elif self._entity_ref and hasattr(self._entity_ref, "async_write_ha_state"):
@@ -0,0 +1,119 @@
+"""Client-side rate limiting of requests to the IXField cloud."""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .const import RATE_LIMIT_BURST, RATE_LIMIT_REQUESTS_PER_SECOND
+
+_LOGGER = logging.getLogger(__name__)
+
+# Request priorities, lower values are sent first
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+
+
+class RequestScheduler:
+    """Token bucket rate limiter that admits waiting requests by priority.
+
+    Requests are admitted immediately while tokens are available. Once the
+    bucket is empty, waiting requests are admitted as tokens refill, user
+    commands ahead of background polling and otherwise in arrival order.
+    """
+
+    def __init__(
+        self,
+        rate: float = RATE_LIMIT_REQUESTS_PER_SECOND,
+        burst: int = RATE_LIMIT_BURST,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens, i.e. requests sent at once
+        """
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+        self._delayed_requests = 0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get the number of waiting and of delayed requests."""
+        return {
+            "waiting": sum(1 for *_, future in self._waiters if not future.done()),
+            "delayed_requests": self._delayed_requests,
+        }
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    async def async_acquire(self, priority: int = PRIORITY_POLL) -> None:
+        """Wait until a request of the given priority may be sent."""
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._delayed_requests += 1
+        self._schedule_wakeup()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted but cancelled before sending, pass the token on
+                self._tokens = min(self._burst, self._tokens + 1)
+                self._release_waiters()
+            raise
+
+    def _schedule_wakeup(self) -> None:
+        """Schedule admitting waiting requests once a token is available."""
+        if self._wakeup is not None or not self._waiters:
+            return
+        delay = max(0.0, (1 - self._tokens) / self._rate)
+        self._wakeup = asyncio.get_running_loop().call_later(
+            delay, self._release_waiters
+        )
+
+    def _release_waiters(self) -> None:
+        """Admit waiting requests in priority order while tokens last."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        self._refill()
+        while self._waiters:
+            *_, future = self._waiters[0]
+            if future.done():
+                # Cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+            if self._tokens < 1:
+                break
+            heapq.heappop(self._waiters)
+            self._tokens -= 1
+            future.set_result(None)
+        self._schedule_wakeup()
+
+
+_scheduler: Optional[RequestScheduler] = None
+
+
+def get_request_scheduler() -> RequestScheduler:
+    """Get the scheduler shared by all IXField API clients in the process."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = RequestScheduler()
+    return _scheduler
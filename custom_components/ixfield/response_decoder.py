@@ -0,0 +1,68 @@
+"""Reading and decoding of IXField API responses."""
+import json
+from typing import Any, Callable, Optional
+
+import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JsonDecoder = Callable[[bytes], Any]
+
+JSON_DECODER_STDLIB = "json"
+JSON_DECODER_ORJSON = "orjson"
+
+# Bytes read from the response stream at once
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+
+class ResponseTooLargeError(Exception):
+    """Raised when a response body exceeds the size limit."""
+
+
+def get_json_decoder(name: Optional[str] = None) -> JsonDecoder:
+    """Get a JSON decoder by name.
+
+    Args:
+        name: JSON_DECODER_ORJSON or JSON_DECODER_STDLIB, by default orjson
+            if it is installed and the standard library decoder otherwise
+
+    Raises:
+        ValueError: If the decoder is unknown or not installed
+    """
+    if name is None:
+        name = JSON_DECODER_ORJSON if orjson is not None else JSON_DECODER_STDLIB
+    if name == JSON_DECODER_ORJSON:
+        if orjson is None:
+            raise ValueError("The orjson JSON decoder is not installed")
+        return orjson.loads
+    if name == JSON_DECODER_STDLIB:
+        return json.loads
+    raise ValueError(f"Unknown JSON decoder {name}")
+
+
+async def async_read_body(response: aiohttp.ClientResponse, max_size: int) -> bytes:
+    """Read the body of a response once, as bytes.
+
+    Raises:
+        ResponseTooLargeError: If the body is larger than max_size bytes, as
+            announced by Content-Length or while reading it
+    """
+    if response.content_length is not None and response.content_length > max_size:
+        raise ResponseTooLargeError(
+            f"Response of {response.content_length} bytes exceeds the limit "
+            f"of {max_size} bytes"
+        )
+
+    chunks = []
+    size = 0
+    async for chunk in response.content.iter_chunked(RESPONSE_CHUNK_SIZE):
+        size += len(chunk)
+        if size > max_size:
+            raise ResponseTooLargeError(
+                f"Response exceeds the limit of {max_size} bytes"
+            )
+        chunks.append(chunk)
+    return b"".join(chunks)
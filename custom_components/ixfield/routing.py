@@ -0,0 +1,47 @@
+"""Routing of device IDs to the coordinators of their config entries."""
+from typing import Dict, Optional
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .coordinator import IxfieldCoordinator
+
+DATA_DEVICE_COORDINATORS = f"{DOMAIN}_device_coordinators"
+
+
+@callback
+def async_get_device_coordinators(
+    hass: HomeAssistant,
+) -> Dict[str, IxfieldCoordinator]:
+    """Get the coordinators of all loaded config entries by device ID."""
+    return hass.data.setdefault(DATA_DEVICE_COORDINATORS, {})
+
+
+@callback
+def async_register_device_coordinator(
+    hass: HomeAssistant, coordinator: IxfieldCoordinator
+) -> None:
+    """Route the devices of a config entry to its coordinator."""
+    device_coordinators = async_get_device_coordinators(hass)
+    for device_id in coordinator.device_ids:
+        device_coordinators[device_id] = coordinator
+
+
+@callback
+def async_unregister_device_coordinator(
+    hass: HomeAssistant, coordinator: IxfieldCoordinator
+) -> None:
+    """Stop routing the devices of an unloaded config entry."""
+    device_coordinators = async_get_device_coordinators(hass)
+    for device_id in coordinator.device_ids:
+        # The device may have moved to another entry in the meantime
+        if device_coordinators.get(device_id) is coordinator:
+            del device_coordinators[device_id]
+
+
+@callback
+def async_get_device_coordinator(
+    hass: HomeAssistant, device_id: str
+) -> Optional[IxfieldCoordinator]:
+    """Get the coordinator of a device, None if no loaded entry has it."""
+    return async_get_device_coordinators(hass).get(device_id)
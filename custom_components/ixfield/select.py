@@ -6,8 +6,10 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN, IXFIELD_DEVICE_URL
 from .entity_helper import (
     EntityCommonAttrsMixin,
+    EntityDeviceStateMixin,
     EntityNamingMixin,
     EntityValueMixin,
+    create_coordinator_context,
     create_unique_id,
     get_operating_values,
     create_device_info,
@@ -69,6 +71,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
 
 class IxfieldSelect(
+    EntityDeviceStateMixin,
     CoordinatorEntity,
     SelectEntity,
     EntityNamingMixin,
@@ -84,7 +87,9 @@ class IxfieldSelect(
             self, coordinator, device_id, device_name, sensor_name, "select", config
         )
         # Initialize coordinator entity
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, create_coordinator_context(device_id, sensor_name)
+        )
 
         self._attr_current_option = None
         self._optimistic = OptimisticStateManager(self.name, "Select")
@@ -110,13 +115,17 @@ class IxfieldSelect(
             ),
             verification_call=self._get_actual_option,
             value_comparison=string_comparison_ignore_case,
-            coordinator_refresh=self.coordinator.async_request_refresh,
+            **self.get_device_refresh_callbacks(),
         )
 
     def _get_actual_option(self):
         """Get the actual option from coordinator data without optimistic updates."""
         value = self.get_sensor_value(self._sensor_name, "value")
-        _LOGGER.debug(f"Select {self.name} actual value from coordinator: {value}")
+        # Resolving the entity name is not free, only do it when debugging
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Select %s actual value from coordinator: %s", self.name, value
+            )
         return value
 
     @property
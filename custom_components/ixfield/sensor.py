@@ -5,10 +5,13 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, IXFIELD_DEVICE_URL
 from .device_info_sensor import create_device_info_sensors
+from .diagnostic_sensor import CloudApiStatusSensor
 from .entity_helper import (
     EntityCommonAttrsMixin,
+    EntityDeviceStateMixin,
     EntityNamingMixin,
     EntityValueMixin,
+    create_coordinator_context,
     create_unique_id,
     get_operating_values,
     create_device_info,
@@ -174,11 +177,14 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                     all_sensor_names.append(target_sensor.name)
                     _LOGGER.debug(f"Created target sensor: {target_sensor.name}")
 
+    sensors.append(CloudApiStatusSensor(coordinator, config_entry.entry_id))
+
     _LOGGER.info(f"Created {len(sensors)} sensors: {all_sensor_names}")
     async_add_entities(sensors)
 
 
 class IxfieldSensor(
+    EntityDeviceStateMixin,
     CoordinatorEntity,
     SensorEntity,
     EntityNamingMixin,
@@ -192,7 +198,7 @@ class IxfieldSensor(
             device_name, value, "sensor", config["name"], is_target
         )
         self.set_common_attrs(config, "sensor")
-        super().__init__(coordinator)
+        super().__init__(coordinator, create_coordinator_context(device_id, value))
 
         self._device_id = device_id
         self._device_name = device_name
@@ -202,11 +208,6 @@ class IxfieldSensor(
         self._initial_value = config.get("value")  # Store the initial value from config
         self._attr_unique_id = create_unique_id(device_id, value, "sensor", is_target)
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success
-
     @property
     def native_value(self):
         # Try to get value from coordinator data first
@@ -229,10 +230,9 @@ class IxfieldSensor(
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug(f"Coordinator update for {self._value_name}")
+        _LOGGER.debug("Coordinator update for %s", self._value_name)
+        # The coordinator only calls this if the value changed, super() writes the state
         super()._handle_coordinator_update()
-        # Force a state update
-        self.async_write_ha_state()
 
     @property
     def device_info(self):
@@ -246,12 +246,13 @@ class IxfieldSensor(
             self._device_id, self._value_name, str(value)
         )
         if success:
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_device_refresh(self._device_id)
         else:
             _LOGGER.error(f"Failed to set {self._attr_name} to {value}")
 
 
 class IxfieldTargetSensor(
+    EntityDeviceStateMixin,
     CoordinatorEntity,
     SensorEntity,
     EntityNamingMixin,
@@ -271,7 +272,9 @@ class IxfieldTargetSensor(
             device_name, sensor_name, "sensor", target_config["name"], is_target=True
         )
         self.set_common_attrs(target_config, "sensor")
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, create_coordinator_context(device_id, sensor_name)
+        )
 
         self._device_id = device_id
         self._device_name = device_name
@@ -281,11 +284,6 @@ class IxfieldTargetSensor(
         self._initial_value = config.get("desired_value")  # Store the initial desired value
         self._attr_unique_id = create_unique_id(device_id, sensor_name, "sensor", is_target=True)
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success
-
     @property
     def native_value(self):
         # Try to get desired value from coordinator data first
@@ -308,10 +306,9 @@ class IxfieldTargetSensor(
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug(f"Coordinator update for target sensor {self._value_name}")
+        _LOGGER.debug("Coordinator update for target sensor %s", self._value_name)
+        # The coordinator only calls this if the value changed, super() writes the state
         super()._handle_coordinator_update()
-        # Force a state update
-        self.async_write_ha_state()
 
     @property
     def device_info(self):
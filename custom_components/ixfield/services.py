@@ -1,13 +1,169 @@
 """Services for IXField integration."""
+import asyncio
 import logging
-from homeassistant.core import HomeAssistant, ServiceCall
-
-from .const import DOMAIN
-from .service_config import format_control_value, validate_control_value
+from typing import Any, Dict, List, Optional, Tuple
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+
+from .const import BULK_CONTROL_MAX_CONCURRENT, DOMAIN
+from .routing import async_get_device_coordinator, async_get_device_coordinators
+from .service_config import (
+    format_control_value,
+    get_available_controls as get_device_controls,
+    validate_control_value,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+async def _async_apply_controls(
+    coordinator, device_id: str, controls: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Validate and set controls of a device with a single request.
+
+    Returns:
+        Whether all controls were set, how many were set and the failed ones
+    """
+    # Get available sensors from the device
+    device_data = coordinator.data.get(device_id, {})
+    device = device_data.get("data", {}).get("device", {})
+    operating_values = device.get("liveDeviceData", {}).get("operatingValues", [])
+
+    # Get available controls for this device
+    available_controls = get_device_controls(operating_values)
+    _LOGGER.debug(
+        f"Available controls for device {device_id}: {list(available_controls.keys())}"
+    )
+
+    success_count = 0
+    failed_controls = []
+    # Values to set by sensor name, and the control names they were set by
+    sensor_values = {}
+    sensor_controls = {}
+
+    for control_name, value in controls.items():
+        # Check if this control is available for this device
+        if control_name not in available_controls:
+            _LOGGER.warning(
+                f"Control '{control_name}' not available for device {device_id}"
+            )
+            failed_controls.append(f"{control_name}: not available")
+            continue
+
+        control_info = available_controls[control_name]
+        sensor_name = control_info["sensor_name"]
+        sensor_data = control_info["sensor_data"]
+
+        # Validate the control value
+        is_valid, error_msg = validate_control_value(control_name, value)
+        if not is_valid:
+            _LOGGER.error(f"Invalid value for {control_name}: {error_msg}")
+            failed_controls.append(f"{control_name}: {error_msg}")
+            continue
+
+        # Check if the sensor is settable
+        if not sensor_data.get("settable", False):
+            _LOGGER.warning(
+                f"Control '{control_name}' (sensor '{sensor_name}') is not settable"
+            )
+            failed_controls.append(f"{control_name}: sensor not settable")
+            continue
+
+        # Format the value for the API
+        formatted_value = format_control_value(control_name, value)
+
+        _LOGGER.debug(
+            f"Setting {control_name} (sensor: {sensor_name}) to {formatted_value}"
+        )
+        sensor_values[sensor_name] = formatted_value
+        sensor_controls[sensor_name] = (control_name, value)
+
+    if sensor_values:
+        # Set all controls with a single request
+        try:
+            results = await coordinator.api.async_set_controls(
+                device_id, sensor_values
+            )
+        except Exception as e:
+            _LOGGER.error(f"Error setting controls: {e}")
+            failed_controls.extend(
+                f"{control_name}: {str(e)}"
+                for control_name, _ in sensor_controls.values()
+            )
+        else:
+            for sensor_name, (control_name, value) in sensor_controls.items():
+                if results.get(sensor_name):
+                    _LOGGER.info(f"Successfully set {control_name} to {value}")
+                    success_count += 1
+                else:
+                    _LOGGER.error(f"Failed to set {control_name} to {value}")
+                    failed_controls.append(f"{control_name}: API call failed")
+
+        _LOGGER.info(
+            f"Device control completed: {success_count}/{len(sensor_controls)} controls set successfully"
+        )
+        if failed_controls:
+            _LOGGER.warning(f"Failed controls: {failed_controls}")
+    else:
+        _LOGGER.warning(f"No valid controls found for device {device_id}")
+
+    return {
+        "success": bool(sensor_values) and not failed_controls,
+        "controls_set": success_count,
+        "failed_controls": failed_controls,
+    }
+
+
+def _select_devices(
+    hass: HomeAssistant,
+    device_ids: Optional[List[str]] = None,
+    company: Optional[str] = None,
+    device_type: Optional[str] = None,
+) -> Tuple[List[Tuple[Any, str]], List[str]]:
+    """Select devices of all config entries, all filters given must match.
+
+    Args:
+        device_ids: Only these devices
+        company: Only devices of the company with this ID or name
+        device_type: Only devices of this type, e.g. POOL
+
+    Returns:
+        (coordinator, device_id) of the selected devices, and the device_ids
+        not found in any config entry
+    """
+    device_coordinators = async_get_device_coordinators(hass)
+    if device_ids is None:
+        device_ids = list(device_coordinators)
+
+    selected = []
+    not_found = []
+    for device_id in device_ids:
+        coordinator = device_coordinators.get(device_id)
+        if coordinator is None:
+            _LOGGER.warning(f"Could not find coordinator for device {device_id}")
+            not_found.append(device_id)
+            continue
+        if company is not None:
+            device_company = coordinator.get_device_company(device_id) or {}
+            if company.lower() not in (
+                str(device_company.get("id")).lower(),
+                str(device_company.get("name")).lower(),
+            ):
+                continue
+        if (
+            device_type is not None
+            and coordinator.get_device_type(device_id).lower() != device_type.lower()
+        ):
+            continue
+        selected.append((coordinator, device_id))
+    return selected, not_found
+
+
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up IXField services."""
 
@@ -18,94 +174,94 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         _LOGGER.info(f"Controlling device {device_id} with settings: {controls}")
 
-        # Find the coordinator for this device
-        coordinator = None
-        for entry_id, data in hass.data[DOMAIN].items():
-            coord = data["coordinator"]
-            if device_id in coord.device_ids:
-                coordinator = coord
-                break
+        coordinator = async_get_device_coordinator(hass, device_id)
 
         if not coordinator:
             _LOGGER.error(f"Could not find coordinator for device {device_id}")
             return
 
-        # Get available sensors from the device
-        device_data = coordinator.data.get(device_id, {})
-        device = device_data.get("data", {}).get("device", {})
-        operating_values = device.get("liveDeviceData", {}).get("operatingValues", [])
-
-        # Get available controls for this device
-        available_controls = get_available_controls(operating_values)
-        _LOGGER.debug(
-            f"Available controls for device {device_id}: {list(available_controls.keys())}"
-        )
+        result = await _async_apply_controls(coordinator, device_id, controls)
+        if result["controls_set"] or result["failed_controls"]:
+            # Refresh the device to update the UI
+            await coordinator.async_request_device_refresh(device_id)
 
-        success_count = 0
-        total_controls = 0
-        failed_controls = []
-
-        for control_name, value in controls.items():
-            # Check if this control is available for this device
-            if control_name not in available_controls:
-                _LOGGER.warning(
-                    f"Control '{control_name}' not available for device {device_id}"
-                )
-                failed_controls.append(f"{control_name}: not available")
-                continue
-
-            control_info = available_controls[control_name]
-            sensor_name = control_info["sensor_name"]
-            sensor_data = control_info["sensor_data"]
-
-            # Validate the control value
-            is_valid, error_msg = validate_control_value(control_name, value)
-            if not is_valid:
-                _LOGGER.error(f"Invalid value for {control_name}: {error_msg}")
-                failed_controls.append(f"{control_name}: {error_msg}")
-                continue
+    async def bulk_control(call: ServiceCall) -> ServiceResponse:
+        """Set the same controls on many IXField devices at once."""
+        controls = call.data.get("controls", {})
+        device_ids = call.data.get("device_ids")
+        company = call.data.get("company")
+        device_type = call.data.get("device_type")
 
-            # Check if the sensor is settable
-            if not sensor_data.get("settable", False):
-                _LOGGER.warning(
-                    f"Control '{control_name}' (sensor '{sensor_name}') is not settable"
-                )
-                failed_controls.append(f"{control_name}: sensor not settable")
-                continue
+        if not call.data.get("all_devices") and not (
+            device_ids or company or device_type
+        ):
+            _LOGGER.error(
+                "bulk_control needs all_devices, device_ids, company or device_type"
+            )
+            return {"devices": {}, "succeeded": 0, "failed": 0}
+        if isinstance(device_ids, str):
+            device_ids = [device_ids]
+
+        selected, not_found = _select_devices(
+            hass,
+            list(dict.fromkeys(device_ids)) if device_ids else None,
+            company,
+            device_type,
+        )
+        _LOGGER.info(
+            f"Controlling {len(selected)} devices with settings: {controls}"
+        )
 
-            total_controls += 1
+        semaphore = asyncio.Semaphore(BULK_CONTROL_MAX_CONCURRENT)
 
-            try:
-                # Format the value for the API
-                formatted_value = format_control_value(control_name, value)
+        async def apply_controls(coordinator, device_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await _async_apply_controls(
+                        coordinator, device_id, controls
+                    )
+                except Exception as e:
+                    _LOGGER.error(f"Error controlling device {device_id}: {e}")
+                    return {
+                        "success": False,
+                        "controls_set": 0,
+                        "failed_controls": [str(e)],
+                    }
 
-                _LOGGER.debug(
-                    f"Setting {control_name} (sensor: {sensor_name}) to {formatted_value}"
-                )
-                success = await coordinator.api.async_set_control(
-                    device_id, sensor_name, formatted_value
-                )
+        results = await asyncio.gather(
+            *(apply_controls(coordinator, device_id) for coordinator, device_id in selected)
+        )
 
-                if success:
-                    _LOGGER.info(f"Successfully set {control_name} to {value}")
-                    success_count += 1
-                else:
-                    _LOGGER.error(f"Failed to set {control_name} to {value}")
-                    failed_controls.append(f"{control_name}: API call failed")
-            except Exception as e:
-                _LOGGER.error(f"Error setting {control_name}: {e}")
-                failed_controls.append(f"{control_name}: {str(e)}")
+        # Refresh the controlled devices, merged into one refresh per entry
+        await asyncio.gather(
+            *(
+                coordinator.async_request_device_refresh(device_id)
+                for (coordinator, device_id), result in zip(selected, results)
+                if result["controls_set"]
+            ),
+            return_exceptions=True,
+        )
 
-        if total_controls > 0:
-            _LOGGER.info(
-                f"Device control completed: {success_count}/{total_controls} controls set successfully"
-            )
-            if failed_controls:
-                _LOGGER.warning(f"Failed controls: {failed_controls}")
-            # Trigger a coordinator refresh to update the UI
-            await coordinator.async_request_refresh()
-        else:
-            _LOGGER.warning(f"No valid controls found for device {device_id}")
+        devices = {
+            device_id: {"name": coordinator.get_device_name(device_id), **result}
+            for (coordinator, device_id), result in zip(selected, results)
+        }
+        for device_id in not_found:
+            devices[device_id] = {
+                "success": False,
+                "controls_set": 0,
+                "failed_controls": [],
+                "error": "device not found",
+            }
+        succeeded = sum(1 for result in results if result["success"])
+        _LOGGER.info(
+            f"Bulk control completed: {succeeded}/{len(devices)} devices controlled successfully"
+        )
+        return {
+            "devices": devices,
+            "succeeded": succeeded,
+            "failed": len(devices) - succeeded,
+        }
 
     async def device_service_sequence(call: ServiceCall) -> None:
         """Start a service sequence on an IXField device."""
@@ -114,13 +270,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         _LOGGER.info(f"Starting service sequence {sequence_name} on device {device_id}")
 
-        # Find the coordinator for this device
-        coordinator = None
-        for entry_id, data in hass.data[DOMAIN].items():
-            coord = data["coordinator"]
-            if device_id in coord.device_ids:
-                coordinator = coord
-                break
+        coordinator = async_get_device_coordinator(hass, device_id)
 
         if not coordinator:
             _LOGGER.error(f"Could not find coordinator for device {device_id}")
@@ -132,8 +282,8 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             )
             if success:
                 _LOGGER.info(f"Successfully started service sequence {sequence_name}")
-                # Trigger a coordinator refresh to update the UI
-                await coordinator.async_request_refresh()
+                # Refresh the device to update the UI
+                await coordinator.async_request_device_refresh(device_id)
             else:
                 _LOGGER.error(f"Failed to start service sequence {sequence_name}")
         except Exception as e:
@@ -145,13 +295,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         _LOGGER.info(f"Getting status for device {device_id}")
 
-        # Find the coordinator for this device
-        coordinator = None
-        for entry_id, data in hass.data[DOMAIN].items():
-            coord = data["coordinator"]
-            if device_id in coord.device_ids:
-                coordinator = coord
-                break
+        coordinator = async_get_device_coordinator(hass, device_id)
 
         if not coordinator:
             _LOGGER.error(f"Could not find coordinator for device {device_id}")
@@ -248,21 +392,20 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         _LOGGER.info(f"Manually refreshing data for device {device_id}")
 
-        # Find the coordinator for this device
-        coordinator = None
-        for entry_id, data in hass.data[DOMAIN].items():
-            coord = data["coordinator"]
-            if device_id in coord.device_ids:
-                coordinator = coord
-                break
+        coordinator = async_get_device_coordinator(hass, device_id)
 
         if not coordinator:
             _LOGGER.error(f"Could not find coordinator for device {device_id}")
             return
 
         try:
-            await coordinator.async_request_refresh()
-            _LOGGER.info(f"Successfully refreshed data for device {device_id}")
+            errors = await coordinator.async_refresh_devices([device_id])
+            if device_id in errors:
+                _LOGGER.error(
+                    f"Failed to refresh data for device {device_id}: {errors[device_id]}"
+                )
+            else:
+                _LOGGER.info(f"Successfully refreshed data for device {device_id}")
         except Exception as e:
             _LOGGER.error(f"Error refreshing data for device {device_id}: {e}")
 
@@ -272,13 +415,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         _LOGGER.info(f"Getting comprehensive info for device {device_id}")
 
-        # Find the coordinator for this device
-        coordinator = None
-        for entry_id, data in hass.data[DOMAIN].items():
-            coord = data["coordinator"]
-            if device_id in coord.device_ids:
-                coordinator = coord
-                break
+        coordinator = async_get_device_coordinator(hass, device_id)
 
         if not coordinator:
             _LOGGER.error(f"Could not find coordinator for device {device_id}")
@@ -418,13 +555,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         _LOGGER.info(f"Getting available controls for device {device_id}")
 
-        # Find the coordinator for this device
-        coordinator = None
-        for entry_id, data in hass.data[DOMAIN].items():
-            coord = data["coordinator"]
-            if device_id in coord.device_ids:
-                coordinator = coord
-                break
+        coordinator = async_get_device_coordinator(hass, device_id)
 
         if not coordinator:
             _LOGGER.error(f"Could not find coordinator for device {device_id}")
@@ -439,7 +570,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             )
 
             # Get available controls for this device
-            available_controls = get_available_controls(operating_values)
+            available_controls = get_device_controls(operating_values)
 
             # Format the response
             controls_info = {}
@@ -474,6 +605,12 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
     # Register the services
     hass.services.async_register(DOMAIN, "device_control", device_control)
+    hass.services.async_register(
+        DOMAIN,
+        "bulk_control",
+        bulk_control,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
     hass.services.async_register(
         DOMAIN, "device_service_sequence", device_service_sequence
     )
@@ -494,6 +631,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 async def async_unload_services(hass: HomeAssistant) -> None:
     """Unload IXField services."""
     hass.services.async_remove(DOMAIN, "device_control")
+    hass.services.async_remove(DOMAIN, "bulk_control")
     hass.services.async_remove(DOMAIN, "device_service_sequence")
     hass.services.async_remove(DOMAIN, "device_status")
     hass.services.async_remove(DOMAIN, "device_refresh")
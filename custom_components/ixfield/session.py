@@ -0,0 +1,71 @@
+"""Shared HTTP session for the IXField integration."""
+import logging
+
+import aiohttp
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util import ssl as ssl_util
+
+from .const import (
+    API_TIMEOUT,
+    DOMAIN,
+    SESSION_CONNECTION_LIMIT,
+    SESSION_DNS_CACHE_TTL,
+    SESSION_KEEPALIVE_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SESSION = f"{DOMAIN}_session"
+DATA_SESSION_CLOSE_LISTENER = f"{DOMAIN}_session_close_listener"
+
+
+@callback
+def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Get the HTTP session shared by all IXField config entries and flows.
+
+    The session keeps connections to the IXField API alive between polls and
+    is closed when the last config entry unloads or Home Assistant stops.
+    """
+    session: aiohttp.ClientSession = hass.data.get(DATA_SESSION)
+    if session is not None and not session.closed:
+        return session
+
+    connector = aiohttp.TCPConnector(
+        ssl=ssl_util.get_default_context(),
+        limit=SESSION_CONNECTION_LIMIT,
+        limit_per_host=SESSION_CONNECTION_LIMIT,
+        keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=SESSION_DNS_CACHE_TTL,
+        enable_cleanup_closed=True,
+    )
+    session = aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
+        json_serialize=json_dumps,
+    )
+    hass.data[DATA_SESSION] = session
+
+    async def _async_close_on_stop(event: Event) -> None:
+        """Close the session when Home Assistant stops."""
+        # The listener is gone once it fired
+        hass.data.pop(DATA_SESSION_CLOSE_LISTENER, None)
+        await async_close_session(hass)
+
+    hass.data[DATA_SESSION_CLOSE_LISTENER] = hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_CLOSE, _async_close_on_stop
+    )
+    _LOGGER.debug("Created shared IXField HTTP session")
+    return session
+
+
+async def async_close_session(hass: HomeAssistant) -> None:
+    """Close the shared HTTP session if it exists."""
+    remove_close_listener = hass.data.pop(DATA_SESSION_CLOSE_LISTENER, None)
+    if remove_close_listener is not None:
+        remove_close_listener()
+    session: aiohttp.ClientSession = hass.data.pop(DATA_SESSION, None)
+    if session is not None and not session.closed:
+        await session.close()
+        _LOGGER.debug("Closed shared IXField HTTP session")
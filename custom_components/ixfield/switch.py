@@ -5,8 +5,10 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN, IXFIELD_DEVICE_URL
 from .entity_helper import (
     EntityCommonAttrsMixin,
+    EntityDeviceStateMixin,
     EntityNamingMixin,
     EntityValueMixin,
+    create_coordinator_context,
     create_unique_id,
     get_controls,
     create_device_info,
@@ -73,6 +75,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
 
 class IxfieldSwitch(
+    EntityDeviceStateMixin,
     CoordinatorEntity,
     SwitchEntity,
     EntityNamingMixin,
@@ -84,7 +87,9 @@ class IxfieldSwitch(
             device_name, control.get("name"), "switch", config["name"]
         )
         self.set_common_attrs(config, "switch")
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, create_coordinator_context(device_id, control.get("name"))
+        )
 
         self._device_id = device_id
         self._device_name = device_name
@@ -117,13 +122,13 @@ class IxfieldSwitch(
             ),
             verification_call=self._get_actual_state,
             value_comparison=boolean_comparison,
-            coordinator_refresh=self.coordinator.async_request_refresh,
+            **self.get_device_refresh_callbacks(),
         )
 
     def _get_actual_state(self):
         value = self.get_control_value(self._control_name, "value")
         _LOGGER.debug(
-            f"Switch {self._attr_name} actual value from coordinator: {value}"
+            "Switch %s actual value from coordinator: %s", self._attr_name, value
         )
         return value in ["true", "ON", "on", "True"]
 
@@ -0,0 +1,26 @@
+"""Common helpers for IXField tests."""
+
+from unittest.mock import Mock
+
+from custom_components.ixfield.coordinator import (
+    DeviceSnapshotIndex,
+    DeviceUpdateState,
+)
+from .test_data import SAMPLE_DEVICE_DATA
+
+
+def create_mock_coordinator(data=None):
+    """Create a mock coordinator serving the given device data to entities.
+
+    The device index is built from the current coordinator data on every
+    lookup, so tests may replace the data afterwards. All devices are available
+    with data from the last refresh.
+    """
+    coordinator = Mock()
+    coordinator.data = {"test_device_id": SAMPLE_DEVICE_DATA} if data is None else data
+    coordinator.get_device_index.side_effect = lambda device_id: DeviceSnapshotIndex(
+        coordinator.data.get(device_id)
+    )
+    coordinator.is_device_available.return_value = True
+    coordinator.get_device_state.return_value = DeviceUpdateState()
+    return coordinator
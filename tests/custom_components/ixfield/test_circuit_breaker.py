@@ -0,0 +1,79 @@
+"""Tests for IXField circuit breaker module."""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from custom_components.ixfield.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class TestCircuitBreaker:
+    """Test the circuit breaker state machine."""
+
+    def test_circuit_breaker_states(self):
+        """Test the circuit opens, probes once when half-open and closes."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+        listener = Mock()
+        breaker.add_listener(listener)
+
+        breaker.before_request()
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        # Half-open after the recovery timeout, admitting a single probe
+        with patch(
+            "custom_components.ixfield.circuit_breaker.time.monotonic",
+            return_value=time.monotonic() + 61,
+        ):
+            # Reading the state does not change it
+            assert breaker.state == "open"
+            assert breaker.before_request() is True
+            assert breaker.state == "half_open"
+            with pytest.raises(CircuitOpenError):
+                breaker.before_request()
+
+            # A failed probe opens the circuit again
+            breaker.record_failure()
+            assert breaker.state == "open"
+
+        with patch(
+            "custom_components.ixfield.circuit_breaker.time.monotonic",
+            return_value=time.monotonic() + 122,
+        ):
+            assert breaker.before_request() is True
+            breaker.record_success()
+            assert breaker.state == "closed"
+
+        assert listener.call_count == 5
+        assert breaker.as_dict()["rejected_requests"] == 2
+
+    def test_circuit_breaker_recovery_timer(self):
+        """Test the circuit becomes half-open on a timer when hass is given."""
+        cancel = Mock()
+        with patch(
+            "custom_components.ixfield.circuit_breaker.async_call_later",
+            return_value=cancel,
+        ) as mock_call_later:
+            breaker = CircuitBreaker(
+                failure_threshold=1, recovery_timeout=60, hass=Mock()
+            )
+            listener = Mock()
+            breaker.add_listener(listener)
+            breaker.record_failure()
+
+        assert mock_call_later.call_args.args[1] == 60
+        half_open = mock_call_later.call_args.args[2]
+        half_open(None)
+        assert breaker.state == "half_open"
+        assert listener.call_count == 2
+
+        # A successful probe closes the circuit, nothing is left to cancel
+        assert breaker.before_request() is True
+        breaker.record_success()
+        assert breaker.state == "closed"
+        cancel.assert_not_called()
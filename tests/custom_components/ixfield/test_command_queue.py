@@ -0,0 +1,87 @@
+"""Tests for IXField command queue module."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.ixfield.command_queue import CommandQueue
+
+
+class TestCommandQueue:
+    """Test queueing of control commands."""
+
+    @pytest.mark.asyncio
+    async def test_command_queue_sends_latest_value(self):
+        """Test queued writes to a control are merged and other controls are not delayed."""
+        sent = []
+        release = asyncio.Event()
+
+        async def send(device_id, control_name, value):
+            sent.append((control_name, value))
+            await release.wait()
+            return True
+
+        queue = CommandQueue(send, AsyncMock())
+        first = asyncio.ensure_future(queue.async_set_control("device_1", "temp", 20))
+        await asyncio.sleep(0.01)
+        replaced = asyncio.ensure_future(
+            queue.async_set_control("device_1", "temp", 21)
+        )
+        latest = asyncio.ensure_future(queue.async_set_control("device_1", "temp", 22))
+        pump = asyncio.ensure_future(queue.async_set_control("device_1", "pump", "ON"))
+        await asyncio.sleep(0.01)
+
+        # The pump is sent while the first temperature is in flight
+        assert sent == [("temp", 20), ("pump", "ON")]
+        assert queue.stats == {"queued_commands": 1, "superseded_commands": 1}
+
+        release.set()
+        assert await asyncio.gather(first, replaced, latest, pump) == [
+            True,
+            True,
+            True,
+            True,
+        ]
+        assert sent == [("temp", 20), ("pump", "ON"), ("temp", 22)]
+        assert queue.stats == {"queued_commands": 0, "superseded_commands": 1}
+
+    @pytest.mark.asyncio
+    async def test_command_queue_orders_batched_writes(self):
+        """Test writes of several controls wait for and replace the queued writes."""
+        sent = []
+        release = asyncio.Event()
+
+        async def send(device_id, control_name, value):
+            sent.append((control_name, value))
+            await release.wait()
+            return True
+
+        async def send_batch(device_id, controls):
+            sent.append(dict(controls))
+            return {control_name: True for control_name in controls}
+
+        queue = CommandQueue(send, send_batch)
+        first = asyncio.ensure_future(queue.async_set_control("device_1", "temp", 20))
+        await asyncio.sleep(0.01)
+        replaced = asyncio.ensure_future(
+            queue.async_set_control("device_1", "temp", 21)
+        )
+        batch = asyncio.ensure_future(
+            queue.async_set_controls("device_1", {"temp": 22, "pump": "ON"})
+        )
+        await asyncio.sleep(0.01)
+
+        # The batch waits for the temperature in flight and replaces the queued one
+        assert sent == [("temp", 20)]
+        assert queue.stats == {"queued_commands": 0, "superseded_commands": 1}
+        latest = asyncio.ensure_future(queue.async_set_control("device_1", "temp", 23))
+
+        release.set()
+        assert await asyncio.gather(first, replaced, batch, latest) == [
+            True,
+            True,
+            {"temp": True, "pump": True},
+            True,
+        ]
+        assert sent == [("temp", 20), {"temp": 22, "pump": "ON"}, ("temp", 23)]
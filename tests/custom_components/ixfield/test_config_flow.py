@@ -45,7 +45,9 @@ class TestIxfieldConfigFlow:
         flow._async_current_entries = Mock(return_value=[])
         
         # Mock API login and device fetching
-        with patch("custom_components.ixfield.config_flow.IxfieldApi") as mock_api_class:
+        with patch("custom_components.ixfield.config_flow.IxfieldApi") as mock_api_class, patch(
+            "custom_components.ixfield.config_flow.async_get_session"
+        ):
             mock_api = Mock()
             mock_api.async_login = AsyncMock()
             mock_api.async_get_user_devices = AsyncMock(return_value={
@@ -84,7 +86,9 @@ class TestIxfieldConfigFlow:
         flow._async_current_entries = Mock(return_value=[])
         
         # Mock API login failure
-        with patch("custom_components.ixfield.config_flow.IxfieldApi") as mock_api_class:
+        with patch("custom_components.ixfield.config_flow.IxfieldApi") as mock_api_class, patch(
+            "custom_components.ixfield.config_flow.async_get_session"
+        ):
             mock_api = Mock()
             mock_api.async_login = AsyncMock(side_effect=Exception("Invalid credentials"))
             mock_api_class.return_value = mock_api
@@ -112,7 +116,9 @@ class TestIxfieldConfigFlow:
         flow._async_current_entries = Mock(return_value=[])
         
         # Mock API login but no devices
-        with patch("custom_components.ixfield.config_flow.IxfieldApi") as mock_api_class:
+        with patch("custom_components.ixfield.config_flow.IxfieldApi") as mock_api_class, patch(
+            "custom_components.ixfield.config_flow.async_get_session"
+        ):
             mock_api = Mock()
             mock_api.async_login = AsyncMock()
             mock_api.async_get_user_devices = AsyncMock(return_value={
@@ -147,7 +153,9 @@ class TestIxfieldConfigFlow:
         flow._async_current_entries = Mock(return_value=[])
         
         # Mock API login but failed device fetch
-        with patch("custom_components.ixfield.config_flow.IxfieldApi") as mock_api_class:
+        with patch("custom_components.ixfield.config_flow.IxfieldApi") as mock_api_class, patch(
+            "custom_components.ixfield.config_flow.async_get_session"
+        ):
             mock_api = Mock()
             mock_api.async_login = AsyncMock()
             mock_api.async_get_user_devices = AsyncMock(return_value=None)
@@ -187,7 +195,9 @@ class TestIxfieldConfigFlow:
         flow._async_current_entries = Mock(return_value=[])
         
         # Mock API exception
-        with patch("custom_components.ixfield.config_flow.IxfieldApi") as mock_api_class:
+        with patch("custom_components.ixfield.config_flow.IxfieldApi") as mock_api_class, patch(
+            "custom_components.ixfield.config_flow.async_get_session"
+        ):
             mock_api = Mock()
             mock_api.async_login = AsyncMock(side_effect=Exception("Network error"))
             mock_api_class.return_value = mock_api
@@ -237,7 +247,9 @@ class TestIxfieldConfigFlow:
         mock_entry.unique_id = "test@example.com"
         flow._async_current_entries = Mock(return_value=[mock_entry])
         # Mock API success
-        with patch("custom_components.ixfield.config_flow.IxfieldApi") as mock_api_class:
+        with patch("custom_components.ixfield.config_flow.IxfieldApi") as mock_api_class, patch(
+            "custom_components.ixfield.config_flow.async_get_session"
+        ):
             mock_api = Mock()
             mock_api.async_login = AsyncMock()
             mock_api.async_get_user_devices = AsyncMock(return_value={
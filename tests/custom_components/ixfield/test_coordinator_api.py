@@ -1,15 +1,35 @@
 """Tests for IXField coordinator and API modules."""
 
+import json
 import pytest
+import subprocess
+import sys
+import time
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime, timedelta
+from pathlib import Path
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from custom_components.ixfield.coordinator import IxfieldCoordinator
+from custom_components.ixfield.coordinator import (
+    IxfieldCoordinator,
+    merge_live_device_data,
+)
 from custom_components.ixfield.api import IxfieldApi
 from .test_data import SAMPLE_DEVICE_DATA
 
 
+def _set_response_body(response, data):
+    """Make a mocked API response return data as its JSON body."""
+    body = json.dumps(data).encode()
+
+    async def iter_chunked(size):
+        for index in range(0, len(body), size):
+            yield body[index : index + size]
+
+    response.content_length = len(body)
+    response.content.iter_chunked = iter_chunked
+
+
 class TestIxfieldAPI:
     """Test IXField API functionality."""
 
@@ -17,7 +37,7 @@ class TestIxfieldAPI:
         """Test API initialization."""
         mock_session = Mock()
         api = IxfieldApi("test@example.com", "password123", mock_session)
-        
+
         assert api._email == "test@example.com"
         assert api._password == "password123"
         assert api._session == mock_session
@@ -27,26 +47,25 @@ class TestIxfieldAPI:
         """Test API login functionality."""
         mock_session = Mock()
         api = IxfieldApi("test@example.com", "password123", mock_session)
-        
+
         # Mock successful login response
         mock_response = Mock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={
-            "data": {
-                "login": {
-                    "token": "test_token_123",
-                    "user": {
-                        "id": "user_123",
-                        "email": "test@example.com"
+        mock_response.json = AsyncMock(
+            return_value={
+                "data": {
+                    "login": {
+                        "token": "test_token_123",
+                        "user": {"id": "user_123", "email": "test@example.com"},
                     }
                 }
             }
-        })
-        
-        with patch.object(api, 'async_login') as mock_login:
+        )
+
+        with patch.object(api, "async_login") as mock_login:
             mock_login.return_value = None
             await api.async_login()
-            
+
             # Verify login was called
             mock_login.assert_called_once()
 
@@ -55,9 +74,11 @@ class TestIxfieldAPI:
         """Test API login failure handling."""
         mock_session = Mock()
         api = IxfieldApi("test@example.com", "wrong_password", mock_session)
-        
+
         # Mock failed login response
-        with patch.object(api, 'async_login', side_effect=Exception("Authentication failed")):
+        with patch.object(
+            api, "async_login", side_effect=Exception("Authentication failed")
+        ):
             with pytest.raises(Exception, match="Authentication failed"):
                 await api.async_login()
 
@@ -67,30 +88,26 @@ class TestIxfieldAPI:
         mock_session = Mock()
         api = IxfieldApi("test@example.com", "password123", mock_session)
         api._token = "test_token_123"
-        
+
         # Mock successful devices response
         mock_response = Mock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={
-            "data": {
-                "devices": [
-                    {
-                        "id": "device_1",
-                        "name": "Test Pool 1",
-                        "type": "POOL"
-                    },
-                    {
-                        "id": "device_2",
-                        "name": "Test Pool 2",
-                        "type": "POOL"
-                    }
-                ]
+        mock_response.json = AsyncMock(
+            return_value={
+                "data": {
+                    "devices": [
+                        {"id": "device_1", "name": "Test Pool 1", "type": "POOL"},
+                        {"id": "device_2", "name": "Test Pool 2", "type": "POOL"},
+                    ]
+                }
             }
-        })
-        
-        with patch.object(api, 'async_get_user_devices', return_value=mock_response.json.return_value):
+        )
+
+        with patch.object(
+            api, "async_get_user_devices", return_value=mock_response.json.return_value
+        ):
             devices_response = await api.async_get_user_devices()
-            
+
             assert devices_response is not None
             assert "data" in devices_response
             assert "devices" in devices_response["data"]
@@ -102,11 +119,11 @@ class TestIxfieldAPI:
         mock_session = Mock()
         api = IxfieldApi("test@example.com", "password123", mock_session)
         api._token = "test_token_123"
-        
+
         # Mock successful device data response
-        with patch.object(api, 'async_get_device', return_value=SAMPLE_DEVICE_DATA):
+        with patch.object(api, "async_get_device", return_value=SAMPLE_DEVICE_DATA):
             device_data = await api.async_get_device("test_device_id")
-            
+
             assert device_data is not None
             assert "data" in device_data
             assert "device" in device_data["data"]
@@ -118,11 +135,13 @@ class TestIxfieldAPI:
         mock_session = Mock()
         api = IxfieldApi("test@example.com", "password123", mock_session)
         api._token = "test_token_123"
-        
+
         # Mock successful set value response
-        with patch.object(api, 'async_set_control', return_value=True):
-            result = await api.async_set_control("test_device_id", "poolTempWithSettings", 25.0)
-            
+        with patch.object(api, "async_set_control", return_value=True):
+            result = await api.async_set_control(
+                "test_device_id", "poolTempWithSettings", 25.0
+            )
+
             assert result is True
 
     @pytest.mark.asyncio
@@ -131,11 +150,13 @@ class TestIxfieldAPI:
         mock_session = Mock()
         api = IxfieldApi("test@example.com", "password123", mock_session)
         api._token = "test_token_123"
-        
+
         # Mock successful set control response
-        with patch.object(api, 'async_set_control', return_value=True):
-            result = await api.async_set_control("test_device_id", "filtrationState", True)
-            
+        with patch.object(api, "async_set_control", return_value=True):
+            result = await api.async_set_control(
+                "test_device_id", "filtrationState", True
+            )
+
             assert result is True
 
     @pytest.mark.asyncio
@@ -144,11 +165,11 @@ class TestIxfieldAPI:
         mock_session = Mock()
         api = IxfieldApi("test@example.com", "password123", mock_session)
         api._token = "test_token_123"
-        
+
         # Mock successful service sequence response
-        with patch.object(api, 'async_set_control', return_value=True):
+        with patch.object(api, "async_set_control", return_value=True):
             result = await api.async_set_control("test_device_id", "dosingPumpA", True)
-            
+
             assert result is True
 
     @pytest.mark.asyncio
@@ -157,17 +178,464 @@ class TestIxfieldAPI:
         mock_session = Mock()
         api = IxfieldApi("test@example.com", "password123", mock_session)
         api._token = "test_token_123"
-        
+
         # Mock network error
-        with patch.object(api, 'async_get_user_devices', side_effect=Exception("Network error")):
+        with patch.object(
+            api, "async_get_user_devices", side_effect=Exception("Network error")
+        ):
             with pytest.raises(Exception, match="Network error"):
                 await api.async_get_user_devices()
 
+    def test_build_get_devices_query(self):
+        """Test batched query contains one aliased device selection per device."""
+        from custom_components.ixfield.api import build_get_devices_query
+
+        query = build_get_devices_query(3)
+
+        assert query.startswith("query GetDevices($id0: ID!, $id1: ID!, $id2: ID!,")
+        assert "device0: device(deviceId: $id0)" in query
+        assert "device2: device(deviceId: $id2)" in query
+        assert "device3:" not in query
+        assert query.count("fragment ControlFields on Control") == 1
+
+    def test_live_data_queries(self):
+        """Test the polling queries leave out the static device metadata."""
+        from custom_components.ixfield.api import (
+            GET_DEVICE_LIVE_DATA_QUERY,
+            build_get_devices_query,
+        )
+
+        batched_query = build_get_devices_query(2, live_only=True)
+        assert batched_query.startswith(
+            "query GetDevicesLiveData($id0: ID!, $id1: ID!,"
+        )
+        for query in (GET_DEVICE_LIVE_DATA_QUERY, batched_query):
+            assert "liveDeviceData" in query
+            assert "connectionStatus" in query
+            for static_field in (
+                "address",
+                "contactInfo",
+                "company",
+                "thingType",
+                "tabs",
+            ):
+                assert static_field not in query
+            assert "$withFullCustomerData" not in query
+
+    def test_split_get_devices_response(self):
+        """Test batched response is split into per-device GetDevice responses."""
+        from custom_components.ixfield.api import split_get_devices_response
+
+        device = SAMPLE_DEVICE_DATA["data"]["device"]
+        response = {
+            "data": {"device0": device, "device1": None},
+            "errors": [{"message": "Not found", "path": ["device1"]}],
+        }
+
+        results = split_get_devices_response(["device_1", "device_2"], response)
+
+        assert results["device_1"] == {"data": {"device": device}}
+        assert results["device_2"] is None
+
+    @pytest.mark.asyncio
+    async def test_api_get_devices_batches(self):
+        """Test devices are requested in batches of the given size."""
+        mock_session = Mock()
+        api = IxfieldApi("test@example.com", "password123", mock_session)
+
+        async def get_batch(device_ids):
+            return {device_id: SAMPLE_DEVICE_DATA for device_id in device_ids}
+
+        with patch.object(
+            api, "async_get_devices_batch", side_effect=get_batch
+        ) as mock_batch:
+            results = await api.async_get_devices(["d1", "d2", "d3"], batch_size=2)
+
+        assert list(results.keys()) == ["d1", "d2", "d3"]
+        assert [call.args[0] for call in mock_batch.call_args_list] == [
+            ["d1", "d2"],
+            ["d3"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_api_set_controls_batched(self):
+        """Test several controls are set with one aliased mutation."""
+        mock_session = Mock()
+        api = IxfieldApi("test@example.com", "password123", mock_session)
+        response = {
+            "data": {
+                "control0": {"success": True},
+                "control1": {"success": False},
+                "control2": {"success": True},
+            }
+        }
+
+        with patch.object(
+            api, "_async_graphql_request", AsyncMock(return_value=response)
+        ) as mock_request:
+            results = await api.async_set_controls(
+                "test_device_id",
+                {"filtrationState": "ON", "lightsState": "OFF", "poolTemp": "28.0"},
+            )
+
+        assert results == {
+            "filtrationState": True,
+            "lightsState": False,
+            "poolTemp": True,
+        }
+        mock_request.assert_called_once()
+        payload = mock_request.call_args.args[0]
+        assert payload["query"].count("deviceControl(input: $data") == 3
+        assert "control2: deviceControl(input: $data2)" in payload["query"]
+        assert payload["variables"]["data1"] == {
+            "deviceId": "test_device_id",
+            "name": "lightsState",
+            "value": "OFF",
+        }
+        assert mock_request.call_args.kwargs["idempotent"] is False
+
+        # A failed request fails every control
+        with patch.object(api, "_async_graphql_request", AsyncMock(return_value=None)):
+            results = await api.async_set_controls(
+                "test_device_id", {"filtrationState": "ON", "lightsState": "OFF"}
+            )
+        assert results == {"filtrationState": False, "lightsState": False}
+
+    def test_api_token_validity(self):
+        """Test stored tokens are only used while not about to expire."""
+        tokens = {
+            "email": "test@example.com",
+            "access_token": "stored_token",
+            "refresh_token": "stored_refresh",
+            "expires_at": time.time() + 3600,
+        }
+        api = IxfieldApi("test@example.com", "password123", Mock(), tokens=tokens)
+        assert api.is_token_valid()
+        assert api.tokens == tokens
+
+        api.set_tokens({**tokens, "expires_at": time.time() + 10})
+        assert not api.is_token_valid()
+
+        # Tokens of another user are ignored
+        other_api = IxfieldApi(
+            "other@example.com", "password123", Mock(), tokens=tokens
+        )
+        assert other_api._token is None
+        assert not other_api.is_token_valid()
+
+    @pytest.mark.asyncio
+    async def test_api_ensure_token_prefers_refresh(self):
+        """Test an expired token is renewed with the refresh token."""
+        tokens = {
+            "email": "test@example.com",
+            "access_token": "expired_token",
+            "refresh_token": "stored_refresh",
+            "expires_at": time.time() - 10,
+        }
+        token_update_callback = AsyncMock()
+        api = IxfieldApi(
+            "test@example.com",
+            "password123",
+            Mock(),
+            tokens=tokens,
+            token_update_callback=token_update_callback,
+        )
+
+        async def refresh():
+            await api._async_store_auth_result(
+                {"AccessToken": "new_token", "ExpiresIn": 3600}
+            )
+            return True
+
+        with patch.object(
+            api, "async_refresh_token", side_effect=refresh
+        ), patch.object(api, "async_login", new_callable=AsyncMock) as mock_login:
+            await api.async_ensure_token()
+
+        mock_login.assert_not_called()
+        assert api._token == "new_token"
+        assert api._refresh_token == "stored_refresh"
+        assert api.is_token_valid()
+        token_update_callback.assert_awaited_once_with(api.tokens)
+
+    @pytest.mark.asyncio
+    async def test_api_reauthenticates_on_unauthorized(self):
+        """Test a rejected access token is renewed and the request retried."""
+        responses = []
+        for status in (401, 200):
+            response = Mock()
+            response.status = status
+            _set_response_body(response, SAMPLE_DEVICE_DATA)
+            response.text = AsyncMock(return_value="")
+            context = AsyncMock()
+            context.__aenter__.return_value = response
+            responses.append(context)
+
+        mock_session = Mock()
+        mock_session.post = Mock(side_effect=responses)
+        api = IxfieldApi("test@example.com", "password123", mock_session)
+        api._token = "revoked_token"
+
+        async def refresh():
+            api._token = "new_token"
+            return True
+
+        with patch.object(api, "async_refresh_token", side_effect=refresh):
+            result = await api.async_get_device("test_device_id")
+
+        assert result == SAMPLE_DEVICE_DATA
+        assert mock_session.post.call_count == 2
+        headers = mock_session.post.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Bearer new_token"
+
+    @pytest.mark.asyncio
+    async def test_api_reads_bounded_response(self):
+        """Test responses are decoded by the given decoder up to a size limit."""
+
+        def mock_session(content_length=True):
+            response = Mock()
+            response.status = 200
+            _set_response_body(response, SAMPLE_DEVICE_DATA)
+            if not content_length:
+                response.content_length = None
+            context = AsyncMock()
+            context.__aenter__.return_value = response
+            session = Mock()
+            session.post = Mock(return_value=context)
+            return session
+
+        decoder = Mock(side_effect=json.loads)
+        api = IxfieldApi(
+            "test@example.com", "password123", mock_session(), json_decoder=decoder
+        )
+        api._token = "test_token_123"
+        assert await api.async_get_device("test_device_id") == SAMPLE_DEVICE_DATA
+        decoder.assert_called_once_with(json.dumps(SAMPLE_DEVICE_DATA).encode())
+
+        # Undecodable responses count as failures of the cloud
+        api = IxfieldApi(
+            "test@example.com",
+            "password123",
+            mock_session(),
+            json_decoder=Mock(side_effect=ValueError("bad JSON")),
+        )
+        api._token = "test_token_123"
+        api.circuit_breaker.record_failure()
+        assert await api.async_get_device("test_device_id") is None
+        assert api.circuit_breaker.as_dict()["failure_count"] == 2
+
+        # Too large responses are rejected by Content-Length or while reading
+        for content_length in (True, False):
+            api = IxfieldApi(
+                "test@example.com",
+                "password123",
+                mock_session(content_length),
+                max_response_size=1000,
+            )
+            api._token = "test_token_123"
+            assert await api.async_get_device("test_device_id") is None
+            assert api.request_stats["failures"] == 1
+            assert api.circuit_breaker.as_dict()["failure_count"] == 1
+
+        # Error responses are read with the same limit
+        session = mock_session(content_length=False)
+        response = session.post.return_value.__aenter__.return_value
+        response.status = 400
+        response.headers = {}
+        response.text = AsyncMock()
+        api = IxfieldApi(
+            "test@example.com", "password123", session, max_response_size=1000
+        )
+        api._token = "test_token_123"
+        assert await api.async_get_device("test_device_id") is None
+        response.text.assert_not_called()
+
+    @staticmethod
+    def _mock_responses(*statuses):
+        """Create session.post results returning the given statuses in order."""
+        responses = []
+        for status in statuses:
+            response = Mock()
+            response.status = status
+            response.headers = {}
+            _set_response_body(response, SAMPLE_DEVICE_DATA)
+            response.text = AsyncMock(return_value="")
+            context = AsyncMock()
+            context.__aenter__.return_value = response
+            responses.append(context)
+        return responses
+
+    @pytest.mark.asyncio
+    async def test_api_retries_idempotent_requests(self):
+        """Test queries are retried with backoff on server errors."""
+        mock_session = Mock()
+        mock_session.post = Mock(side_effect=self._mock_responses(503, 502, 200))
+        api = IxfieldApi("test@example.com", "password123", mock_session)
+        api._token = "test_token_123"
+
+        with patch("custom_components.ixfield.api.asyncio.sleep") as mock_sleep:
+            result = await api.async_get_device("test_device_id")
+
+        assert result == SAMPLE_DEVICE_DATA
+        assert mock_session.post.call_count == 3
+        assert mock_sleep.await_count == 2
+        stats = api.request_stats
+        assert stats["requests"] == 1
+        assert stats["retries"] == 2
+        assert stats["server_error"] == 2
+        assert stats["failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_api_retry_rules(self):
+        """Test client errors fail at once and retries are bounded."""
+        from custom_components.ixfield.const import MAX_RETRIES
+
+        mock_session = Mock()
+        api = IxfieldApi("test@example.com", "password123", mock_session)
+        api._token = "test_token_123"
+
+        with patch("custom_components.ixfield.api.asyncio.sleep"):
+            # Client errors are not retried
+            mock_session.post = Mock(side_effect=self._mock_responses(400))
+            assert await api.async_get_device("test_device_id") is None
+            assert mock_session.post.call_count == 1
+
+            # Mutations are not retried on server errors...
+            mock_session.post = Mock(side_effect=self._mock_responses(500))
+            assert (
+                await api.async_set_control("test_device_id", "filtrationState", True)
+                is False
+            )
+            assert mock_session.post.call_count == 1
+
+            # ...but when throttled
+            mock_session.post = Mock(side_effect=self._mock_responses(429, 200))
+            await api.async_set_control("test_device_id", "filtrationState", True)
+            assert mock_session.post.call_count == 2
+
+            # Retries are bounded by MAX_RETRIES
+            mock_session.post = Mock(
+                side_effect=self._mock_responses(*[503] * (MAX_RETRIES + 1))
+            )
+            assert await api.async_get_device("test_device_id") is None
+            assert mock_session.post.call_count == MAX_RETRIES + 1
+
+        assert api.request_stats["throttled"] == 1
+        assert api.request_stats["failures"] == 3
+
+    def test_retry_delay(self):
+        """Test retry delays grow exponentially and are capped."""
+        from custom_components.ixfield.api import get_retry_delay
+        from custom_components.ixfield.const import (
+            RETRY_BACKOFF_BASE,
+            RETRY_BACKOFF_MAX,
+        )
+
+        for attempt in range(1, 4):
+            delay = get_retry_delay(attempt)
+            full_delay = RETRY_BACKOFF_BASE * 2 ** (attempt - 1)
+            assert full_delay / 2 <= delay <= full_delay
+
+        assert get_retry_delay(100) <= RETRY_BACKOFF_MAX
+        assert get_retry_delay(1, retry_after=5) == 5
+
+    @pytest.mark.asyncio
+    async def test_api_fails_fast_when_circuit_open(self):
+        """Test requests are not sent while the circuit breaker is open."""
+        from custom_components.ixfield.circuit_breaker import (
+            CircuitBreaker,
+            CircuitOpenError,
+        )
+
+        mock_session = Mock()
+        mock_session.post = Mock(side_effect=self._mock_responses(500, 500))
+        api = IxfieldApi(
+            "test@example.com",
+            "password123",
+            mock_session,
+            circuit_breaker=CircuitBreaker(failure_threshold=1),
+        )
+        api._token = "test_token_123"
+
+        assert (
+            await api.async_set_control("test_device_id", "filtrationState", True)
+            is False
+        )
+        assert api.circuit_breaker.state == "open"
+
+        with pytest.raises(CircuitOpenError):
+            await api.async_get_device("test_device_id")
+        assert mock_session.post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_api_failed_authentication_opens_circuit(self):
+        """Test failed logins count as failures and stop further login attempts."""
+        import asyncio
+        from custom_components.ixfield.circuit_breaker import (
+            CircuitBreaker,
+            CircuitOpenError,
+        )
+
+        mock_session = Mock()
+        api = IxfieldApi(
+            "test@example.com",
+            "password123",
+            mock_session,
+            circuit_breaker=CircuitBreaker(failure_threshold=2),
+        )
+        api.async_login = AsyncMock(side_effect=Exception("Cognito unreachable"))
+
+        results = await asyncio.gather(
+            *(api.async_get_device(f"device_{index}") for index in range(10)),
+            return_exceptions=True,
+        )
+
+        # Requests waiting for the login fail fast once the circuit opened
+        assert api.async_login.call_count == 2
+        assert api.circuit_breaker.state == "open"
+        assert sum(isinstance(result, CircuitOpenError) for result in results) == 8
+        mock_session.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_api_coalesces_concurrent_device_fetches(self):
+        """Test concurrent fetches of a device share one request."""
+        import asyncio
+
+        mock_session = Mock()
+        mock_session.post = Mock(side_effect=self._mock_responses(200, 200))
+        api = IxfieldApi("test@example.com", "password123", mock_session)
+        api._token = "test_token_123"
+
+        results = await asyncio.gather(
+            api.async_get_device("test_device_id"),
+            api.async_get_device("test_device_id"),
+            api.async_get_device("test_device_id"),
+        )
+
+        assert results == [SAMPLE_DEVICE_DATA] * 3
+        assert mock_session.post.call_count == 1
+        assert api.request_stats["coalesced"] == 2
+
+        # Later fetches send a new request
+        await api.async_get_device("test_device_id")
+        assert mock_session.post.call_count == 2
+
+    def test_api_import_does_not_load_auth_stack(self):
+        """Test boto3 and pycognito are only imported when authenticating."""
+        code = (
+            "import sys\n"
+            "import custom_components.ixfield.api, custom_components.ixfield.config_flow\n"
+            "assert 'boto3' not in sys.modules\n"
+            "assert 'pycognito' not in sys.modules\n"
+        )
+        root = Path(__file__).resolve().parents[3]
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
     def test_api_session_management(self):
         """Test API session management."""
         mock_session = Mock()
         api = IxfieldApi("test@example.com", "password123", mock_session)
-        
+
         # Test session creation
         assert api._session == mock_session
 
@@ -184,17 +652,14 @@ class TestIxfieldDataUpdateCoordinator:
             "test_device_id": {
                 "name": "Test Pool",
                 "type": "POOL",
-                "custom_name": "Test Pool"
+                "custom_name": "Test Pool",
             }
         }
-        
+
         coordinator = IxfieldCoordinator(
-            mock_hass,
-            mock_api,
-            device_dict,
-            extract_device_info_sensors=True
+            mock_hass, mock_api, device_dict, extract_device_info_sensors=True
         )
-        
+
         assert coordinator.api == mock_api
         assert coordinator.device_dict == device_dict
         assert coordinator.device_ids == ["test_device_id"]
@@ -205,24 +670,15 @@ class TestIxfieldDataUpdateCoordinator:
         """Test coordinator data update functionality."""
         mock_hass = Mock()
         mock_api = Mock()
-        device_dict = {
-            "test_device_id": {
-                "name": "Test Pool",
-                "type": "POOL"
-            }
-        }
-        
+        device_dict = {"test_device_id": {"name": "Test Pool", "type": "POOL"}}
+
         mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
-        
-        coordinator = IxfieldCoordinator(
-            mock_hass,
-            mock_api,
-            device_dict
-        )
-        
+
+        coordinator = IxfieldCoordinator(mock_hass, mock_api, device_dict)
+
         # Test data update
         data = await coordinator._async_update_data()
-        
+
         assert data is not None
         assert "test_device_id" in data
         assert data["test_device_id"] == SAMPLE_DEVICE_DATA
@@ -234,17 +690,13 @@ class TestIxfieldDataUpdateCoordinator:
         mock_api = Mock()
         device_dict = {
             "device_1": {"name": "Pool 1", "type": "POOL"},
-            "device_2": {"name": "Pool 2", "type": "POOL"}
+            "device_2": {"name": "Pool 2", "type": "POOL"},
         }
-        
+
         mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
-        
-        coordinator = IxfieldCoordinator(
-            mock_hass,
-            mock_api,
-            device_dict
-        )
-        
+
+        coordinator = IxfieldCoordinator(mock_hass, mock_api, device_dict)
+
         assert len(coordinator.device_ids) == 2
         assert "device_1" in coordinator.device_ids
         assert "device_2" in coordinator.device_ids
@@ -254,24 +706,618 @@ class TestIxfieldDataUpdateCoordinator:
         """Test coordinator error handling."""
         mock_hass = Mock()
         mock_api = Mock()
+        device_dict = {"test_device_id": {"name": "Test Pool", "type": "POOL"}}
+
+        mock_api.async_get_device = AsyncMock(side_effect=Exception("API Error"))
+
+        coordinator = IxfieldCoordinator(mock_hass, mock_api, device_dict)
+
+        # Test error handling - should raise UpdateFailed
+        with pytest.raises(
+            UpdateFailed, match="Error updating device test_device_id: API Error"
+        ):
+            await coordinator._async_update_data()
+
+    @pytest.mark.asyncio
+    async def test_coordinator_partial_failure_keeps_snapshot(self):
+        """Test a failed device keeps its last good snapshot while others refresh."""
+        mock_hass = Mock()
+        mock_api = Mock()
         device_dict = {
-            "test_device_id": {
-                "name": "Test Pool",
-                "type": "POOL"
-            }
+            "device_1": {"name": "Pool 1", "type": "POOL"},
+            "device_2": {"name": "Pool 2", "type": "POOL"},
         }
-        
-        mock_api.async_get_device = AsyncMock(side_effect=Exception("API Error"))
-        
+
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+
+        coordinator = IxfieldCoordinator(mock_hass, mock_api, device_dict)
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.is_device_available("device_2") is True
+
+        fresh_data = {"data": {"device": {"id": "device_1", "type": "POOL"}}}
+
+        async def get_device(device_id, live_only=False):
+            if device_id == "device_2":
+                raise Exception("API Error")
+            return fresh_data
+
+        mock_api.async_get_device = AsyncMock(side_effect=get_device)
+        coordinator.data = await coordinator._async_update_data()
+
+        assert coordinator.data["device_1"] == merge_live_device_data(
+            SAMPLE_DEVICE_DATA, fresh_data
+        )
+        assert coordinator.data["device_2"] == SAMPLE_DEVICE_DATA
+
+        state = coordinator.get_device_state("device_2")
+        assert state.error_count == 1
+        assert state.last_error == "API Error"
+        assert state.is_stale is True
+        assert state.stale_since == state.last_success
+        assert coordinator.get_device_state("device_1").is_stale is False
+        assert coordinator.is_device_available("device_2") is True
+
+        # Device becomes unavailable after repeated failures
+        for _ in range(2):
+            coordinator.data = await coordinator._async_update_data()
+        assert coordinator.get_device_state("device_2").error_count == 3
+        assert coordinator.is_device_available("device_2") is False
+        assert coordinator.is_device_available("device_1") is True
+
+    @pytest.mark.asyncio
+    async def test_coordinator_first_refresh_needs_every_device(self):
+        """Test setup is retried when a device could not be fetched at first."""
+        from homeassistant.exceptions import ConfigEntryNotReady
+
+        mock_api = Mock()
+        device_dict = {
+            "device_1": {"name": "Pool 1", "type": "POOL"},
+            "device_2": {"name": "Pool 2", "type": "POOL"},
+        }
+
+        async def get_device(device_id, live_only=False):
+            if device_id == "device_2":
+                raise Exception("API Error")
+            return SAMPLE_DEVICE_DATA
+
+        mock_api.async_get_device = AsyncMock(side_effect=get_device)
+        coordinator = IxfieldCoordinator(Mock(), mock_api, device_dict)
+
+        with pytest.raises(ConfigEntryNotReady, match="device_2"):
+            await coordinator.async_config_entry_first_refresh()
+
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+        await coordinator.async_config_entry_first_refresh()
+        assert set(coordinator.data) == {"device_1", "device_2"}
+
+    @pytest.mark.asyncio
+    async def test_coordinator_restores_saved_snapshot(self):
+        """Test a saved snapshot is restored as stale data on the next start."""
+        mock_hass = Mock()
+        mock_api = Mock()
+        device_dict = {"test_device_id": {"name": "Test Pool", "type": "POOL"}}
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+
+        store = Mock()
+        store.async_load = AsyncMock(return_value=None)
         coordinator = IxfieldCoordinator(
+            mock_hass, mock_api, device_dict, snapshot_store=store
+        )
+        assert await coordinator.async_restore_snapshot() is False
+
+        coordinator.data = await coordinator._async_update_data()
+        store.async_delay_save.assert_called_once()
+        saved = store.async_delay_save.call_args.args[0]()
+
+        # Simulate a restart
+        store.async_load = AsyncMock(return_value=saved)
+        restarted = IxfieldCoordinator(
+            mock_hass, mock_api, device_dict, snapshot_store=store, update_interval=None
+        )
+        assert await restarted.async_restore_snapshot() is True
+
+        assert restarted.data == coordinator.data
+        assert restarted.get_device_info(
+            "test_device_id"
+        ) == coordinator.get_device_info("test_device_id")
+        assert restarted.get_device_name(
+            "test_device_id"
+        ) == coordinator.get_device_name("test_device_id")
+        state = restarted.get_device_state("test_device_id")
+        assert state.is_stale is True
+        assert (
+            state.last_success
+            == coordinator.get_device_state("test_device_id").last_success
+        )
+        assert restarted.is_device_available("test_device_id") is True
+
+        # Entities show the restored data as stale until the first live fetch
+        from custom_components.ixfield.entity_helper import (
+            EntityDeviceStateMixin,
+            create_coordinator_context,
+        )
+
+        entity = EntityDeviceStateMixin()
+        entity.coordinator = restarted
+        entity._device_id = "test_device_id"
+        assert entity.extra_state_attributes == {
+            "stale": True,
+            "stale_since": state.last_success.isoformat(),
+        }
+        listener = Mock()
+        restarted.async_add_listener(
+            listener, create_coordinator_context("test_device_id", "filtrationState")
+        )
+        restarted.async_update_listeners()
+        listener.reset_mock()
+
+        # The unchanged data still updates the entity to clear the stale mark
+        await restarted.async_refresh_devices(["test_device_id"])
+        assert restarted.get_device_state("test_device_id").is_stale is False
+        assert entity.extra_state_attributes is None
+        listener.assert_called_once()
+
+        # A device added since the snapshot was saved needs the first refresh
+        added = IxfieldCoordinator(
             mock_hass,
             mock_api,
-            device_dict
+            {**device_dict, "new_device_id": {"name": "New Pool", "type": "POOL"}},
+            snapshot_store=store,
         )
-        
-        # Test error handling - should raise UpdateFailed
-        with pytest.raises(UpdateFailed, match="Error updating device test_device_id: API Error"):
-            await coordinator._async_update_data()
+        assert await added.async_restore_snapshot() is False
+        assert set(added.data) == {"test_device_id"}
+
+    @pytest.mark.asyncio
+    async def test_coordinator_merges_command_refreshes(self):
+        """Test refresh requests of commands are merged and refresh only their devices."""
+        import asyncio
+
+        mock_hass = Mock()
+        mock_api = Mock()
+        device_dict = {
+            "device_1": {"name": "Pool 1", "type": "POOL"},
+            "device_2": {"name": "Pool 2", "type": "POOL"},
+            "device_3": {"name": "Pool 3", "type": "POOL"},
+        }
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+
+        coordinator = IxfieldCoordinator(mock_hass, mock_api, device_dict)
+        coordinator.data = await coordinator._async_update_data()
+        mock_api.async_get_device.reset_mock()
+
+        fresh_data = {"data": {"device": {"id": "device_1", "type": "POOL"}}}
+        mock_api.async_get_device = AsyncMock(return_value=fresh_data)
+
+        with patch(
+            "custom_components.ixfield.coordinator.COMMAND_REFRESH_WINDOW", 0.01
+        ):
+            await asyncio.gather(
+                coordinator.async_request_device_refresh("device_1"),
+                coordinator.async_request_device_refresh("device_2"),
+                coordinator.async_request_device_refresh("device_1"),
+            )
+
+        fetched = sorted(
+            call.args[0] for call in mock_api.async_get_device.call_args_list
+        )
+        assert fetched == ["device_1", "device_2"]
+        merged_data = merge_live_device_data(SAMPLE_DEVICE_DATA, fresh_data)
+        assert coordinator.data["device_1"] == merged_data
+        assert coordinator.data["device_2"] == merged_data
+        assert coordinator.data["device_3"] == SAMPLE_DEVICE_DATA
+
+    @pytest.mark.asyncio
+    async def test_coordinator_refresh_devices_notifies_only_their_listeners(self):
+        """Test a targeted refresh only fetches and notifies the given devices."""
+        import copy
+        from custom_components.ixfield.entity_helper import create_coordinator_context
+
+        mock_hass = Mock()
+        mock_api = Mock()
+        device_dict = {
+            "device_1": {"name": "Pool 1", "type": "POOL"},
+            "device_2": {"name": "Pool 2", "type": "POOL"},
+        }
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+
+        coordinator = IxfieldCoordinator(
+            mock_hass, mock_api, device_dict, update_interval=None
+        )
+        listener_1 = Mock()
+        listener_2 = Mock()
+        coordinator.async_add_listener(
+            listener_1, create_coordinator_context("device_1", "filtrationState")
+        )
+        coordinator.async_add_listener(
+            listener_2, create_coordinator_context("device_2", "filtrationState")
+        )
+        await coordinator.async_refresh()
+        assert listener_1.call_count == 1
+        assert listener_2.call_count == 1
+
+        changed_data = copy.deepcopy(SAMPLE_DEVICE_DATA)
+        for control in changed_data["data"]["device"]["liveDeviceData"]["controls"]:
+            if control["name"] == "filtrationState":
+                control["value"] = "false"
+        mock_api.async_get_device = AsyncMock(return_value=changed_data)
+
+        assert await coordinator.async_refresh_devices(["device_1"]) == {}
+
+        mock_api.async_get_device.assert_called_once_with("device_1", live_only=True)
+        assert coordinator.data["device_1"] == changed_data
+        assert coordinator.data["device_2"] == SAMPLE_DEVICE_DATA
+        assert listener_1.call_count == 2
+        assert listener_2.call_count == 1
+
+        # Device 2 still sees its change on the next full refresh
+        await coordinator.async_refresh()
+        assert listener_1.call_count == 2
+        assert listener_2.call_count == 2
+
+        # Fetch errors are returned instead of raised
+        mock_api.async_get_device = AsyncMock(side_effect=Exception("timeout"))
+        errors = await coordinator.async_refresh_devices(["device_1"])
+        assert errors == {"device_1": "timeout"}
+        assert coordinator.get_device_state("device_1").error_count == 1
+
+    @pytest.mark.asyncio
+    async def test_optimistic_update_verified_by_snapshot(self):
+        """Test a command is confirmed by any new snapshot, without waiting for its refresh."""
+        import asyncio
+        import copy
+        from custom_components.ixfield.optimistic_state import (
+            OptimisticStateManager,
+            boolean_comparison,
+        )
+
+        mock_hass = Mock()
+        mock_api = Mock()
+        device_dict = {"device_1": {"name": "Pool 1", "type": "POOL"}}
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+
+        coordinator = IxfieldCoordinator(mock_hass, mock_api, device_dict)
+        coordinator.data = await coordinator._async_update_data()
+
+        refresh_started = asyncio.Event()
+
+        async def slow_refresh():
+            refresh_started.set()
+            await asyncio.sleep(10)
+
+        manager = OptimisticStateManager("Pump", "Switch")
+        operation = asyncio.ensure_future(
+            manager.execute_with_optimistic_update(
+                target_value=False,
+                api_call=AsyncMock(return_value=True),
+                verification_call=lambda: coordinator.get_device_index(
+                    "device_1"
+                ).get_control_value("filtrationState"),
+                value_comparison=boolean_comparison,
+                coordinator_refresh=slow_refresh,
+                entity_state_update=Mock(),
+                snapshot_listener=lambda check: coordinator.async_add_snapshot_listener(
+                    "device_1", check
+                ),
+            )
+        )
+        await refresh_started.wait()
+        assert manager.get_current_value(True) is False
+
+        # A snapshot without the change keeps the operation pending
+        coordinator.async_update_listeners()
+        await asyncio.sleep(0)
+        assert manager.is_operation_pending()
+
+        changed_data = copy.deepcopy(SAMPLE_DEVICE_DATA)
+        for control in changed_data["data"]["device"]["liveDeviceData"]["controls"]:
+            if control["name"] == "filtrationState":
+                control["value"] = "false"
+        coordinator.data = {"device_1": changed_data}
+        coordinator.async_update_listeners()
+
+        assert await asyncio.wait_for(operation, 1) is True
+        assert not manager.is_operation_pending()
+        assert coordinator._snapshot_listeners == {}
+
+    @pytest.mark.asyncio
+    async def test_optimistic_update_replaced_by_newer_value(self):
+        """Test a new value replaces a pending operation instead of being dropped."""
+        import asyncio
+        from custom_components.ixfield.optimistic_state import OptimisticStateManager
+
+        actual = {"value": 20}
+        listeners = []
+
+        def snapshot_listener(check):
+            listeners.append(check)
+            return lambda: listeners.remove(check)
+
+        async def set_value(value):
+            await asyncio.sleep(0)
+            return True
+
+        manager = OptimisticStateManager("Setpoint", "Number")
+
+        def execute(value):
+            return asyncio.ensure_future(
+                manager.execute_with_optimistic_update(
+                    target_value=value,
+                    api_call=lambda: set_value(value),
+                    verification_call=lambda: actual["value"],
+                    entity_state_update=Mock(),
+                    snapshot_listener=snapshot_listener,
+                )
+            )
+
+        first = execute(21)
+        await asyncio.sleep(0.01)
+        assert manager.get_current_value(20) == 21
+
+        second = execute(22)
+        assert await asyncio.wait_for(first, 1) is True
+        assert manager.is_operation_pending()
+        assert manager.get_current_value(20) == 22
+
+        actual["value"] = 22
+        for check in list(listeners):
+            check()
+        assert await asyncio.wait_for(second, 1) is True
+        assert not manager.is_operation_pending()
+        assert listeners == []
+
+    @pytest.mark.asyncio
+    async def test_coordinator_polls_live_data_between_metadata_fetches(self):
+        """Test full device data is fetched on setup and periodically, live data otherwise."""
+        import copy
+
+        mock_hass = Mock()
+        mock_api = Mock()
+        device_dict = {"device_1": {"name": "Pool 1", "type": "POOL"}}
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+
+        coordinator = IxfieldCoordinator(mock_hass, mock_api, device_dict)
+        coordinator.data = await coordinator._async_update_data()
+        mock_api.async_get_device.assert_called_once_with("device_1", live_only=False)
+
+        live_device = {
+            "id": "device_1",
+            "connectionStatus": "OFFLINE",
+            "liveDeviceData": copy.deepcopy(
+                SAMPLE_DEVICE_DATA["data"]["device"]["liveDeviceData"]
+            ),
+        }
+        for control in live_device["liveDeviceData"]["controls"]:
+            if control["name"] == "filtrationState":
+                control["value"] = "false"
+        mock_api.async_get_device = AsyncMock(
+            return_value={"data": {"device": live_device}}
+        )
+        coordinator.data = await coordinator._async_update_data()
+        mock_api.async_get_device.assert_called_once_with("device_1", live_only=True)
+
+        # Live data is merged into the full snapshot
+        device = coordinator.data["device_1"]["data"]["device"]
+        sample_device = SAMPLE_DEVICE_DATA["data"]["device"]
+        assert device["address"] == sample_device["address"]
+        assert device["thingType"] == sample_device["thingType"]
+        assert device["connectionStatus"] == "OFFLINE"
+        assert (
+            coordinator.get_device_index("device_1").get_control_value(
+                "filtrationState"
+            )
+            == "false"
+        )
+        device_info = coordinator.get_device_info("device_1")
+        assert device_info["connection_status"] == "OFFLINE"
+        assert device_info["company"]["name"] == sample_device["company"]["name"]
+
+        # The full data is fetched again once it is old
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+        with patch(
+            "custom_components.ixfield.coordinator.METADATA_REFRESH_INTERVAL", 0
+        ):
+            coordinator.data = await coordinator._async_update_data()
+        mock_api.async_get_device.assert_called_once_with("device_1", live_only=False)
+
+    @pytest.mark.asyncio
+    async def test_coordinator_adaptive_poll_intervals(self):
+        """Test the poll interval of a device follows its activity and connection."""
+        import copy
+
+        mock_hass = Mock()
+        mock_api = Mock()
+        device_dict = {"device_1": {"name": "Pool 1", "type": "POOL"}}
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+
+        coordinator = IxfieldCoordinator(mock_hass, mock_api, device_dict)
+        schedule = coordinator.get_poll_schedule("device_1")
+        coordinator.data = await coordinator._async_update_data()
+        assert (schedule.interval, schedule.reason) == (120, "normal")
+
+        # Polls without any change slow down
+        for _ in range(5):
+            coordinator.data = await coordinator._async_update_data()
+        assert (schedule.interval, schedule.reason) == (360, "idle")
+
+        # A command speeds up the polls
+        schedule.record_command()
+        coordinator.data = await coordinator._async_update_data()
+        assert (schedule.interval, schedule.reason) == (30, "active")
+        schedule.last_activity = None
+
+        running = copy.deepcopy(SAMPLE_DEVICE_DATA)
+        running["data"]["device"]["liveDeviceData"]["runningServiceSequence"] = {
+            "name": "backwash"
+        }
+        mock_api.async_get_device = AsyncMock(return_value=running)
+        coordinator.data = await coordinator._async_update_data()
+        assert (schedule.interval, schedule.reason) == (30, "active")
+
+        # Offline devices back off exponentially
+        offline = copy.deepcopy(SAMPLE_DEVICE_DATA)
+        offline["data"]["device"]["connectionStatus"] = "OFFLINE"
+        mock_api.async_get_device = AsyncMock(return_value=offline)
+        coordinator.data = await coordinator._async_update_data()
+        assert (schedule.interval, schedule.reason) == (240, "offline")
+        coordinator.data = await coordinator._async_update_data()
+        assert schedule.interval == 480
+        for _ in range(5):
+            coordinator.data = await coordinator._async_update_data()
+        assert schedule.interval == 1800
+
+        # Coming back online is a change of the device
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+        coordinator.data = await coordinator._async_update_data()
+        assert (schedule.interval, schedule.reason) == (30, "active")
+        summary = coordinator.get_device_status_summary("device_1")
+        assert summary["poll_interval"] == 30
+        assert summary["poll_reason"] == "active"
+
+    @pytest.mark.asyncio
+    async def test_coordinator_scheduled_refresh_polls_due_devices(self):
+        """Test scheduled refreshes only fetch the devices due for a poll."""
+        mock_hass = Mock()
+        mock_api = Mock()
+        device_dict = {
+            "device_1": {"name": "Pool 1", "type": "POOL"},
+            "device_2": {"name": "Pool 2", "type": "POOL"},
+        }
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+
+        coordinator = IxfieldCoordinator(mock_hass, mock_api, device_dict)
+        coordinator.data = await coordinator._async_update_data()
+        assert mock_api.async_get_device.call_count == 2
+
+        coordinator._scheduled_refresh = True
+        mock_api.async_get_device.reset_mock()
+        assert await coordinator._async_update_data() is coordinator.data
+        mock_api.async_get_device.assert_not_called()
+
+        coordinator.get_poll_schedule("device_2").next_due = 0
+        data = await coordinator._async_update_data()
+        mock_api.async_get_device.assert_called_once_with("device_2", live_only=True)
+        assert set(data) == {"device_1", "device_2"}
+        assert data["device_1"] is coordinator.data["device_1"]
+
+        schedules = coordinator.get_fetch_stats()["poll_schedules"]
+        assert set(schedules) == {"device_1", "device_2"}
+        assert schedules["device_2"]["poll_interval"] == 120
+        assert 0 < schedules["device_2"]["next_poll_in"] <= 120
+
+    @pytest.mark.asyncio
+    async def test_coordinator_staggers_device_polls(self):
+        """Test devices refreshed together are spread over the poll interval."""
+        mock_hass = Mock()
+        mock_api = Mock()
+        device_dict = {
+            f"device_{index}": {"name": f"Pool {index}", "type": "POOL"}
+            for index in range(4)
+        }
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+
+        coordinator = IxfieldCoordinator(mock_hass, mock_api, device_dict)
+        start = time.monotonic()
+        coordinator.data = await coordinator._async_update_data()
+
+        # Each device is due within its own quarter of the interval
+        for index, device_id in enumerate(coordinator.device_ids):
+            delay = coordinator.get_poll_schedule(device_id).next_due - start
+            assert 120 * (index + 0.5) / 4 - 1 < delay <= 120 * (index + 1) / 4 + 1
+
+        # Scheduled polls keep the device in its slot
+        coordinator._scheduled_refresh = True
+        schedule = coordinator.get_poll_schedule("device_1")
+        schedule.next_due = 0
+        start = time.monotonic()
+        coordinator.data = await coordinator._async_update_data()
+        mock_api.async_get_device.assert_called_with("device_1", live_only=True)
+        assert 119 < schedule.next_due - start <= 121
+
+    @pytest.mark.asyncio
+    async def test_coordinator_device_index(self):
+        """Test coordinator indexes device snapshots by sensor and control name."""
+        mock_hass = Mock()
+        mock_api = Mock()
+        device_dict = {"test_device_id": {"name": "Test Pool", "type": "POOL"}}
+
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+
+        coordinator = IxfieldCoordinator(mock_hass, mock_api, device_dict)
+        coordinator.data = await coordinator._async_update_data()
+
+        index = coordinator.get_device_index("test_device_id")
+        assert index.snapshot is SAMPLE_DEVICE_DATA
+        assert coordinator.get_device_index("test_device_id") is index
+        assert index.get_sensor_value("poolTempWithSettings") == 22.8
+        assert index.get_sensor_value("poolTempWithSettings", "desiredValue") == 15.5
+        assert (
+            index.get_sensor_value("nonexistent", fallback_value="default") == "default"
+        )
+        assert index.get_control_value("filtrationState") == "true"
+
+        # Replacing the snapshot rebuilds the index
+        coordinator.data = {"test_device_id": {"data": {"device": {}}}}
+        new_index = coordinator.get_device_index("test_device_id")
+        assert new_index is not index
+        assert new_index.get_sensor_value("poolTempWithSettings") is None
+
+    @pytest.mark.asyncio
+    async def test_coordinator_notifies_only_changed_entities(self):
+        """Test listeners are only called when their sensors or controls changed."""
+        import copy
+        from custom_components.ixfield.entity_helper import create_coordinator_context
+
+        mock_hass = Mock()
+        mock_api = Mock()
+        device_dict = {"test_device_id": {"name": "Test Pool", "type": "POOL"}}
+
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+
+        coordinator = IxfieldCoordinator(
+            mock_hass, mock_api, device_dict, update_interval=None
+        )
+        temp_listener = Mock()
+        pump_listener = Mock()
+        info_listener = Mock()
+        coordinator.async_add_listener(
+            temp_listener,
+            create_coordinator_context("test_device_id", "poolTempWithSettings"),
+        )
+        coordinator.async_add_listener(
+            pump_listener,
+            create_coordinator_context("test_device_id", "filtrationState"),
+        )
+        coordinator.async_add_listener(
+            info_listener, create_coordinator_context("test_device_id")
+        )
+
+        # First data notifies everything
+        await coordinator.async_refresh()
+        assert temp_listener.call_count == 1
+        assert pump_listener.call_count == 1
+        assert info_listener.call_count == 1
+
+        # Unchanged data notifies nothing
+        mock_api.async_get_device = AsyncMock(
+            return_value=copy.deepcopy(SAMPLE_DEVICE_DATA)
+        )
+        await coordinator.async_refresh()
+        assert temp_listener.call_count == 1
+        assert pump_listener.call_count == 1
+        assert info_listener.call_count == 1
+        assert coordinator.skipped_state_writes == 3
+
+        # Changed pump control only notifies the pump listener
+        changed_data = copy.deepcopy(SAMPLE_DEVICE_DATA)
+        for control in changed_data["data"]["device"]["liveDeviceData"]["controls"]:
+            if control["name"] == "filtrationState":
+                control["value"] = "false"
+        mock_api.async_get_device = AsyncMock(return_value=changed_data)
+        await coordinator.async_refresh()
+        assert temp_listener.call_count == 1
+        assert pump_listener.call_count == 2
+        assert info_listener.call_count == 1
+        assert coordinator.skipped_state_writes == 5
 
     def test_coordinator_device_info_methods(self):
         """Test coordinator device info methods."""
@@ -281,24 +1327,20 @@ class TestIxfieldDataUpdateCoordinator:
             "test_device_id": {
                 "name": "Test Pool",
                 "type": "POOL",
-                "custom_name": "Test Pool"
+                "custom_name": "Test Pool",
             }
         }
-        
-        coordinator = IxfieldCoordinator(
-            mock_hass,
-            mock_api,
-            device_dict
-        )
-        
+
+        coordinator = IxfieldCoordinator(mock_hass, mock_api, device_dict)
+
         # Test device name
         device_name = coordinator.get_device_name("test_device_id")
         assert device_name == "Test Pool"
-        
+
         # Test device type
         device_type = coordinator.get_device_type("test_device_id")
         assert device_type == "Unknown"  # No device info loaded yet
-        
+
         # Test entity name
         entity_name = coordinator.get_entity_name("test_device_id", "sensor")
         assert entity_name == "Test Pool_sensor"
@@ -328,30 +1370,18 @@ class TestIxfieldDataUpdateCoordinator:
         """Test coordinator update interval configuration."""
         mock_hass = Mock()
         mock_api = Mock()
-        device_dict = {
-            "test_device_id": {
-                "name": "Test Pool",
-                "type": "POOL"
-            }
-        }
-        
+        device_dict = {"test_device_id": {"name": "Test Pool", "type": "POOL"}}
+
         # Test default update interval
-        coordinator = IxfieldCoordinator(
-            mock_hass,
-            mock_api,
-            device_dict
-        )
-        
+        coordinator = IxfieldCoordinator(mock_hass, mock_api, device_dict)
+
         assert coordinator.update_interval == timedelta(minutes=2)
-        
+
         # Test custom update interval
         coordinator_custom = IxfieldCoordinator(
-            mock_hass,
-            mock_api,
-            device_dict,
-            update_interval=timedelta(minutes=5)
+            mock_hass, mock_api, device_dict, update_interval=timedelta(minutes=5)
         )
-        
+
         assert coordinator_custom.update_interval == timedelta(minutes=5)
 
     @pytest.mark.asyncio
@@ -359,24 +1389,15 @@ class TestIxfieldDataUpdateCoordinator:
         """Test coordinator data refresh functionality."""
         mock_hass = Mock()
         mock_api = Mock()
-        device_dict = {
-            "test_device_id": {
-                "name": "Test Pool",
-                "type": "POOL"
-            }
-        }
-        
+        device_dict = {"test_device_id": {"name": "Test Pool", "type": "POOL"}}
+
         mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
-        
-        coordinator = IxfieldCoordinator(
-            mock_hass,
-            mock_api,
-            device_dict
-        )
-        
+
+        coordinator = IxfieldCoordinator(mock_hass, mock_api, device_dict)
+
         # Test refresh
         await coordinator.async_refresh()
-        
+
         # Verify API was called
         mock_api.async_get_device.assert_called_once()
 
@@ -384,19 +1405,10 @@ class TestIxfieldDataUpdateCoordinator:
         """Test coordinator device connection status."""
         mock_hass = Mock()
         mock_api = Mock()
-        device_dict = {
-            "test_device_id": {
-                "name": "Test Pool",
-                "type": "POOL"
-            }
-        }
-        
-        coordinator = IxfieldCoordinator(
-            mock_hass,
-            mock_api,
-            device_dict
-        )
-        
+        device_dict = {"test_device_id": {"name": "Test Pool", "type": "POOL"}}
+
+        coordinator = IxfieldCoordinator(mock_hass, mock_api, device_dict)
+
         # Test status summary - should return device_id since no device info loaded yet
         status = coordinator.get_device_status_summary("test_device_id")
         assert status["name"] == "test_device_id"  # No device info loaded yet
@@ -404,4 +1416,88 @@ class TestIxfieldDataUpdateCoordinator:
     def test_coordinator_device_eligibilities(self):
         """Test coordinator device eligibilities."""
         # This method doesn't exist in the coordinator
-        pass 
\ No newline at end of file
+        pass
+
+    @pytest.mark.asyncio
+    async def test_coordinator_concurrent_fetch_limit(self):
+        """Test devices are fetched concurrently up to the configured limit."""
+        import asyncio
+
+        mock_hass = Mock()
+        mock_api = Mock()
+        device_dict = {
+            f"device_{i}": {"name": f"Pool {i}", "type": "POOL"} for i in range(6)
+        }
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_device(device_id, live_only=False):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return SAMPLE_DEVICE_DATA
+
+        mock_api.async_get_device = AsyncMock(side_effect=get_device)
+
+        coordinator = IxfieldCoordinator(
+            mock_hass, mock_api, device_dict, max_concurrent_requests=2
+        )
+
+        data = await coordinator._async_update_data()
+
+        assert list(data.keys()) == coordinator.device_ids
+        assert mock_api.async_get_device.call_count == 6
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_coordinator_fetch_stats(self):
+        """Test per-device and whole refresh fetch timings are reported."""
+        mock_hass = Mock()
+        mock_api = Mock()
+        device_dict = {
+            "device_1": {"name": "Pool 1", "type": "POOL"},
+            "device_2": {"name": "Pool 2", "type": "POOL"},
+        }
+
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+
+        coordinator = IxfieldCoordinator(mock_hass, mock_api, device_dict)
+
+        stats = coordinator.get_fetch_stats()
+        assert stats["refresh_time"] is None
+        assert stats["device_fetch_times"] == {}
+
+        await coordinator._async_update_data()
+
+        stats = coordinator.get_fetch_stats()
+        assert stats["max_concurrent_requests"] == coordinator.max_concurrent_requests
+        assert stats["refresh_time"] >= 0
+        assert set(stats["device_fetch_times"]) == {"device_1", "device_2"}
+
+    @pytest.mark.asyncio
+    async def test_coordinator_batched_fetch(self):
+        """Test coordinator fetches devices with batched requests."""
+        mock_hass = Mock()
+        mock_api = Mock()
+        device_dict = {
+            f"device_{i}": {"name": f"Pool {i}", "type": "POOL"} for i in range(5)
+        }
+
+        async def get_batch(device_ids, live_only=False):
+            return {device_id: SAMPLE_DEVICE_DATA for device_id in device_ids}
+
+        mock_api.async_get_devices_batch = AsyncMock(side_effect=get_batch)
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+
+        coordinator = IxfieldCoordinator(
+            mock_hass, mock_api, device_dict, device_batch_size=2
+        )
+
+        data = await coordinator._async_update_data()
+
+        assert list(data.keys()) == coordinator.device_ids
+        assert mock_api.async_get_devices_batch.call_count == 3
+        mock_api.async_get_device.assert_not_called()
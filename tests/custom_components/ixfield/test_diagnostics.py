@@ -0,0 +1,43 @@
+"""Tests for IXField diagnostics module."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from custom_components.ixfield.coordinator import IxfieldCoordinator
+from custom_components.ixfield.diagnostics import (
+    REDACTED,
+    async_get_config_entry_diagnostics,
+)
+from .test_data import SAMPLE_DEVICE_DATA
+
+
+class TestDiagnostics:
+    """Test config entry diagnostics."""
+
+    @pytest.mark.asyncio
+    async def test_config_entry_diagnostics(self):
+        """Test diagnostics report polling and fetch state without credentials."""
+        mock_hass = Mock()
+        mock_api = Mock()
+        mock_api.request_stats = {"requests": 1}
+        mock_api.circuit_breaker.as_dict.return_value = {"state": "closed"}
+        mock_api.async_get_device = AsyncMock(return_value=SAMPLE_DEVICE_DATA)
+        coordinator = IxfieldCoordinator(
+            mock_hass, mock_api, {"device_1": {"name": "Pool 1", "type": "POOL"}}
+        )
+        coordinator.data = await coordinator._async_update_data()
+        entry = Mock(entry_id="entry_1", options={})
+        entry.data = {"email": "test@example.com", "password": "secret"}
+        mock_hass.data = {"ixfield": {"entry_1": {"coordinator": coordinator}}}
+
+        diagnostics = await async_get_config_entry_diagnostics(mock_hass, entry)
+
+        assert diagnostics["entry"]["data"] == {"email": REDACTED, "password": REDACTED}
+        assert diagnostics["skipped_state_writes"] == 0
+        assert diagnostics["circuit_breaker"] == {"state": "closed"}
+        stats = diagnostics["fetch_stats"]
+        assert set(stats["device_fetch_times"]) == {"device_1"}
+        assert stats["poll_schedules"]["device_1"]["poll_reason"] == "normal"
+        assert stats["api_requests"] == {"requests": 1}
+        assert diagnostics["devices"]["device_1"]["error_count"] == 0
@@ -11,9 +11,19 @@ from custom_components.ixfield.select import async_setup_entry as setup_selects
 from custom_components.ixfield.climate import async_setup_entry as setup_climate
 from custom_components.ixfield.sensor import async_setup_entry as setup_sensors
 from custom_components.ixfield.entity_helper import get_controls, create_unique_id
+from .common import create_mock_coordinator
 from .test_data import SAMPLE_DEVICE_DATA
 
 
+@pytest.fixture(autouse=True)
+def short_command_verification():
+    """Stop waiting quickly for the mocked cloud to confirm commands."""
+    with patch(
+        "custom_components.ixfield.optimistic_state.COMMAND_VERIFY_TIMEOUT", 0.05
+    ):
+        yield
+
+
 class TestSensorPlatform:
     """Test sensor platform functionality."""
 
@@ -25,14 +35,11 @@ class TestSensorPlatform:
         mock_config_entry.entry_id = "test_entry"
         
         # Mock coordinator
-        mock_coordinator = Mock()
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.device_ids = ["test_device_id"]
         mock_coordinator.get_device_info.return_value = SAMPLE_DEVICE_DATA["data"]["device"]
         mock_coordinator.get_device_name.return_value = "Test Pool"
         mock_coordinator.should_extract_device_info_sensors.return_value = False
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
         
         mock_hass.data = {
             "ixfield": {
@@ -74,10 +81,7 @@ class TestSensorPlatform:
         """Test sensor entity properties."""
         from custom_components.ixfield.sensor import IxfieldSensor
         
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.last_update_success = True
         
         config = {
@@ -101,16 +105,17 @@ class TestSensorPlatform:
         assert sensor.native_value == 0.42
         assert sensor.native_unit_of_measurement == "%"
 
+        # Availability follows the device, not the whole refresh
+        mock_coordinator.is_device_available.return_value = False
+        assert sensor.available is False
+
 
 class TestSwitchPlatform:
     """Test switch platform functionality."""
 
     def test_get_controls(self):
         """Test extraction of controls from device data."""
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         
         controls = get_controls(mock_coordinator, "test_device_id")
         
@@ -124,8 +129,7 @@ class TestSwitchPlatform:
 
     def test_get_controls_empty_data(self):
         """Test controls extraction with empty data."""
-        mock_coordinator = Mock()
-        mock_coordinator.data = {}
+        mock_coordinator = create_mock_coordinator({})
         
         controls = get_controls(mock_coordinator, "nonexistent_device")
         assert controls == []
@@ -138,13 +142,10 @@ class TestSwitchPlatform:
         mock_config_entry.entry_id = "test_entry"
         
         # Mock coordinator
-        mock_coordinator = Mock()
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.device_ids = ["test_device_id"]
         mock_coordinator.get_device_info.return_value = SAMPLE_DEVICE_DATA["data"]["device"]
         mock_coordinator.get_device_name.return_value = "Test Pool"
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
         
         mock_hass.data = {
             "ixfield": {
@@ -176,10 +177,7 @@ class TestSwitchPlatform:
         """Test switch entity properties."""
         from custom_components.ixfield.switch import IxfieldSwitch
         
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.last_update_success = True
         
         config = {
@@ -214,12 +212,10 @@ class TestSwitchPlatform:
         
         mock_hass = Mock()
         mock_hass.data = {}  # Empty data to avoid Mock.keys() error
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.last_update_success = True
         mock_coordinator.async_request_refresh = AsyncMock()
+        mock_coordinator.async_request_device_refresh = AsyncMock()
         
         # Mock the API
         mock_api = Mock()
@@ -261,12 +257,10 @@ class TestSwitchPlatform:
         
         mock_hass = Mock()
         mock_hass.data = {}  # Empty data to avoid Mock.keys() error
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.last_update_success = True
         mock_coordinator.async_request_refresh = AsyncMock()
+        mock_coordinator.async_request_device_refresh = AsyncMock()
         
         # Mock the API
         mock_api = Mock()
@@ -313,13 +307,10 @@ class TestNumberPlatform:
         mock_config_entry.entry_id = "test_entry"
         
         # Mock coordinator
-        mock_coordinator = Mock()
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.device_ids = ["test_device_id"]
         mock_coordinator.get_device_info.return_value = SAMPLE_DEVICE_DATA["data"]["device"]
         mock_coordinator.get_device_name.return_value = "Test Pool"
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
         
         mock_hass.data = {
             "ixfield": {
@@ -350,10 +341,7 @@ class TestNumberPlatform:
         """Test number entity properties."""
         from custom_components.ixfield.number import IxfieldNumber
         
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.last_update_success = True
         
         config = {
@@ -389,12 +377,10 @@ class TestNumberPlatform:
         
         mock_hass = Mock()
         mock_hass.data = {}  # Empty data to avoid Mock.keys() error
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.last_update_success = True
         mock_coordinator.async_request_refresh = AsyncMock()
+        mock_coordinator.async_request_device_refresh = AsyncMock()
         
         # Mock the API
         mock_api = Mock()
@@ -439,13 +425,10 @@ class TestSelectPlatform:
         mock_config_entry.entry_id = "test_entry"
         
         # Mock coordinator
-        mock_coordinator = Mock()
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.device_ids = ["test_device_id"]
         mock_coordinator.get_device_info.return_value = SAMPLE_DEVICE_DATA["data"]["device"]
         mock_coordinator.get_device_name.return_value = "Test Pool"
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
         
         mock_hass.data = {
             "ixfield": {
@@ -475,10 +458,7 @@ class TestSelectPlatform:
         """Test select entity properties."""
         from custom_components.ixfield.select import IxfieldSelect
         
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.last_update_success = True
         
         config = {
@@ -517,12 +497,10 @@ class TestSelectPlatform:
         
         mock_hass = Mock()
         mock_hass.data = {}  # Empty data to avoid Mock.keys() error
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.last_update_success = True
         mock_coordinator.async_request_refresh = AsyncMock()
+        mock_coordinator.async_request_device_refresh = AsyncMock()
         
         # Mock the API
         mock_api = Mock()
@@ -570,13 +548,10 @@ class TestClimatePlatform:
         mock_config_entry.entry_id = "test_entry"
         
         # Mock coordinator
-        mock_coordinator = Mock()
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.device_ids = ["test_device_id"]
         mock_coordinator.get_device_info.return_value = SAMPLE_DEVICE_DATA["data"]["device"]
         mock_coordinator.get_device_name.return_value = "Test Pool"
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
         
         mock_hass.data = {
             "ixfield": {
@@ -606,10 +581,7 @@ class TestClimatePlatform:
         """Test climate entity properties."""
         from custom_components.ixfield.climate import IxfieldClimate
         
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.last_update_success = True
         
         config = {
@@ -649,12 +621,10 @@ class TestClimatePlatform:
         mock_hass = Mock()
         mock_hass.data = {}  # Empty data to avoid Mock.keys() error
         mock_hass.config.units.temperature_unit = "°C"  # Mock temperature unit
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.last_update_success = True
         mock_coordinator.async_request_refresh = AsyncMock()
+        mock_coordinator.async_request_device_refresh = AsyncMock()
         
         # Mock the API
         mock_api = Mock()
@@ -693,10 +663,7 @@ class TestClimatePlatform:
         """Test climate HVAC modes."""
         from custom_components.ixfield.climate import IxfieldClimate
         
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.last_update_success = True
         
         config = {
@@ -729,10 +696,7 @@ class TestClimatePlatform:
         """Test climate set HVAC mode functionality."""
         from custom_components.ixfield.climate import IxfieldClimate
         
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.async_set_operating_value = Mock()
         
         config = {
@@ -766,10 +730,7 @@ class TestPlatformIntegration:
 
     def test_platform_coordination(self):
         """Test that platforms work together correctly."""
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         
         # Test that operating values and controls are properly separated
         operating_values = SAMPLE_DEVICE_DATA["data"]["device"]["liveDeviceData"]["operatingValues"]
@@ -0,0 +1,44 @@
+"""Tests for IXField request scheduler module."""
+
+import asyncio
+import time
+
+import pytest
+
+from custom_components.ixfield.request_scheduler import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    RequestScheduler,
+)
+
+
+class TestRequestScheduler:
+    """Test rate limiting and prioritization of API requests."""
+
+    @pytest.mark.asyncio
+    async def test_request_scheduler_prioritizes_commands(self):
+        """Test the rate limiter admits waiting commands before polls."""
+        scheduler = RequestScheduler(rate=50, burst=1)
+        await scheduler.async_acquire(PRIORITY_POLL)
+
+        order = []
+
+        async def request(name, priority):
+            await scheduler.async_acquire(priority)
+            order.append(name)
+
+        tasks = [
+            asyncio.create_task(request("poll_1", PRIORITY_POLL)),
+            asyncio.create_task(request("poll_2", PRIORITY_POLL)),
+            asyncio.create_task(request("command", PRIORITY_COMMAND)),
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.stats["waiting"] == 3
+
+        start = time.monotonic()
+        await asyncio.gather(*tasks)
+
+        assert order == ["command", "poll_1", "poll_2"]
+        # Three more tokens at 50 per second
+        assert time.monotonic() - start >= 0.05
+        assert scheduler.stats == {"waiting": 0, "delayed_requests": 3}
@@ -0,0 +1,59 @@
+"""Tests for IXField response decoder module."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.ixfield.response_decoder import (
+    JSON_DECODER_ORJSON,
+    JSON_DECODER_STDLIB,
+    ResponseTooLargeError,
+    async_read_body,
+    get_json_decoder,
+)
+
+
+def _mock_response(body, content_length=True):
+    """Create a mocked response streaming the body in small chunks."""
+
+    async def iter_chunked(size):
+        for index in range(0, len(body), 4):
+            yield body[index : index + 4]
+
+    response = Mock()
+    response.content_length = len(body) if content_length else None
+    response.content.iter_chunked = iter_chunked
+    return response
+
+
+class TestResponseDecoder:
+    """Test reading and decoding of API responses."""
+
+    def test_get_json_decoder(self):
+        """Test decoders are selected by name and unknown names are rejected."""
+        assert get_json_decoder(JSON_DECODER_STDLIB) is json.loads
+        try:
+            import orjson
+        except ImportError:
+            with pytest.raises(ValueError):
+                get_json_decoder(JSON_DECODER_ORJSON)
+        else:
+            assert get_json_decoder(JSON_DECODER_ORJSON) is orjson.loads
+            assert get_json_decoder() is orjson.loads
+        with pytest.raises(ValueError):
+            get_json_decoder("yaml")
+
+    @pytest.mark.asyncio
+    async def test_async_read_body(self):
+        """Test bodies are read whole up to the size limit."""
+        body = b'{"data": {"device": null}}'
+
+        assert await async_read_body(_mock_response(body), len(body)) == body
+
+        # Too large bodies are rejected by Content-Length or while reading
+        for content_length in (True, False):
+            with pytest.raises(ResponseTooLargeError):
+                await async_read_body(
+                    _mock_response(body, content_length), len(body) - 1
+                )
@@ -20,6 +20,7 @@ from custom_components.ixfield.entity_helper import (
     EntityCommonAttrsMixin,
     EntityValueMixin,
 )
+from .common import create_mock_coordinator
 from .test_data import SAMPLE_DEVICE_DATA, EXPECTED_SENSOR_CONFIGS
 
 
@@ -211,10 +212,7 @@ class TestSensorEnumeration:
 
     def test_get_operating_values(self):
         """Test extraction of operating values from device data."""
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         
         operating_values = get_operating_values(mock_coordinator, "test_device_id")
         
@@ -229,8 +227,7 @@ class TestSensorEnumeration:
 
     def test_get_operating_values_empty_data(self):
         """Test operating values extraction with empty data."""
-        mock_coordinator = Mock()
-        mock_coordinator.data = {}
+        mock_coordinator = create_mock_coordinator({})
         
         operating_values = get_operating_values(mock_coordinator, "nonexistent_device")
         assert operating_values == []
@@ -257,14 +254,11 @@ class TestSensorEnumeration:
         mock_config_entry.entry_id = "test_entry"
         
         # Mock coordinator
-        mock_coordinator = Mock()
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.device_ids = ["test_device_id"]
         mock_coordinator.get_device_info.return_value = SAMPLE_DEVICE_DATA["data"]["device"]
         mock_coordinator.get_device_name.return_value = "Test Pool"
         mock_coordinator.should_extract_device_info_sensors.return_value = False
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
         
         mock_hass.data = {
             "ixfield": {
@@ -295,10 +289,7 @@ class TestSensorEnumeration:
 
     def test_ixfield_sensor_entity(self):
         """Test IxfieldSensor entity creation and properties."""
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.last_update_success = True  # Mock the last_update_success property
         
         config = {
@@ -330,10 +321,7 @@ class TestSensorEnumeration:
 
     def test_ixfield_target_sensor_entity(self):
         """Test IxfieldTargetSensor entity creation and properties."""
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         mock_coordinator.last_update_success = True  # Mock the last_update_success property
         
         config = {
@@ -415,10 +403,7 @@ class TestSensorEnumeration:
         entity._device_id = "test_device_id"
         entity._sensor_name = "poolTempWithSettings"
         
-        mock_coordinator = Mock()
-        mock_coordinator.data = {
-            "test_device_id": SAMPLE_DEVICE_DATA
-        }
+        mock_coordinator = create_mock_coordinator()
         entity.coordinator = mock_coordinator
         
         # Test sensor value retrieval
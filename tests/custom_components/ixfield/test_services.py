@@ -9,6 +9,11 @@ from custom_components.ixfield.services import (
     async_setup_services,
     async_unload_services,
 )
+from custom_components.ixfield.routing import (
+    async_get_device_coordinator,
+    async_register_device_coordinator,
+    async_unregister_device_coordinator,
+)
 from .test_data import SAMPLE_DEVICE_DATA
 
 
@@ -19,20 +24,14 @@ class TestServices:
     async def test_async_setup_services(self, mock_hass, mock_coordinator):
         """Test service setup."""
         # Mock the coordinator in hass data
-        mock_hass.data = {
-            "ixfield": {
-                "test_entry": {
-                    "coordinator": mock_coordinator
-                }
-            }
-        }
-        
+        mock_hass.data = {"ixfield": {"test_entry": {"coordinator": mock_coordinator}}}
+
         # Mock service registration
         mock_hass.services = Mock()
         mock_hass.services.async_register = Mock()
-        
+
         await async_setup_services(mock_hass)
-        
+
         # Verify services were registered
         assert mock_hass.services.async_register.call_count >= 1
 
@@ -42,9 +41,9 @@ class TestServices:
         # Mock service deregistration
         mock_hass.services = Mock()
         mock_hass.services.async_remove = Mock()
-        
+
         await async_unload_services(mock_hass)
-        
+
         # Verify services were deregistered
         assert mock_hass.services.async_remove.call_count >= 1
 
@@ -53,8 +52,10 @@ class TestServices:
         """Test service error handling."""
         # Mock service registration to raise an exception
         mock_hass.services = Mock()
-        mock_hass.services.async_register = Mock(side_effect=Exception("Service registration failed"))
-        
+        mock_hass.services.async_register = Mock(
+            side_effect=Exception("Service registration failed")
+        )
+
         # Should raise an exception since the implementation doesn't handle errors
         with pytest.raises(Exception, match="Service registration failed"):
             await async_setup_services(mock_hass)
@@ -63,21 +64,111 @@ class TestServices:
     async def test_service_logging(self, mock_hass, mock_coordinator):
         """Test service logging."""
         # Mock the coordinator in hass data
-        mock_hass.data = {
-            "ixfield": {
-                "test_entry": {
-                    "coordinator": mock_coordinator
-                }
-            }
-        }
-        
+        mock_hass.data = {"ixfield": {"test_entry": {"coordinator": mock_coordinator}}}
+
         # Mock service registration
         mock_hass.services = Mock()
         mock_hass.services.async_register = Mock()
-        
+
         # The service setup doesn't log anything during setup
         # Only individual services log when called
         await async_setup_services(mock_hass)
-        
+
         # Verify services were registered
-        assert mock_hass.services.async_register.call_count >= 1 
\ No newline at end of file
+        assert mock_hass.services.async_register.call_count >= 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_control(self, mock_hass):
+        """Test bulk control selects devices across entries and reports per device."""
+
+        def create_coordinator(devices):
+            coordinator = Mock()
+            coordinator.device_ids = list(devices)
+            coordinator.data = {device_id: SAMPLE_DEVICE_DATA for device_id in devices}
+            coordinator.get_device_company.side_effect = lambda device_id: devices[
+                device_id
+            ]
+            coordinator.get_device_type.return_value = "POOL"
+            coordinator.get_device_name.side_effect = lambda device_id: device_id
+            coordinator.async_request_device_refresh = AsyncMock()
+            coordinator.api.async_set_controls = AsyncMock(
+                side_effect=lambda device_id, controls: {
+                    name: device_id != "pool_2" for name in controls
+                }
+            )
+            return coordinator
+
+        company_a = {"id": "1", "name": "Company A"}
+        company_b = {"id": "2", "name": "Company B"}
+        coordinator_1 = create_coordinator({"pool_1": company_a, "pool_2": company_a})
+        coordinator_2 = create_coordinator({"pool_3": company_a, "pool_4": company_b})
+        mock_hass.data = {
+            "ixfield": {
+                "entry_1": {"coordinator": coordinator_1},
+                "entry_2": {"coordinator": coordinator_2},
+            }
+        }
+        async_register_device_coordinator(mock_hass, coordinator_1)
+        async_register_device_coordinator(mock_hass, coordinator_2)
+        mock_hass.services = Mock()
+        await async_setup_services(mock_hass)
+        handlers = {
+            call.args[1]: call.args[2]
+            for call in mock_hass.services.async_register.call_args_list
+        }
+
+        call = Mock()
+        call.data = {"company": "company a", "controls": {"target_temperature": 28}}
+        response = await handlers["bulk_control"](call)
+
+        assert sorted(response["devices"]) == ["pool_1", "pool_2", "pool_3"]
+        assert response["succeeded"] == 2
+        assert response["failed"] == 1
+        assert response["devices"]["pool_2"]["failed_controls"] == [
+            "target_temperature: API call failed"
+        ]
+        coordinator_1.api.async_set_controls.assert_any_call(
+            "pool_1", {"poolTempWithSettings": "28"}
+        )
+        coordinator_2.async_request_device_refresh.assert_called_once_with("pool_3")
+
+        # Filters combine, and a selector is required
+        call.data = {
+            "device_ids": ["pool_1", "pool_4"],
+            "company": "2",
+            "controls": {"target_temperature": 28},
+        }
+        response = await handlers["bulk_control"](call)
+        assert list(response["devices"]) == ["pool_4"]
+
+        # Unknown devices are reported as failed
+        call.data = {
+            "device_ids": ["pool_1", "unknown"],
+            "controls": {"target_temperature": 28},
+        }
+        response = await handlers["bulk_control"](call)
+        assert sorted(response["devices"]) == ["pool_1", "unknown"]
+        assert response["devices"]["unknown"]["success"] is False
+        assert response["devices"]["unknown"]["error"] == "device not found"
+        assert response["succeeded"] == 1
+        assert response["failed"] == 1
+
+        call.data = {"controls": {"target_temperature": 28}}
+        response = await handlers["bulk_control"](call)
+        assert response == {"devices": {}, "succeeded": 0, "failed": 0}
+
+    def test_device_coordinator_routing(self, mock_hass):
+        """Test devices are routed to the coordinator of their loaded entry."""
+        coordinator_1 = Mock(device_ids=["pool_1", "pool_2"])
+        coordinator_2 = Mock(device_ids=["pool_2", "pool_3"])
+
+        async_register_device_coordinator(mock_hass, coordinator_1)
+        async_register_device_coordinator(mock_hass, coordinator_2)
+        assert async_get_device_coordinator(mock_hass, "pool_1") is coordinator_1
+        assert async_get_device_coordinator(mock_hass, "pool_2") is coordinator_2
+        assert async_get_device_coordinator(mock_hass, "unknown") is None
+
+        # Unloading the first entry keeps the device moved to the second one
+        async_unregister_device_coordinator(mock_hass, coordinator_1)
+        assert async_get_device_coordinator(mock_hass, "pool_1") is None
+        assert async_get_device_coordinator(mock_hass, "pool_2") is coordinator_2
@@ -0,0 +1,57 @@
+"""Tests for IXField shared HTTP session."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+
+from custom_components.ixfield import async_unload_entry
+from custom_components.ixfield.const import API_TIMEOUT, DOMAIN
+from custom_components.ixfield.session import async_close_session, async_get_session
+
+
+class TestSession:
+    """Test the HTTP session shared by all config entries."""
+
+    @pytest.mark.asyncio
+    async def test_shared_session(self, mock_hass):
+        """Test all users get the same tuned session until it is closed."""
+        mock_hass.bus = Mock()
+        session = async_get_session(mock_hass)
+        try:
+            assert async_get_session(mock_hass) is session
+            assert session.timeout.total == API_TIMEOUT
+            assert session.connector.limit_per_host > 0
+        finally:
+            await async_close_session(mock_hass)
+
+        assert session.closed
+        # Closing removes the listener closing the session on shutdown
+        mock_hass.bus.async_listen_once.return_value.assert_called_once()
+        assert async_get_session(mock_hass) is not session
+        await async_close_session(mock_hass)
+
+    @pytest.mark.asyncio
+    async def test_unloading_last_entry_closes_session(self, mock_hass):
+        """Test the session is closed with the last entry, despite service caches."""
+        first = Mock(entry_id="first", state=ConfigEntryState.LOADED)
+        second = Mock(entry_id="second", state=ConfigEntryState.LOADED)
+        mock_hass.config_entries = Mock()
+        mock_hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+        mock_hass.config_entries.async_entries = Mock(return_value=[first, second])
+        mock_hass.data[DOMAIN] = {
+            "first": {"coordinator": Mock(device_ids=[])},
+            "second": {"coordinator": Mock(device_ids=[])},
+            "device_status": {"device_1": {}},
+        }
+
+        with patch(
+            "custom_components.ixfield.async_close_session", new_callable=AsyncMock
+        ) as mock_close:
+            assert await async_unload_entry(mock_hass, first) is True
+            mock_close.assert_not_called()
+
+            first.state = ConfigEntryState.NOT_LOADED
+            assert await async_unload_entry(mock_hass, second) is True
+            mock_close.assert_awaited_once_with(mock_hass)
+        assert DOMAIN not in mock_hass.data